@@ -0,0 +1,135 @@
+# agents/ats_score_estimation.py
+
+from functools import partial
+from typing import Any, Dict, List, Optional, Union
+import numpy as np
+from .dictionary_keyword_extraction import AhoCorasickAutomaton, tokenize
+from .keyword_space import JobKeywordSpace, normalize_keyword, KEYWORD_SYNONYMS, SYNONYM_GROUP
+from ..models.resume import Resume
+from ..utils.process_pool import map_chunks
+
+# Sections an ATS parser looks for, and how much each contributes to the section score
+EXPECTED_SECTIONS = {"summary": 1.0, "experiences": 2.0, "skills": 2.0, "education": 1.0, "projects": 0.5,
+                     "email": 0.5, "phone": 0.5}
+
+DEFAULT_WEIGHTS = {"coverage": 0.5, "similarity": 0.2, "sections": 0.2, "density": 0.1}
+
+
+def resume_document(resume: Union[Resume, Dict[str, Any]]) -> str:
+    # Everything an ATS would parse, flattened to one text
+    fields = resume.model_dump() if isinstance(resume, Resume) else resume
+    return " ".join(_strings(fields))
+
+
+def _strings(value: Any) -> List[str]:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [text for part in value.values() for text in _strings(part)]
+    if isinstance(value, (list, tuple)):
+        return [text for part in value for text in _strings(part)]
+    return []
+
+
+def _keyword_weights(job_keywords: Union[List[str], Dict[str, List[Dict[str, Any]]]]) -> Dict[str, float]:
+    # Extraction agents score importance 1-10 or relevance 0-100; plain lists weigh every keyword equally
+    weights: Dict[str, float] = {}
+    entries = [entry for group in job_keywords.values() for entry in group] if isinstance(job_keywords, dict) \
+        else [{"keyword": keyword} for keyword in job_keywords]
+    for entry in entries:
+        keyword = normalize_keyword(entry["keyword"])
+        weight = float(entry.get("importance", entry.get("relevance", 1)) or 1)
+        weights[keyword] = max(weights.get(keyword, 0.0), weight)
+    return weights
+
+
+class ATSScoreEstimationAgent:
+    """Deterministic ATS-style score (0-100) computed locally from the resume and the job keywords.
+
+    Components, each in [0, 1]: weighted coverage of the job keywords (synonyms count, as whole phrases), TF-IDF
+    cosine similarity between the resume and the job keyword space, presence of the sections parsers expect, and
+    keyword density within ``density_band``. Many resumes against one job are scored in one pass.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None, density_band: tuple = (0.02, 0.10)):
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.density_band = density_band
+
+    def estimate_ats_score(self, resume: Union[Resume, Dict[str, Any]],
+                           job_keywords: Union[List[str], Dict[str, List[Dict[str, Any]]]] = ()) -> float:
+        return float(self.estimate_ats_scores([resume], job_keywords)[0])
+
+    def estimate_ats_scores(self, resumes: List[Union[Resume, Dict[str, Any]]],
+                            job_keywords: Union[List[str], Dict[str, List[Dict[str, Any]]]]) -> np.ndarray:
+        components = self.score_components(resumes, job_keywords)
+        total = sum(self.weights[name] * components[name] for name in DEFAULT_WEIGHTS)
+        return np.round(100 * total / sum(self.weights.values()), 2)
+
+    def score_components(self, resumes: List[Union[Resume, Dict[str, Any]]],
+                         job_keywords: Union[List[str], Dict[str, List[Dict[str, Any]]]]) -> Dict[str, np.ndarray]:
+        # Like JobKeywordSpace, keep sklearn out of import time
+        from sklearn.feature_extraction.text import CountVectorizer
+        from sklearn.preprocessing import normalize
+
+        fields = [resume.model_dump() if isinstance(resume, Resume) else resume for resume in resumes]
+        documents = [resume_document(resume) for resume in fields]
+        zeros = np.zeros(len(fields))
+        components = {"sections": self._section_presence(fields), "coverage": zeros, "similarity": zeros,
+                      "density": zeros}
+
+        keyword_weights = _keyword_weights(job_keywords)
+        keywords = list(keyword_weights)
+        if not keywords:
+            return components
+
+        # Every surface form (keyword or synonym) goes into one automaton over the extractor's tokens, which keep
+        # "c++", "c#" and single letters, so a form only counts where its tokens appear together as a phrase
+        automaton = AhoCorasickAutomaton()
+        for column, keyword in enumerate(keywords):
+            group = KEYWORD_SYNONYMS[SYNONYM_GROUP[keyword]] if keyword in SYNONYM_GROUP else {keyword}
+            for form in group:
+                automaton.add(tokenize(form), column)
+        automaton.build()
+
+        covered = np.zeros((len(documents), len(keywords)), dtype=bool)
+        occurrences = np.zeros(len(documents))
+        for row, document in enumerate(documents):
+            matches = automaton.find_all(tokenize(document))
+            for _, _, column in matches:
+                covered[row, column] = True
+            # Density counts non-overlapping occurrences, so "machine learning" is not also one "learning"
+            occurrences[row] = len(automaton.select_longest(matches))
+
+        weights = np.array([keyword_weights[keyword] for keyword in keywords])
+        components["coverage"] = covered @ weights / weights.sum()
+
+        # Keyword occurrences per word, scored 1 inside the band and falling off linearly outside it
+        density = occurrences / np.array([max(1, len(document.split())) for document in documents])
+        low, high = self.density_band
+        components["density"] = np.clip(np.where(density < low, density / low, 1 - (density - high) / high), 0, 1)
+
+        # Cosine between each resume's TF-IDF row and the normalised sum of the job's keyword rows. Keywords the
+        # TF-IDF analyzer drops entirely ("C", "R") leave the space empty and the similarity at zero
+        space = JobKeywordSpace(keywords)
+        if space.job_matrix is None:
+            return components
+        counts = CountVectorizer(vocabulary=space.vectorizer.vocabulary_).transform(documents)
+        resume_tfidf = normalize(counts.multiply(space.vectorizer.idf_))
+        job_vector = np.asarray(space.job_matrix.sum(axis=0)).ravel()
+        job_vector /= np.linalg.norm(job_vector) or 1.0
+        components["similarity"] = np.asarray(resume_tfidf @ job_vector).ravel()
+        return components
+
+    @staticmethod
+    def _section_presence(fields: List[Dict[str, Any]]) -> np.ndarray:
+        present = np.array([[1.0 if resume.get(section) else 0.0 for section in EXPECTED_SECTIONS]
+                            for resume in fields]).reshape(len(fields), len(EXPECTED_SECTIONS))
+        weights = np.array(list(EXPECTED_SECTIONS.values()))
+        return present @ weights / weights.sum()
+
+    def estimate_ats_scores_parallel(self, resumes: List[Union[Resume, Dict[str, Any]]],
+                                     job_keywords: Union[List[str], Dict[str, List[Dict[str, Any]]]],
+                                     processes: Optional[int] = None, chunk_size: int = 256) -> np.ndarray:
+        fields = [resume.model_dump() if isinstance(resume, Resume) else resume for resume in resumes]
+        return map_chunks(partial(self.estimate_ats_scores, job_keywords=job_keywords), fields, processes,
+                          chunk_size)
@@ -1,24 +1,146 @@
 # agents/base_react_agent.py
 
-from llama_index.core.agent import ReActAgent
-from llama_index.llms.openai import OpenAI
+import threading
 from llama_index.core.tools import FunctionTool
-from typing import List, Any
+from typing import List, Any, Callable, Iterable, Optional, Type
+from pydantic import BaseModel
+from ..utils.llm_cache import LLMResponseCache, make_cache_key
+from ..utils.instrumentation import span, record_llm_call
+from ..utils.llm_pool import get_client_pool
+from ..utils.structured_output import JsonLinesParser, correction_task, structured_instructions
+from ..utils.prompt_budget import PromptBudget
 
 class BaseReActAgent:
-    def __init__(self, name: str, description: str, system_prompt: str):
+    # Optional callable taking a model name and returning a llama_index LLM; lets benchmarks and tests swap in
+    # a local stand-in for the OpenAI client. Either way the client comes from the shared pool and is rate limited.
+    llm_factory: Optional[Callable[[str], Any]] = None
+
+    def __init__(self, name: str, description: str, system_prompt: str,
+                 response_cache: Optional[LLMResponseCache] = None):
         self.name = name
         self.description = description
-        self.llm = OpenAI(model="gpt-3.5-turbo")  # Change to "gpt-4" if needed
-        self.tools = self.get_tools()
-        self.agent = ReActAgent.from_tools(self.tools, llm=self.llm, verbose=True)
-        self.update_system_prompt(system_prompt)
+        self.model = "gpt-3.5-turbo"  # Change to "gpt-4" if needed
+        self.system_prompt = system_prompt
+        self.response_cache = response_cache
+        # When set, agents ask for JSON lines validated against their record models instead of free-form text
+        self.structured_output = False
+        self.max_corrections = 1
+        # Token budget for the variable parts of each prompt (keyword lists, resume and job text); None sends
+        # them unpruned
+        self.prompt_budget: Optional[PromptBudget] = PromptBudget()
+        # The LLM client, tool schemas and ReAct agents are all built on first use rather than here
+        self._llm = None
+        self._tools = None
+        self._init_lock = threading.Lock()
+        self._thread_local = threading.local()
+
+    @property
+    def llm(self):
+        if self._llm is None:
+            with self._init_lock:
+                if self._llm is None:
+                    # Looked up on the class so a plain function assigned there is not bound as a method
+                    self._llm = get_client_pool().get_llm(self.model, type(self).llm_factory)
+        return self._llm
+
+    @property
+    def tools(self) -> List[FunctionTool]:
+        if self._tools is None:
+            with self._init_lock:
+                if self._tools is None:
+                    self._tools = self.get_tools()
+        return self._tools
+
+    @property
+    def agent(self):
+        # ReActAgent holds chat memory while a call runs, so each worker thread gets its own instance
+        agent = getattr(self._thread_local, "agent", None)
+        if agent is None:
+            from llama_index.core import PromptTemplate
+            from llama_index.core.agent import ReActAgent
+            agent = ReActAgent.from_tools(self.tools, llm=self.llm, verbose=True)
+            agent.update_prompts({"agent_worker:system_prompt": PromptTemplate(self.system_prompt)})
+            self._thread_local.agent = agent
+        return agent
 
     def get_tools(self) -> List[FunctionTool]:
         return []
 
-    def execute_task(self, task: str) -> Any:
-        return self.agent.chat(task)
+    def execute_task(self, task: str, parse: Optional[Callable[[str], Any]] = None) -> Any:
+        # With parse, returns parse(response) and caches the response only once it parsed, so a malformed
+        # answer is asked for again next time instead of being replayed from the cache
+        with span("llm.execute_task", agent=self.name):
+            if self.response_cache is None:
+                result = self._chat(task)
+                return parse(result.response) if parse else result
+
+            key = make_cache_key(self.name, self.model, self.system_prompt, task)
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                record_llm_call(cache_hit=True)
+                if parse is None:
+                    from llama_index.core.chat_engine.types import AgentChatResponse
+                    return AgentChatResponse(response=cached)
+                try:
+                    return parse(cached)
+                except Exception:
+                    # Stored before answers were checked; drop it and ask again
+                    self.response_cache.delete(key)
+
+            result = self._chat(task)
+            parsed = parse(result.response) if parse else result
+            self.response_cache.set(key, result.response)
+            return parsed
+
+    def _chat(self, task: str) -> Any:
+        # Every task is self-contained; an empty history keeps earlier calls from piling up in the prompt. Calls
+        # and tokens are recorded by the client pool, per request the ReAct loop makes
+        return self.agent.chat(task, chat_history=[])
+
+    def execute_structured(self, task: str, record_model: Type[BaseModel],
+                           on_record: Optional[Callable[[BaseModel], None]] = None) -> List[BaseModel]:
+        # Records are validated as the answer streams in; only lines that fail are sent back for correction
+        with span("llm.execute_structured", agent=self.name):
+            parser = JsonLinesParser(record_model)
+            self._stream_into(f"{task}\n\n{structured_instructions(record_model)}", parser, on_record)
+            for _ in range(self.max_corrections):
+                if not parser.errors:
+                    break
+                self._stream_into(correction_task(record_model, parser.take_errors()), parser, on_record)
+            return parser.records
+
+    def _stream_into(self, task: str, parser: JsonLinesParser, on_record: Optional[Callable[[BaseModel], None]]):
+        key = make_cache_key(self.name, self.model, self.system_prompt, task) if self.response_cache else None
+        cached = self.response_cache.get(key) if key else None
+        if cached is not None:
+            record_llm_call(cache_hit=True)
+
+        errors_before = len(parser.errors)
+        # No tools are needed to produce records, so this talks to the LLM directly instead of through ReAct
+        chunks = []
+        for delta in [cached] if cached is not None else self._stream_chat(task):
+            chunks.append(delta)
+            for record in parser.feed(delta):
+                if on_record is not None:
+                    on_record(record)
+        for record in parser.close():
+            if on_record is not None:
+                on_record(record)
+
+        if cached is None:
+            response = "".join(chunks)
+            # An answer with lines that failed validation is not kept, so a later run asks again
+            if key and len(parser.errors) == errors_before:
+                self.response_cache.set(key, response)
+
+    def _stream_chat(self, task: str) -> Iterable[str]:
+        from llama_index.core.base.llms.types import ChatMessage, MessageRole
+        messages = [ChatMessage(role=MessageRole.SYSTEM, content=self.system_prompt),
+                    ChatMessage(role=MessageRole.USER, content=task)]
+        for response in self.llm.stream_chat(messages):
+            yield response.delta or ""
 
     def update_system_prompt(self, new_prompt: str):
-        self.agent.update_prompts({"agent_worker:system_prompt": new_prompt})
+        self.system_prompt = new_prompt
+        # Drop every thread's agent so they are rebuilt with the new prompt
+        self._thread_local = threading.local()
@@ -1,31 +1,71 @@
 from llama_index.core.tools import FunctionTool
-from llama_index.agent.openai import OpenAIAgent
+from typing import Any, List, Optional
+from ..models.constraints import Constraints, SectionConstraint, ExperienceConstraint
+from ..utils.token_counter import TokenCounter
 
 class ConstraintInferenceAgent:
-    def __init__(self):
-        self.agent = OpenAIAgent.from_tools(
-            tools=[],  # We'll add tools later
-            verbose=True
-        )
+    def __init__(self, chars_per_line: int = 100, model: str = "gpt-3.5-turbo"):
+        # Constraints are measured locally with the target model's tokenizer; no LLM round-trip is needed
+        self.chars_per_line = chars_per_line
+        self.token_counter = TokenCounter(model)
         self.tool = FunctionTool.from_defaults(
             fn=self.infer_constraints,
             name="infer_constraints",
             description="Infer character/token constraints from the original resume"
         )
 
-    def infer_constraints(self, resume: dict) -> dict:
-        constraints = {
-            "about_me": {"max_tokens": 0},
-            "skills": {"chars_per_line": 0},
-            "experiences": {
-                "single_line": {"max_tokens": 0},
-                "double_line": {"max_tokens": 0}
-            },
-            "projects": {
-                "single_line": {"max_tokens": 0},
-                "double_line": {"max_tokens": 0}
-            }
-        }
-        # Use self.agent to interact with OpenAI for constraint inference
-        # This is a placeholder and should be implemented with actual logic
-        return constraints
\ No newline at end of file
+    def infer_constraints(self, resume: dict) -> Constraints:
+        skills_line = ", ".join(skill["name"] for skill in resume.get("skills") or [])
+        experience_bullets = [bullet for experience in resume.get("experiences") or []
+                              for bullet in experience.get("description") or []]
+        project_bullets = [project["description"] for project in resume.get("projects") or []]
+
+        return Constraints(
+            about_me=SectionConstraint(max_tokens=self.token_counter.count(resume.get("summary") or "")),
+            skills=SectionConstraint(max_tokens=self.token_counter.count(skills_line)),
+            experiences=self._line_constraints(experience_bullets),
+            projects=self._line_constraints(project_bullets)
+        )
+
+    def _line_constraints(self, bullets: List[str]) -> ExperienceConstraint:
+        # A bullet that fits within chars_per_line renders on one line; anything longer wraps onto two
+        single = [self.token_counter.count(bullet) for bullet in bullets if len(bullet) <= self.chars_per_line]
+        double = [self.token_counter.count(bullet) for bullet in bullets if len(bullet) > self.chars_per_line]
+
+        # A full line holds about chars_per_line characters at this resume's own characters-per-token ratio
+        tokens_per_line = self._tokens_per_line(bullets)
+        single_line = max(single + [tokens_per_line])
+        double_line = max(double + [2 * tokens_per_line])
+        return ExperienceConstraint(
+            single_line=SectionConstraint(max_tokens=single_line),
+            double_line=SectionConstraint(max_tokens=max(double_line, single_line))
+        )
+
+    def _tokens_per_line(self, bullets: List[str]) -> int:
+        text = " ".join(bullets)
+        if not text:
+            return self.token_counter.count("x " * (self.chars_per_line // 2))
+        chars_per_token = len(text) / max(1, self.token_counter.count(text))
+        return max(1, round(self.chars_per_line / chars_per_token))
+
+    def fits(self, text: str, constraint: SectionConstraint) -> bool:
+        return self.token_counter.fits(text, constraint.max_tokens)
+
+    def fit_bullet(self, bullet: str, constraint: ExperienceConstraint) -> str:
+        # Bullets may use one line or two; only trim once they overflow the two-line budget
+        if self.token_counter.fits(bullet, constraint.double_line.max_tokens):
+            return bullet
+        return self.token_counter.truncate(bullet, constraint.double_line.max_tokens)
+
+    def enforce(self, section: Optional[str], item: Any, constraints: Constraints) -> Any:
+        # Validate tailored output against the inferred budgets and trim locally instead of re-asking the LLM
+        if section == "summary" and isinstance(item, str):
+            if self.fits(item, constraints.about_me):
+                return item
+            return self.token_counter.truncate(item, constraints.about_me.max_tokens)
+        if section == "experiences" and isinstance(item, dict) and isinstance(item.get("description"), list):
+            return {**item, "description": [self.fit_bullet(bullet, constraints.experiences)
+                                            for bullet in item["description"]]}
+        if section == "projects" and isinstance(item, dict) and isinstance(item.get("description"), str):
+            return {**item, "description": self.fit_bullet(item["description"], constraints.projects)}
+        return item
@@ -0,0 +1,275 @@
+# agents/dictionary_keyword_extraction.py
+
+import json
+import re
+from collections import Counter, deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+# Tokens keep the punctuation that is part of skill names: "c++", "c#", "node.js", "ci/cd"
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:[./][a-z0-9+#]+)*")
+_TEXT_TOKEN_PATTERN = re.compile(TOKEN_PATTERN.pattern, re.IGNORECASE)
+
+# Skill names that are also everyday words or letters only count when written exactly like this, as a word of
+# their own: "Go" but not "go" or "Go-to-market", "R" but not "R&D", "REST" but not "took a rest". Bare "Spring"
+# is left out of the dictionary altogether, since "Spring 2021" is far more common in a resume than the framework
+CASE_SENSITIVE_PHRASES = {"Go", "C", "R", "REST", "Lambda"}
+# Verbs that are capitalised anyway when they open a sentence: "Go live" is not the language, "Go, Python" is
+SENTENCE_VERBS = {"Go"}
+# What may come right before a word that opens a sentence or a bullet
+_SENTENCE_START = re.compile(r"(?:^|[.!?:;\n])\s*(?:[-*\u2022]\s*)?$")
+# A capital letter after these names a round, grade or type rather than a language ("Series C", "Type R")
+LETTER_CONTEXT_WORDS = {"series", "plan", "type", "grade", "class", "tier", "round", "section", "part", "vitamin"}
+
+# {category: {canonical keyword: [aliases]}}
+DEFAULT_SKILLS_DICTIONARY: Dict[str, Dict[str, List[str]]] = {
+    "Programming Languages": {
+        "Python": ["python3"],
+        "Java": [],
+        "JavaScript": ["js", "ecmascript"],
+        "TypeScript": [],
+        "Go": ["golang"],
+        "Rust": [],
+        "C": [],
+        "C++": ["cpp"],
+        "C#": ["csharp"],
+        "Ruby": [],
+        "PHP": [],
+        "Kotlin": [],
+        "Swift": [],
+        "Scala": [],
+        "R": [],
+        "SQL": [],
+        "Bash": ["shell scripting"],
+    },
+    "Frameworks & Libraries": {
+        "React": ["react.js", "reactjs"],
+        "Angular": ["angularjs"],
+        "Vue": ["vue.js", "vuejs"],
+        "Node.js": ["nodejs"],
+        "Django": [],
+        "Flask": [],
+        "FastAPI": [],
+        "Spring Boot": [],
+        "Ruby on Rails": ["rails"],
+        ".NET": ["dotnet"],
+        "TensorFlow": [],
+        "PyTorch": [],
+        "scikit-learn": ["sklearn"],
+        "Pandas": [],
+        "NumPy": [],
+        "Spark": ["apache spark", "pyspark"],
+        "Kafka": ["apache kafka"],
+        "GraphQL": [],
+    },
+    "Cloud & DevOps": {
+        "AWS": ["amazon web services"],
+        "GCP": ["google cloud", "google cloud platform"],
+        "Azure": ["microsoft azure"],
+        "Docker": [],
+        "Kubernetes": ["k8s"],
+        "Terraform": [],
+        "Ansible": [],
+        "CI/CD": ["cicd", "ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+        "Jenkins": [],
+        "GitHub Actions": [],
+        "Git": [],
+        "Linux": [],
+        "Microservices": ["microservice architecture"],
+        "Serverless": ["aws lambda", "Lambda"],
+        "Infrastructure as Code": ["iac"],
+        "Monitoring": ["observability", "prometheus", "grafana", "datadog"],
+    },
+    "Data & Machine Learning": {
+        "Machine Learning": ["ml"],
+        "Deep Learning": [],
+        "Artificial Intelligence": ["ai"],
+        "Natural Language Processing": ["nlp"],
+        "Computer Vision": [],
+        "Large Language Models": ["llm", "llms"],
+        "Data Analysis": ["data analytics"],
+        "Data Engineering": ["etl", "data pipelines"],
+        "Data Visualization": ["tableau", "power bi"],
+        "Statistics": ["statistical analysis"],
+        "A/B Testing": ["ab testing", "experimentation"],
+    },
+    "Databases": {
+        "PostgreSQL": ["postgres"],
+        "MySQL": [],
+        "MongoDB": ["mongo"],
+        "Redis": [],
+        "Elasticsearch": [],
+        "DynamoDB": [],
+        "Snowflake": [],
+        "BigQuery": [],
+        "NoSQL": [],
+    },
+    "Practices & Methodologies": {
+        "Agile": ["scrum", "kanban"],
+        "Test-Driven Development": ["tdd"],
+        "Unit Testing": ["automated testing"],
+        "REST APIs": ["REST", "restful", "rest api", "restful apis"],
+        "System Design": ["distributed systems"],
+        "Object-Oriented Programming": ["oop", "object oriented programming"],
+        "Code Review": ["code reviews"],
+        "Performance Optimization": ["performance tuning"],
+        "Security": ["application security", "cybersecurity"],
+    },
+    "Soft Skills": {
+        "Leadership": ["team leadership", "team lead"],
+        "Communication": ["communication skills"],
+        "Collaboration": ["cross-functional", "teamwork"],
+        "Mentoring": ["mentored", "mentorship"],
+        "Problem Solving": ["problem-solving"],
+        "Project Management": ["project manager"],
+        "Stakeholder Management": ["stakeholders"],
+    },
+}
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class AhoCorasickAutomaton:
+    """Multi-pattern matcher over token sequences; one pass over the text finds every pattern occurrence."""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[int, Any]]] = [[]]
+        self._built = False
+
+    def add(self, tokens: Iterable[str], value: Any):
+        tokens = list(tokens)
+        if not tokens:
+            return
+        node = 0
+        for token in tokens:
+            next_node = self._goto[node].get(token)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][token] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            node = next_node
+        self._outputs[node].append((len(tokens), value))
+        self._built = False
+
+    def build(self):
+        # Breadth-first so every node's failure link points at an already-finished shallower node
+        queue = deque(self._goto[0].values())
+        for node in queue:
+            self._fail[node] = 0
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(token, 0)
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+                queue.append(child)
+        self._built = True
+
+    def find_all(self, tokens: List[str]) -> List[Tuple[int, int, Any]]:
+        if not self._built:
+            self.build()
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        matches = []
+        node = 0
+        for position, token in enumerate(tokens):
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            for length, value in outputs[node]:
+                matches.append((position - length + 1, position + 1, value))
+        return matches
+
+    def find_longest(self, tokens: List[str],
+                     accept: Optional[Callable[[int, int, Any], bool]] = None) -> List[Tuple[int, int, Any]]:
+        # Leftmost-longest, non-overlapping: "machine learning" wins over "learning" inside it. Matches that
+        # accept rejects are dropped first, so they do not hide a shorter match
+        matches = self.find_all(tokens)
+        if accept is not None:
+            matches = [match for match in matches if accept(*match)]
+        return self.select_longest(matches)
+
+    @staticmethod
+    def select_longest(matches: List[Tuple[int, int, Any]]) -> List[Tuple[int, int, Any]]:
+        selected = []
+        covered_until = 0
+        for start, end, value in sorted(matches, key=lambda match: (match[0], -match[1])):
+            if start >= covered_until:
+                selected.append((start, end, value))
+                covered_until = end
+        return selected
+
+
+class DictionaryKeywordExtractor:
+    def __init__(self, dictionary: Optional[Dict[str, Union[Dict[str, List[str]], List[str]]]] = None,
+                 dictionary_path: Optional[str] = None):
+        if dictionary_path:
+            with open(dictionary_path, encoding="utf-8") as dictionary_file:
+                dictionary = json.load(dictionary_file)
+        self.dictionary = dictionary if dictionary is not None else DEFAULT_SKILLS_DICTIONARY
+
+        # Compile every canonical term and alias once; extraction is then a single pass per text
+        self.automaton = AhoCorasickAutomaton()
+        for category, terms in self.dictionary.items():
+            if isinstance(terms, list):
+                terms = {term: [] for term in terms}
+            for canonical, aliases in terms.items():
+                for phrase in [canonical, *aliases]:
+                    exact = phrase if phrase in CASE_SENSITIVE_PHRASES else None
+                    self.automaton.add(tokenize(phrase), (category, canonical, exact))
+        self.automaton.build()
+
+    def extract_keywords(self, text: Union[str, Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        # Fields go on lines of their own, so each field's first word counts as the start of a sentence
+        if not isinstance(text, str):
+            text = "\n".join(_iter_strings(text))
+        counts = self._match(text)
+        if not counts:
+            return {}
+
+        # Relevance mirrors the LLM extractor's 0-100 scale, relative to the most frequent term in the text
+        top_count = max(counts.values())
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        for (category, keyword), count in counts.most_common():
+            result.setdefault(category, []).append({"keyword": keyword, "relevance": round(100 * count / top_count)})
+        return result
+
+    def _match(self, text: str) -> Counter:
+        spans = list(_TEXT_TOKEN_PATTERN.finditer(text))
+
+        def accept(start: int, end: int, value: Tuple[str, str, Optional[str]]) -> bool:
+            exact = value[2]
+            if exact is None:
+                return True
+            first, last = spans[start], spans[end - 1]
+            if text[first.start():last.end()] != exact:
+                return False
+            # Joined to a neighbour ("R&D", "go-to-market", "C-suite") it is part of another word
+            if text[first.start() - 1:first.start()] in ("&", "-") or text[last.end():last.end() + 1] in ("&", "-"):
+                return False
+            # "Go live" opening a sentence is the verb; a lowercase word following on the same line gives it away
+            if exact in SENTENCE_VERBS and end < len(spans) and spans[end].group(0)[0].islower() and \
+                    text[last.end():spans[end].start()] in (" ", "\t") and \
+                    _SENTENCE_START.search(text, max(0, first.start() - 16), first.start()):
+                return False
+            return not (len(exact) == 1 and start > 0 and spans[start - 1].group(0).lower() in LETTER_CONTEXT_WORDS)
+
+        matches = self.automaton.find_longest([span.group(0).lower() for span in spans], accept)
+        return Counter((category, keyword) for _, _, (category, keyword, _) in matches)
+
+
+def _iter_strings(value: Any) -> Iterable[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_strings(item)
@@ -0,0 +1,58 @@
+# agents/human_readability.py
+
+import re
+from typing import Dict, List, Optional
+import numpy as np
+from ..utils.process_pool import map_chunks
+
+# Resume prose is mostly bullet lines without terminal punctuation, so a line break also ends a sentence
+SENTENCE_END = re.compile(r"[.!?]+(?=\s|$)|\n+")
+WORD = re.compile(r"[A-Za-z]+(?:['-][A-Za-z]+)*")
+VOWEL_GROUP = re.compile(r"[aeiouy]+")
+# A trailing "e" after a consonant is usually silent ("manage", "code"), except in "-le" endings ("scalable").
+# The match starts at the word's previous vowel, so "the" or "be" keep their only syllable
+SILENT_E = re.compile(r"[aeiouy][b-df-hj-np-tv-xz]*[b-df-hj-km-np-tv-xz]e\b")
+NO_VOWEL_WORD = re.compile(r"\b[b-df-hj-np-tv-xz]+\b")
+
+
+def text_statistics(texts: List[str]) -> Dict[str, np.ndarray]:
+    # Counts come from whole-text regex scans, so the per-text Python work is a handful of C-level passes
+    sentences = np.array([len(SENTENCE_END.findall(text.strip())) or 1 for text in texts], dtype=float)
+    words = np.array([len(WORD.findall(text)) for text in texts], dtype=float)
+    # The syllable patterns are lowercase-only, which is cheaper than matching case-insensitively
+    lowered = [text.lower() for text in texts]
+    syllables = np.array([len(VOWEL_GROUP.findall(text)) - len(SILENT_E.findall(text))
+                          + len(NO_VOWEL_WORD.findall(text)) for text in lowered], dtype=float)
+    # Each word has at least one syllable: vowel groups never drop below one per word, and words without a
+    # vowel are counted once
+    return {"sentences": sentences, "words": words, "syllables": syllables}
+
+
+class HumanReadabilityAgent:
+    """Flesch reading ease and Flesch-Kincaid grade computed locally from sentence, word and syllable counts.
+
+    ``check_readability`` returns the reading ease clipped to 0-100; higher reads easier.
+    """
+
+    def check_readability(self, text: str) -> float:
+        return float(self.check_readability_many([text])[0])
+
+    def check_readability_many(self, texts: List[str]) -> np.ndarray:
+        return self.scores(texts)["reading_ease"]
+
+    def scores(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        stats = text_statistics(texts)
+        words = np.maximum(stats["words"], 1)
+        words_per_sentence = words / stats["sentences"]
+        syllables_per_word = stats["syllables"] / words
+        reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+        grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+        empty = stats["words"] == 0
+        return {"reading_ease": np.where(empty, 0.0, np.round(np.clip(reading_ease, 0, 100), 2)),
+                "grade": np.where(empty, 0.0, np.round(np.maximum(grade, 0), 2)),
+                "words_per_sentence": np.where(empty, 0.0, words_per_sentence),
+                "syllables_per_word": np.where(empty, 0.0, syllables_per_word)}
+
+    def check_readability_parallel(self, texts: List[str], processes: Optional[int] = None,
+                                   chunk_size: int = 1024) -> np.ndarray:
+        return map_chunks(self.check_readability_many, texts, processes, chunk_size)
@@ -3,6 +3,7 @@
 from .base_react_agent import BaseReActAgent
 from llama_index.core.tools import FunctionTool
 from typing import List, Dict
+from ..models.agent_outputs import KeywordRecord
 
 class JobDescriptionKeywordExtractionAgent(BaseReActAgent):
     def __init__(self):
@@ -25,8 +26,15 @@ class JobDescriptionKeywordExtractionAgent(BaseReActAgent):
 
     def extract_keywords(self, job_description: str) -> Dict[str, List[Dict[str, any]]]:
         task = f"Analyze this job description and extract the key skills, qualifications, and requirements: {job_description}"
-        result = self.execute_task(task)
-        return self.parse_result(result.response)
+        if self.structured_output:
+            return self.group_records(self.execute_structured(task, KeywordRecord))
+        return self.execute_task(task, self.parse_result)
+
+    def group_records(self, records: List[KeywordRecord]) -> Dict[str, List[Dict[str, any]]]:
+        grouped = {}
+        for record in records:
+            grouped.setdefault(record.category, []).append({"keyword": record.keyword, "importance": record.score})
+        return grouped
 
     def parse_result(self, result: str) -> Dict[str, List[Dict[str, any]]]:
         lines = result.strip().split('\n')
@@ -0,0 +1,274 @@
+# agents/job_index.py
+
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Union
+import numpy as np
+from .keyword_space import KEYWORD_SYNONYMS, SYNONYM_GROUP, flatten_keywords, normalize_keyword
+from ..models.job_description import JobDescription
+from ..models.resume import Resume
+
+FORMAT_VERSION = 1
+
+# The parts of a posting (and of a resume) that say what the work is; contact details and benefits do not
+JOB_FIELDS = {"title", "requirements", "responsibilities", "preferred_qualifications"}
+RESUME_FIELDS = {"summary", "skills", "experiences", "projects"}
+
+# Synonym groups collapse onto one term, so "k8s" in a resume matches "Kubernetes" in a posting
+_CANONICAL = {term: sorted(KEYWORD_SYNONYMS[group])[0] for term, group in SYNONYM_GROUP.items()}
+
+
+def keyword_term(keyword: str) -> str:
+    term = normalize_keyword(keyword)
+    return _CANONICAL.get(term, term)
+
+
+def _reserve(array: np.ndarray, size: int) -> np.ndarray:
+    # Grow by doubling so adding postings one at a time stays amortised O(1)
+    if len(array) >= size:
+        return array
+    grown = np.zeros(max(size, 2 * len(array)), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class JobIndex:
+    """Inverted index over job postings' keywords, answering "which postings fit this resume best".
+
+    Postings are scored by cosine similarity of binary TF-IDF keyword vectors. The compacted part of the index
+    is a pair of CSR-style integer arrays (term -> postings and posting -> terms) that can be saved and
+    memory-mapped back. Added postings wait in a small pending segment that is scored directly and folded into
+    the arrays once it reaches ``compact_threshold``; removals are tombstones until the next compaction.
+    """
+
+    def __init__(self, extractor: Any = None, compact_threshold: int = 1024):
+        # Any extractor returning {category: [{"keyword": ...}]}; defaults to the offline skills dictionary
+        self._extractor = extractor
+        self.compact_threshold = compact_threshold
+        self.vocabulary: Dict[str, int] = {}
+        self.terms: List[str] = []
+        self.job_ids: List[str] = []
+        self.metadata: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+        # Default ids count up across compactions and save/load, so a generated id is never handed out twice
+        self._next_id = 0
+        self._alive = np.zeros(0, dtype=bool)
+        self._df = np.zeros(0, dtype=np.int64)
+        # Compacted segment: postings 0..n_compacted-1
+        self._term_indptr = np.zeros(1, dtype=np.int64)
+        self._term_postings = np.zeros(0, dtype=np.int32)
+        self._posting_indptr = np.zeros(1, dtype=np.int64)
+        self._posting_terms = np.zeros(0, dtype=np.int32)
+        # Pending segment: term arrays of postings added since the last compaction
+        self._pending: List[np.ndarray] = []
+        self._norm_cache = None
+        self._lock = threading.RLock()
+
+    @property
+    def extractor(self):
+        if self._extractor is None:
+            from .dictionary_keyword_extraction import DictionaryKeywordExtractor
+            self._extractor = DictionaryKeywordExtractor()
+        return self._extractor
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._positions
+
+    @property
+    def _n_compacted(self) -> int:
+        return len(self._posting_indptr) - 1
+
+    def _extract(self, source: Any, fields: set) -> List[str]:
+        if isinstance(source, (JobDescription, Resume)):
+            source = source.model_dump(include=fields)
+        return flatten_keywords(self.extractor.extract_keywords(source))
+
+    def _term_ids(self, keywords: Iterable[str], grow: bool) -> np.ndarray:
+        ids = set()
+        for keyword in keywords:
+            term = keyword_term(keyword)
+            if term not in self.vocabulary:
+                if not grow:
+                    continue
+                self.vocabulary[term] = len(self.terms)
+                self.terms.append(term)
+            ids.add(self.vocabulary[term])
+        return np.array(sorted(ids), dtype=np.int32)
+
+    def add(self, job: Union[JobDescription, Dict[str, Any]], job_id: Optional[str] = None,
+            keywords: Optional[Union[List[str], Dict[str, List[Dict[str, Any]]]]] = None) -> str:
+        # Pass keywords to index an LLM extraction (e.g. prepare_job's job_keywords) instead of the dictionary's
+        if keywords is None:
+            keywords = self._extract(job, JOB_FIELDS)
+        job_fields = job.model_dump() if isinstance(job, JobDescription) else job
+        with self._lock:
+            if job_id is None:
+                while str(self._next_id) in self._positions:
+                    self._next_id += 1
+                job_id = self._next_id
+                self._next_id += 1
+            job_id = str(job_id)
+            if job_id in self._positions:
+                self.remove(job_id)
+            terms = self._term_ids(flatten_keywords(keywords), grow=True)
+
+            self._positions[job_id] = len(self.job_ids)
+            self.job_ids.append(job_id)
+            self.metadata.append({"title": job_fields.get("title"), "company": job_fields.get("company")})
+            self._alive = _reserve(self._alive, len(self.job_ids))
+            self._alive[len(self.job_ids) - 1] = True
+            self._df = _reserve(self._df, len(self.terms))
+            self._df[terms] += 1
+            self._pending.append(terms)
+            self._norm_cache = None
+            if len(self._pending) >= self.compact_threshold:
+                self.compact()
+        return job_id
+
+    def add_many(self, jobs: Iterable[Union[JobDescription, Dict[str, Any]]],
+                 keywords: Optional[Iterable[Union[List[str], Dict[str, List[Dict[str, Any]]]]]] = None) -> List[str]:
+        # Bulk ingestion compacts once at the end instead of every compact_threshold postings
+        jobs = list(jobs)
+        keywords = list(keywords) if keywords is not None else [None] * len(jobs)
+        with self._lock:
+            threshold, self.compact_threshold = self.compact_threshold, float("inf")
+            try:
+                job_ids = [self.add(job, keywords=job_keywords) for job, job_keywords in zip(jobs, keywords)]
+            finally:
+                self.compact_threshold = threshold
+            self.compact()
+        return job_ids
+
+    def remove(self, job_id: str):
+        with self._lock:
+            position = self._positions.pop(str(job_id))
+            self._alive[position] = False
+            self._df[self._posting_term_ids(position)] -= 1
+            self._norm_cache = None
+
+    def _posting_term_ids(self, position: int) -> np.ndarray:
+        if position >= self._n_compacted:
+            return self._pending[position - self._n_compacted]
+        return self._posting_terms[self._posting_indptr[position]:self._posting_indptr[position + 1]]
+
+    def compact(self):
+        # Fold pending postings in and drop removed ones, rebuilding both CSR layouts in a few array passes
+        with self._lock:
+            alive = self._alive[:len(self.job_ids)]
+            keep = np.flatnonzero(alive)
+            compacted_alive = alive[:self._n_compacted]
+            compacted_lengths = np.diff(self._posting_indptr)
+            owners = np.repeat(np.arange(self._n_compacted), compacted_lengths)
+            pending = [terms for terms, kept in zip(self._pending, alive[self._n_compacted:]) if kept]
+
+            posting_terms = np.concatenate([np.asarray(self._posting_terms)[compacted_alive[owners]], *pending])
+            posting_terms = posting_terms.astype(np.int32)
+            lengths = np.concatenate([compacted_lengths[compacted_alive], [len(terms) for terms in pending]])
+            lengths = lengths.astype(np.int64)
+            posting_indptr = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+            owners = np.repeat(np.arange(len(keep), dtype=np.int32), lengths)
+            # A stable sort by term keeps each term's postings in ascending order
+            order = np.argsort(posting_terms, kind="stable")
+            term_counts = np.bincount(posting_terms, minlength=len(self.terms))
+
+            self._posting_terms, self._posting_indptr = posting_terms, posting_indptr
+            self._term_postings = owners[order]
+            self._term_indptr = np.concatenate([[0], np.cumsum(term_counts)]).astype(np.int64)
+            self.job_ids = [self.job_ids[p] for p in keep]
+            self.metadata = [self.metadata[p] for p in keep]
+            self._positions = {job_id: position for position, job_id in enumerate(self.job_ids)}
+            self._alive = np.ones(len(keep), dtype=bool)
+            self._df = term_counts.astype(np.int64)
+            self._pending = []
+            self._norm_cache = None
+
+    def _idf(self) -> np.ndarray:
+        # Same smoothing as sklearn's TfidfVectorizer, so scores are comparable with JobKeywordSpace
+        return np.log((1 + len(self)) / (1 + self._df[:len(self.terms)])) + 1
+
+    def _norms(self, idf: np.ndarray) -> np.ndarray:
+        if self._norm_cache is None:
+            squared = idf ** 2
+            owners = np.repeat(np.arange(self._n_compacted), np.diff(self._posting_indptr))
+            norms = np.bincount(owners, weights=squared[self._posting_terms], minlength=self._n_compacted)
+            pending = [squared[terms].sum() for terms in self._pending]
+            self._norm_cache = np.sqrt(np.concatenate([norms, pending]))
+        return self._norm_cache
+
+    def query(self, resume: Union[Resume, Dict[str, Any]], top_k: int = 20,
+              keywords: Optional[Union[List[str], Dict[str, List[Dict[str, Any]]]]] = None) -> List[Dict[str, Any]]:
+        if keywords is None:
+            keywords = self._extract(resume, RESUME_FIELDS)
+        keywords = flatten_keywords(keywords)
+        with self._lock:
+            if not len(self) or not keywords:
+                return []
+            idf = self._idf()
+            norms = self._norms(idf)
+            query_terms = self._term_ids(keywords, grow=False)
+            # Keywords no posting uses still count towards the resume's own norm, at the rarest-term idf
+            unknown = len({keyword_term(keyword) for keyword in keywords}) - len(query_terms)
+            query_norm = np.sqrt((idf[query_terms] ** 2).sum() + unknown * (np.log(1 + len(self)) + 1) ** 2)
+
+            # Only the postings lists of the resume's own terms are touched
+            scores = np.zeros(len(self.job_ids))
+            compacted_terms = query_terms[query_terms < len(self._term_indptr) - 1]
+            if len(compacted_terms):
+                starts, ends = self._term_indptr[compacted_terms], self._term_indptr[compacted_terms + 1]
+                postings = np.concatenate([self._term_postings[s:e] for s, e in zip(starts, ends)])
+                weights = np.repeat(idf[compacted_terms] ** 2, ends - starts)
+                scores[:self._n_compacted] = np.bincount(postings, weights=weights, minlength=self._n_compacted)
+            query_set = set(query_terms.tolist())
+            for offset, terms in enumerate(self._pending):
+                shared = [term for term in terms.tolist() if term in query_set]
+                scores[self._n_compacted + offset] = (idf[shared] ** 2).sum()
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores = np.where(self._alive[:len(self.job_ids)] & (norms > 0), scores / (norms * query_norm), 0.0)
+            candidates = np.flatnonzero(scores > 0)
+            if top_k < len(candidates):
+                candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+            return [{
+                "job_id": self.job_ids[position],
+                **self.metadata[position],
+                "score": float(scores[position]),
+                "matched_keywords": [self.terms[term] for term in self._posting_term_ids(position).tolist()
+                                     if term in query_set],
+            } for position in candidates]
+
+    def save(self, path: str):
+        with self._lock:
+            self.compact()
+            os.makedirs(path, exist_ok=True)
+            for name in ("term_indptr", "term_postings", "posting_indptr", "posting_terms"):
+                np.save(os.path.join(path, f"{name}.npy"), getattr(self, f"_{name}"))
+            with open(os.path.join(path, "index.json"), "w", encoding="utf-8") as meta_file:
+                json.dump({"version": FORMAT_VERSION, "terms": self.terms, "job_ids": self.job_ids,
+                           "metadata": self.metadata, "next_id": self._next_id}, meta_file, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True, **kwargs) -> "JobIndex":
+        # With mmap the postings arrays stay on disk and are paged in as queries touch them
+        with open(os.path.join(path, "index.json"), encoding="utf-8") as meta_file:
+            meta = json.load(meta_file)
+        if meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported job index format version: {meta.get('version')}")
+
+        index = cls(**kwargs)
+        for name in ("term_indptr", "term_postings", "posting_indptr", "posting_terms"):
+            setattr(index, f"_{name}", np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r" if mmap else None))
+        index.terms = meta["terms"]
+        index.vocabulary = {term: term_id for term_id, term in enumerate(index.terms)}
+        index.job_ids = meta["job_ids"]
+        index.metadata = meta["metadata"]
+        index._positions = {job_id: position for position, job_id in enumerate(index.job_ids)}
+        index._next_id = meta.get("next_id", len(index.job_ids))
+        index._alive = np.ones(len(index.job_ids), dtype=bool)
+        index._df = np.diff(index._term_indptr).astype(np.int64)
+        return index
@@ -2,13 +2,25 @@
 
 from .base_react_agent import BaseReActAgent
 from llama_index.core.tools import FunctionTool
-from typing import List, Dict
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import threading
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
+from .keyword_space import JobKeywordSpace, flatten_keywords, normalize_keyword, SYNONYM_GROUP
+from ..utils.instrumentation import span
+from ..models.agent_outputs import RankingRecord
+from ..utils.prompt_budget import PromptCall
 
 
 class KeywordSimilarityRankingAgent(BaseReActAgent):
-    def __init__(self):
+    def __init__(self, tiered: bool = True, high_confidence: float = 0.8, low_confidence: float = 0.0):
+        # With tiered ranking, keywords whose best lexical match is >= high_confidence (or that match through
+        # KEYWORD_SYNONYMS) and keywords at or below low_confidence are settled locally; only the band in
+        # between is sent to the LLM.
+        self.tiered = tiered
+        self.high_confidence = high_confidence
+        self.low_confidence = low_confidence
+        self.tier_counts = Counter()
+        self._tier_lock = threading.Lock()
         system_prompt = """
         You are an expert in analyzing and ranking keyword similarities between job descriptions and resumes. 
         Your task is to compare keywords from a resume with those from a job description, determining their 
@@ -28,34 +40,127 @@ class KeywordSimilarityRankingAgent(BaseReActAgent):
                          "Rank resume keywords based on similarity to job description keywords", system_prompt)
 
     def get_tools(self) -> List[FunctionTool]:
+        # The tool exposes only the keyword lists; the precomputed-ranking arguments are for in-process callers
+        def rank_keywords(resume_keywords: List[str], job_keywords: List[str]) -> List[Dict[str, any]]:
+            return self.rank_keywords(resume_keywords, job_keywords)
+
         return [
             FunctionTool.from_defaults(
-                fn=self.rank_keywords,
+                fn=rank_keywords,
                 name="rank_keywords",
                 description="Rank resume keywords based on similarity to job description keywords"
             )
         ]
 
-    def rank_keywords(self, resume_keywords: List[str], job_keywords: List[str]) -> List[Dict[str, any]]:
-        # First, use TF-IDF and cosine similarity for initial ranking
-        tfidf = TfidfVectorizer()
-        all_keywords = resume_keywords + job_keywords
-        tfidf_matrix = tfidf.fit_transform(all_keywords)
-
-        resume_vectors = tfidf_matrix[:len(resume_keywords)]
-        job_vectors = tfidf_matrix[len(resume_keywords):]
-
-        similarities = cosine_similarity(resume_vectors, job_vectors)
-
-        # Create initial ranking based on TF-IDF similarity
-        initial_ranking = [
-            {"keyword": kw, "similarity": similarities[i].mean()}
-            for i, kw in enumerate(resume_keywords)
-        ]
-        initial_ranking.sort(key=lambda x: x["similarity"], reverse=True)
+    def rank_keywords(self, resume_keywords: List[str], job_keywords: List[str],
+                      keyword_space: Optional[JobKeywordSpace] = None,
+                      initial_ranking: Optional[List[Dict[str, any]]] = None) -> List[Dict[str, any]]:
+        resume_keywords = flatten_keywords(resume_keywords)
+        job_keywords = flatten_keywords(job_keywords)
+
+        # First, use TF-IDF and cosine similarity for initial ranking. Callers scoring many items against
+        # the same job pass a prebuilt keyword space and/or the batched ranking for this item.
+        with span("rank_keywords.tfidf", keywords=len(resume_keywords)):
+            if initial_ranking is None:
+                if keyword_space is None:
+                    keyword_space = JobKeywordSpace(job_keywords)
+                initial_ranking = keyword_space.rank([resume_keywords])[0]
+
+        if not self.tiered:
+            with span("rank_keywords.llm", keywords=len(initial_ranking)):
+                refined = self.refine_ranking(resume_keywords, job_keywords, initial_ranking)
+            # Keywords the prompt budget pruned keep their lexical score
+            return self._fill_unanswered(refined, initial_ranking)
+
+        with span("rank_keywords.local_tiers"):
+            finalized, ambiguous = self.resolve_locally(initial_ranking, job_keywords)
+        with span("rank_keywords.llm", keywords=len(ambiguous)):
+            refined = self.refine_ranking(resume_keywords, job_keywords, ambiguous) if ambiguous else []
+
+        # Keep the lexical score for any ambiguous keyword the model left out of its answer
+        return self._fill_unanswered(finalized + refined, ambiguous)
+
+    @staticmethod
+    def _fill_unanswered(ranking: List[Dict[str, any]], expected: List[Dict[str, any]]) -> List[Dict[str, any]]:
+        answered = {entry.get("keyword") for entry in ranking}
+        ranking.extend({"keyword": entry["keyword"], "similarity": entry["similarity"], "explanation": "",
+                        "suggestions": [], "tier": "tfidf"}
+                       for entry in expected if entry["keyword"] not in answered)
+        ranking.sort(key=lambda x: x.get("similarity", 0.0), reverse=True)
+        return ranking
+
+    def resolve_locally(self, initial_ranking: List[Dict[str, any]],
+                        job_keywords: List[str]) -> Tuple[List[Dict[str, any]], List[Dict[str, any]]]:
+        job_terms = {normalize_keyword(keyword): keyword for keyword in job_keywords}
+        job_groups = {}
+        for term, keyword in job_terms.items():
+            if term in SYNONYM_GROUP:
+                job_groups.setdefault(SYNONYM_GROUP[term], keyword)
+
+        finalized, ambiguous = [], []
+        for entry in initial_ranking:
+            term = normalize_keyword(entry["keyword"])
+            best_match = entry.get("best_match", entry["similarity"])
+            if term in job_terms:
+                tier, similarity, explanation = "exact", 1.0, f"Exact match for '{job_terms[term]}'"
+            elif SYNONYM_GROUP.get(term) in job_groups:
+                matched = job_groups[SYNONYM_GROUP[term]]
+                tier, similarity, explanation = "synonym", 1.0, f"Synonym of '{matched}'"
+            elif best_match >= self.high_confidence:
+                tier, similarity = "lexical", best_match
+                explanation = f"Strong lexical overlap with '{entry.get('best_match_keyword')}'"
+            elif best_match <= self.low_confidence:
+                tier, similarity, explanation = "no_match", 0.0, "No overlap with the job keywords"
+            else:
+                ambiguous.append(entry)
+                continue
+            self._record_tier(tier)
+            finalized.append({"keyword": entry["keyword"], "similarity": similarity,
+                              "explanation": explanation, "suggestions": [], "tier": tier})
+        return finalized, ambiguous
+
+    def refine_ranking(self, resume_keywords: List[str], job_keywords: List[str],
+                       initial_ranking: List[Dict[str, any]]) -> List[Dict[str, any]]:
+        # Entries are pruned on their best single job keyword match: the mean similarity shown to the model is
+        # diluted by every unrelated job keyword, so it says little about whether a keyword is noise
+        best_matches = [entry.get("best_match", entry["similarity"]) for entry in initial_ranking]
+        initial_ranking = [{"keyword": entry["keyword"], "similarity": round(entry["similarity"], 4)}
+                           for entry in initial_ranking]
+
+        # Keywords with no overlap at all, duplicates and whatever exceeds the budget stay out of the prompt
+        with PromptCall(self.prompt_budget) as prompt:
+            sent = prompt.keywords(initial_ranking, max_tokens=prompt.remaining // 2, scores=best_matches)
+            if not self.tiered:
+                resume_keywords = prompt.keywords(resume_keywords, max_tokens=prompt.remaining // 2)
+            job_keywords = prompt.keywords(job_keywords)
+        if self.tiered:
+            # Only keywords that actually reach the model count as resolved by it
+            self._record_tier("llm", len(sent))
+            if len(sent) < len(initial_ranking):
+                self._record_tier("tfidf", len(initial_ranking) - len(sent))
+        initial_ranking = sent
+        if not initial_ranking:
+            return []
+
+        if self.tiered:
+            # Only the ambiguous band reaches this point, so send just those keywords
+            task = f"""
+        Refine the similarity scores of these resume keywords against the job keywords:
 
-        # Use AI to refine the ranking and provide explanations
-        task = f"""
+        Job Keywords: {job_keywords}
+        Ambiguous Keywords: {initial_ranking}
+        """
+            if not self.structured_output:
+                task += """
+        For each ambiguous keyword return:
+        Keyword: <keyword>
+        Similarity: <score between 0 and 1>
+        Explanation: <one short sentence>
+        Suggestions: <comma-separated variations or synonyms>
+        """
+        else:
+            # Use AI to refine the ranking and provide explanations
+            task = f"""
         Refine this keyword similarity ranking and provide explanations:
 
         Resume Keywords: {resume_keywords}
@@ -69,8 +174,21 @@ class KeywordSimilarityRankingAgent(BaseReActAgent):
 
         Return the refined ranking with explanations and suggestions.
         """
-        result = self.execute_task(task)
-        return self.parse_result(result.response)
+        if self.structured_output:
+            refined = [record.model_dump() for record in self.execute_structured(task, RankingRecord)]
+        else:
+            refined = self.execute_task(task, self.parse_result)
+        for entry in refined:
+            entry["tier"] = "llm"
+        return refined
+
+    def _record_tier(self, tier: str, count: int = 1):
+        with self._tier_lock:
+            self.tier_counts[tier] += count
+
+    def tier_stats(self) -> Dict[str, int]:
+        with self._tier_lock:
+            return dict(self.tier_counts)
 
     def parse_result(self, result: str) -> List[Dict[str, any]]:
         lines = result.strip().split('\n')
@@ -0,0 +1,121 @@
+# agents/keyword_space.py
+
+from typing import List, Dict, Optional, Union
+import numpy as np
+
+
+# Aliases that TF-IDF cannot connect on its own; each group is treated as one term
+KEYWORD_SYNONYMS = [
+    {"javascript", "js", "ecmascript"},
+    {"typescript", "ts"},
+    {"python", "python3"},
+    {"golang", "go"},
+    {"kubernetes", "k8s"},
+    {"postgresql", "postgres"},
+    {"machine learning", "ml"},
+    {"artificial intelligence", "ai"},
+    {"natural language processing", "nlp"},
+    {"continuous integration", "ci"},
+    {"continuous delivery", "continuous deployment", "cd"},
+    {"ci/cd", "cicd", "ci cd"},
+    {"amazon web services", "aws"},
+    {"google cloud platform", "gcp", "google cloud"},
+    {"microsoft azure", "azure"},
+    {"user experience", "ux"},
+    {"user interface", "ui"},
+    {"quality assurance", "qa"},
+    {"object oriented programming", "oop"},
+    {"rest api", "restful api", "rest apis", "restful apis"},
+    {"node.js", "nodejs", "node"},
+    {"react", "react.js", "reactjs"},
+    {"project management", "project manager"},
+    {"team leadership", "team lead", "leadership"},
+]
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+SYNONYM_GROUP = {term: index for index, group in enumerate(KEYWORD_SYNONYMS) for term in group}
+
+
+def flatten_keywords(keywords: Union[List[str], Dict[str, List[Dict[str, any]]]]) -> List[str]:
+    # Extraction agents return {category: [{"keyword": ..., ...}]}; ranking works on plain keyword lists
+    if isinstance(keywords, dict):
+        return [entry["keyword"] for entries in keywords.values() for entry in entries]
+    return list(keywords)
+
+
+class JobKeywordSpace:
+    """TF-IDF space fitted once on a job's keywords and reused to score any number of resume items."""
+
+    def __init__(self, job_keywords: List[str]):
+        # sklearn is only needed once a job is actually scored, so keep it out of import time
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        self.job_keywords = job_keywords
+        self.vectorizer = TfidfVectorizer()
+        try:
+            # Rows come out L2-normalised, so a sparse dot product against them is the cosine similarity
+            self.job_matrix = self.vectorizer.fit_transform(job_keywords)
+        except ValueError:
+            # Empty or stopword-only job keywords leave nothing to match against
+            self.job_matrix = None
+        self._job_matrix_t = self.job_matrix.T.tocsr() if self.job_matrix is not None else None
+        self._analyzer = self.vectorizer.build_analyzer()
+
+    def _score_all(self, keyword_lists: List[List[str]]):
+        from scipy import sparse
+
+        offsets = np.cumsum([0] + [len(keywords) for keywords in keyword_lists])
+        all_keywords = [keyword for keywords in keyword_lists for keyword in keywords]
+        if self.job_matrix is None or not all_keywords:
+            zeros = np.zeros(len(all_keywords))
+            return offsets, zeros, zeros, np.zeros(len(all_keywords), dtype=int)
+
+        # One transform and one sparse product for every item; the dense resume x job matrix is never built
+        similarities = (self.vectorizer.transform(all_keywords) @ self._job_matrix_t).tocsr()
+        # Terms outside the job vocabulary vanish in transform, which would make "python developer" a perfect
+        # match for "python"; scale each row back down by the share of its terms the job space knows about
+        similarities = sparse.diags(self._vocabulary_coverage(all_keywords)) @ similarities
+        mean_similarity = np.asarray(similarities.sum(axis=1)).ravel() / len(self.job_keywords)
+        best_similarity = similarities.max(axis=1).toarray().ravel()
+        best_index = np.asarray(similarities.argmax(axis=1)).ravel()
+        return offsets, mean_similarity, best_similarity, best_index
+
+    def _vocabulary_coverage(self, keywords: List[str]) -> np.ndarray:
+        coverage = np.zeros(len(keywords))
+        for i, keyword in enumerate(keywords):
+            terms = self._analyzer(keyword)
+            if terms:
+                coverage[i] = sum(term in self.vectorizer.vocabulary_ for term in terms) / len(terms)
+        return np.sqrt(coverage)
+
+    def score(self, keyword_lists: List[List[str]]) -> List[np.ndarray]:
+        offsets, mean_similarity, _, _ = self._score_all(keyword_lists)
+        return [mean_similarity[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def rank(self, keyword_lists: List[List[str]], top_k: Optional[int] = None) -> List[List[Dict[str, any]]]:
+        offsets, mean_similarity, best_similarity, best_index = self._score_all(keyword_lists)
+        rankings = []
+        for keywords, start, end in zip(keyword_lists, offsets[:-1], offsets[1:]):
+            scores = mean_similarity[start:end]
+            if top_k is not None and top_k < len(scores):
+                # Partition first so only the top_k scores are sorted
+                top = np.argpartition(-scores, top_k - 1)[:top_k]
+                order = top[np.argsort(-scores[top], kind="stable")]
+            else:
+                order = np.argsort(-scores, kind="stable")
+            ranking = []
+            for i in order:
+                best = float(best_similarity[start + i])
+                ranking.append({
+                    "keyword": keywords[i],
+                    "similarity": float(scores[i]),
+                    # Strongest single job keyword match, used to decide whether the LLM needs to weigh in
+                    "best_match": best,
+                    "best_match_keyword": self.job_keywords[best_index[start + i]] if best > 0 else None,
+                })
+            rankings.append(ranking)
+        return rankings
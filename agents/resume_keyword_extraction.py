@@ -2,13 +2,35 @@
 
 from .base_react_agent import BaseReActAgent
 from llama_index.core.tools import FunctionTool
-from typing import List, Dict
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+from typing import List, Dict, FrozenSet
+from functools import lru_cache
+from ..models.agent_outputs import KeywordRecord
+from ..utils.prompt_budget import PromptCall
 
-nltk.download('punkt', quiet=True)
-nltk.download('stopwords', quiet=True)
+
+@lru_cache(maxsize=None)
+def _english_stopwords() -> FrozenSet[str]:
+    # NLTK and its corpora are loaded (and downloaded if missing) on first use instead of at import time
+    import nltk
+    from nltk.corpus import stopwords
+
+    try:
+        return frozenset(stopwords.words('english'))
+    except LookupError:
+        nltk.download('stopwords', quiet=True)
+        return frozenset(stopwords.words('english'))
+
+
+@lru_cache(maxsize=None)
+def _word_tokenize():
+    import nltk
+    from nltk.tokenize import word_tokenize
+
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        nltk.download('punkt', quiet=True)
+    return word_tokenize
 
 
 class ResumeKeywordExtractionAgent(BaseReActAgent):
@@ -43,12 +65,15 @@ class ResumeKeywordExtractionAgent(BaseReActAgent):
         ]
 
     def extract_keywords_from_text(self, text: str) -> List[str]:
-        stop_words = set(stopwords.words('english'))
-        word_tokens = word_tokenize(text.lower())
+        stop_words = _english_stopwords()
+        word_tokens = _word_tokenize()(text.lower())
         keywords = [word for word in word_tokens if word.isalnum() and word not in stop_words]
         return list(set(keywords))
 
     def extract_keywords(self, resume: Dict[str, any]) -> Dict[str, List[Dict[str, any]]]:
+        # The resume goes in as its prose, with repeated lines dropped and cut to the budget
+        with PromptCall(self.prompt_budget) as prompt:
+            resume = prompt.text(resume)
         task = f"""
         Analyze this resume and extract the key skills, qualifications, and experiences:
 
@@ -57,8 +82,15 @@ class ResumeKeywordExtractionAgent(BaseReActAgent):
         Provide a comprehensive list of keywords, categorized by type (e.g., technical skills, soft skills, etc.). 
         For each keyword, include a relevance score (0-100) based on its prominence and importance in the resume.
         """
-        result = self.execute_task(task)
-        return self.parse_result(result.response)
+        if self.structured_output:
+            return self.group_records(self.execute_structured(task, KeywordRecord))
+        return self.execute_task(task, self.parse_result)
+
+    def group_records(self, records: List[KeywordRecord]) -> Dict[str, List[Dict[str, any]]]:
+        grouped = {}
+        for record in records:
+            grouped.setdefault(record.category, []).append({"keyword": record.keyword, "relevance": record.score})
+        return grouped
 
     def parse_result(self, result: str) -> Dict[str, List[Dict[str, any]]]:
         lines = result.strip().split('\n')
@@ -85,6 +117,12 @@ class ResumeKeywordExtractionAgent(BaseReActAgent):
 
     def refine_keywords(self, extracted_keywords: Dict[str, List[Dict[str, any]]], job_description: str) -> Dict[
         str, List[Dict[str, any]]]:
+        # Low-relevance and duplicate keywords are dropped, and only the job description spans that mention a
+        # remaining keyword are sent
+        with PromptCall(self.prompt_budget) as prompt:
+            extracted_keywords = prompt.keywords(extracted_keywords, max_tokens=prompt.remaining // 3)
+            terms = [entry["keyword"] for entries in extracted_keywords.values() for entry in entries]
+            job_description = prompt.text(job_description, terms)
         task = f"""
         Refine these extracted resume keywords based on their relevance to the job description:
 
@@ -99,5 +137,6 @@ class ResumeKeywordExtractionAgent(BaseReActAgent):
 
         Provide the refined list of keywords with updated relevance scores and any new suggested keywords.
         """
-        result = self.execute_task(task)
-        return self.parse_result(result.response)
+        if self.structured_output:
+            return self.group_records(self.execute_structured(task, KeywordRecord))
+        return self.execute_task(task, self.parse_result)
@@ -1,19 +1,196 @@
+# agents/resume_point_tailoring.py
+
+import json
+from .base_react_agent import BaseReActAgent
 from llama_index.core.tools import FunctionTool
-from llama_index.agent.openai import OpenAIAgent
-
-class ResumePointTailoringAgent:
-    def __init__(self):
-        self.agent = OpenAIAgent.from_tools(
-            tools=[],
-            verbose=True
-        )
-        self.tool = FunctionTool.from_defaults(
-            fn=self.tailor_point,
-            name="tailor_point",
-            description="Tailor individual resume points using the keyword mapping and constraints"
-        )
-
-    def tailor_point(self, point: str, keyword_mapping: dict, constraints: dict) -> str:
-        # Use self.agent to interact with OpenAI for point tailoring
-        # This is a placeholder and should be implemented with actual logic
-        return point
\ No newline at end of file
+from typing import Any, Dict, List, Optional, Union
+from ..models.agent_outputs import TailoredPoint
+from ..utils.instrumentation import span
+from ..utils.prompt_budget import PromptCall
+from ..utils.token_counter import TokenCounter
+
+# Response format for a batch: every item comes back under the id it was sent with
+TAILORED_BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "items": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "tailored": {"type": ["string", "object"]},
+                },
+                "required": ["id", "tailored"],
+            },
+        },
+    },
+    "required": ["items"],
+}
+
+
+def extract_json(text: str) -> Any:
+    # Models often wrap JSON in prose or code fences; parse the outermost object
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end < start:
+        raise ValueError("No JSON object in response")
+    return json.loads(text[start:end + 1])
+
+
+class ResumePointTailoringAgent(BaseReActAgent):
+    def __init__(self, max_prompt_tokens: int = 3000, max_batch_items: int = 16):
+        # Items tailored against the same job are packed into one request until either limit is reached
+        self.max_prompt_tokens = max_prompt_tokens
+        self.max_batch_items = max_batch_items
+        system_prompt = """
+        You are an expert resume writer. Your task is to tailor resume items to a job description using the
+        keywords matched between the resume and the job.
+
+        For each item:
+        1. Work in the most relevant matched keywords and their suggested variations where they fit naturally
+        2. Keep every fact, metric, date and name unchanged; never invent experience
+        3. Keep the item's structure: return text for text items and an object with the same fields for objects
+        4. Stay within the token limits given in the constraints
+
+        Respond with JSON only, matching the schema given in the task.
+        """
+        super().__init__("ResumePointTailoring", "Tailor resume items to a job description", system_prompt)
+        self.token_counter = TokenCounter(self.model)
+
+    def get_tools(self) -> List[FunctionTool]:
+        return [
+            FunctionTool.from_defaults(
+                fn=self.tailor_point,
+                name="tailor_point",
+                description="Tailor individual resume points using the keyword mapping and constraints"
+            )
+        ]
+
+    def tailor_point(self, point: Union[str, dict], keyword_mapping: list, constraints: dict,
+                     section: Optional[str] = None) -> Union[str, dict]:
+        return self.tailor_point_result(point, keyword_mapping, constraints, section).value
+
+    def tailor_point_result(self, point: Union[str, dict], keyword_mapping: list, constraints: dict,
+                            section: Optional[str] = None) -> TailoredPoint:
+        try:
+            tailored = self._request([point], [keyword_mapping], constraints, [section])
+        except ValueError:
+            tailored = {}
+        # An unusable answer leaves the point as it was
+        if 0 not in tailored:
+            return TailoredPoint(point, False)
+        return TailoredPoint(tailored[0], True)
+
+    def tailor_points(self, points: List[Union[str, dict]], keyword_mappings: List[list], constraints: dict,
+                      sections: Optional[List[Optional[str]]] = None) -> List[Union[str, dict]]:
+        sections = sections or [None] * len(points)
+        tailored = [None] * len(points)
+        for batch in self.plan_batches(points, keyword_mappings, constraints, sections):
+            results = self.tailor_batch([points[i] for i in batch], [keyword_mappings[i] for i in batch],
+                                        constraints, [sections[i] for i in batch])
+            for position, result in zip(batch, results):
+                tailored[position] = result.value
+        return tailored
+
+    def plan_batches(self, points: List[Union[str, dict]], keyword_mappings: List[list], constraints: dict,
+                     sections: Optional[List[Optional[str]]] = None,
+                     point_texts: Optional[List[str]] = None) -> List[List[int]]:
+        # Greedy packing: the shared prefix is counted once, then item lines are added until the ceiling.
+        # point_texts are the items already serialised as JSON, so callers that have them skip re-encoding
+        sections = sections or [None] * len(points)
+        point_texts = point_texts or [None] * len(points)
+        prefix_tokens = self.token_counter.count(self.system_prompt) + \
+            self.token_counter.count(self._task_prefix(constraints))
+        batches, budget = [], None
+        for position, (point, mapping, section) in enumerate(zip(points, keyword_mappings, sections)):
+            line = self._item_line(position, point, mapping, section, point_texts[position])
+            if budget is None or len(batches[-1]) >= self.max_batch_items or not budget.try_add(line):
+                # An item too large for an empty batch still gets a batch of its own
+                budget = self.token_counter.budget(max(0, self.max_prompt_tokens - prefix_tokens))
+                budget.try_add(line)
+                batches.append([])
+            batches[-1].append(position)
+        return batches
+
+    def tailor_batch(self, points: List[Union[str, dict]], keyword_mappings: List[list], constraints: dict,
+                     sections: Optional[List[Optional[str]]] = None,
+                     point_texts: Optional[List[str]] = None) -> List[TailoredPoint]:
+        sections = sections or [None] * len(points)
+        if len(points) == 1:
+            return [self.tailor_point_result(points[0], keyword_mappings[0], constraints, sections[0])]
+
+        with span("tailor_batch", items=len(points)):
+            try:
+                tailored = self._request(points, keyword_mappings, constraints, sections, point_texts)
+            except ValueError:
+                tailored = {}
+        # Items the batch answer did not cover are retried one at a time
+        return [TailoredPoint(tailored[position], True) if position in tailored
+                else self.tailor_point_result(points[position], keyword_mappings[position], constraints,
+                                              sections[position])
+                for position in range(len(points))]
+
+    def _task_prefix(self, constraints: dict) -> str:
+        return f"""
+        Tailor each resume item below. Each line is a JSON object with the item's id, section, content and the
+        keywords it matched in the job description (with similarity scores and suggested variations).
+
+        Constraints: {json.dumps(constraints)}
+        Response Schema: {json.dumps(TAILORED_BATCH_SCHEMA)}
+
+        Items:
+        """
+
+    def _item_line(self, item_id: int, point: Union[str, dict], keyword_mapping: list,
+                   section: Optional[str], point_text: Optional[str] = None,
+                   prompt: Optional[PromptCall] = None) -> str:
+        keywords = [{"keyword": entry["keyword"], "similarity": round(entry.get("similarity", 0.0), 2),
+                     "suggestions": entry.get("suggestions", [])}
+                    for entry in keyword_mapping or []]
+        # Keywords that settled at no or low similarity are noise to the model. Planning prunes the same way
+        # without a prompt to record against, so batches are sized on the lines that are actually sent
+        keywords = (prompt or PromptCall(self.prompt_budget)).keywords(keywords)
+        if point_text is None:
+            point_text = json.dumps(point, ensure_ascii=False)
+        # Assembled around the pre-serialised item rather than dumping it again
+        return (f'{{"id": {item_id}, "section": {json.dumps(section)}, "item": {point_text}, '
+                f'"keywords": {json.dumps(keywords, ensure_ascii=False)}}}')
+
+    def _request(self, points: List[Union[str, dict]], keyword_mappings: List[list], constraints: dict,
+                 sections: List[Optional[str]], point_texts: Optional[List[str]] = None) -> Dict[int, Union[str, dict]]:
+        point_texts = point_texts or [None] * len(points)
+        lines = []
+        for position, (point, mapping, section, point_text) in enumerate(zip(points, keyword_mappings, sections,
+                                                                             point_texts)):
+            with PromptCall(self.prompt_budget) as prompt:
+                lines.append(self._item_line(position, point, mapping, section, point_text, prompt))
+        task = self._task_prefix(constraints) + "\n".join(lines)
+        return self.execute_task(task, lambda response: self.parse_result(response, points))
+
+    def parse_result(self, result: str, points: List[Union[str, dict]]) -> Dict[int, Union[str, dict]]:
+        payload = extract_json(result)
+        if not isinstance(payload, dict) or not isinstance(payload.get("items"), list):
+            raise ValueError("Response does not match the tailored batch schema")
+
+        tailored = {}
+        for entry in payload["items"]:
+            if not isinstance(entry, dict) or not isinstance(entry.get("id"), int):
+                continue
+            item_id, value = entry["id"], entry.get("tailored")
+            if not 0 <= item_id < len(points):
+                continue
+            original = points[item_id]
+            # Text stays text; objects keep their original fields, so the result still validates as that model
+            if isinstance(original, str) and isinstance(value, str) and value.strip():
+                tailored[item_id] = value.strip()
+            elif isinstance(original, dict) and isinstance(value, dict):
+                tailored[item_id] = {key: self._same_type(original[key], value.get(key)) for key in original}
+        return tailored
+
+    @staticmethod
+    def _same_type(original: Any, value: Any) -> Any:
+        if value is None or not isinstance(value, type(original)):
+            return original
+        if isinstance(original, list) and not all(isinstance(part, str) for part in value):
+            return original
+        return value
@@ -0,0 +1,98 @@
+# benchmarks/allocation_benchmark.py
+#
+# Memory and time spent on resume section handling, outside of any LLM work. Compares the per-stage
+# model_dump()/Resume(**...)/str() round-trips the orchestrator used to do with the SectionView path it uses now,
+# then measures peak memory of a whole run against the instant stub LLM. Run from the directory containing the
+# package:
+#     python -m <package>.benchmarks.allocation_benchmark --sizes small medium large
+
+import argparse
+import contextlib
+import io
+import json
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from .pipeline_benchmark import missing_agents
+from .stub_llm import StubLLM
+from .synthetic import SIZES, make_job_description, make_resume
+from ..agents.base_react_agent import BaseReActAgent
+from ..agents.constraint_enforcement import ConstraintInferenceAgent
+from ..models.resume import Resume
+from ..orchestrator.main_orchestrator import MainOrchestrator
+from ..orchestrator.section_view import SectionView, resume_text
+
+
+def round_trips(resume: Resume, constraints) -> Resume:
+    # What one run used to do: dump the resume, str() and re-dump every item for its prompts, rebuild the
+    # Resume after tailoring and convert it back and forth for every post-processing step
+    fields = resume.model_dump()
+    for section in ('summary', 'experiences', 'projects', 'skills'):
+        items = fields[section] if isinstance(fields[section], list) else [fields[section]]
+        for item in items:
+            str(item)
+            constraints.model_dump()
+            json.dumps(item, ensure_ascii=False)
+            json.dumps(item, ensure_ascii=False)
+    tailored = Resume(**fields)
+    fields = tailored.model_dump()
+    str(fields)
+    return Resume(**fields)
+
+
+def section_view(resume: Resume, constraints) -> Resume:
+    view = SectionView.from_resume(resume)
+    constraints.model_dump()
+    for item in view:
+        item.text
+        item.json
+        item.json
+    resume_text(view.fields)
+    return view.to_resume()
+
+
+def measure(function: Callable, repeat: int, *args) -> Tuple[float, float]:
+    # Peak traced memory of a single call, and mean wall time over repeat calls with tracing off
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function(*args)
+    return peak / 1024, (time.perf_counter() - started) / repeat * 1e6
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", nargs="+", default=list(SIZES), choices=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    constraint_agent = ConstraintInferenceAgent()
+    print(f"{'size':<8}{'path':<14}{'peak KiB':>10}{'us/run':>10}")
+    for size in args.sizes:
+        resume = make_resume(size, 0)
+        constraints = constraint_agent.infer_constraints(resume.model_dump())
+        for name, function in (("round-trips", round_trips), ("section view", section_view)):
+            peak, micros = measure(function, args.repeat, resume, constraints)
+            print(f"{size:<8}{name:<14}{peak:>10.1f}{micros:>10.1f}")
+
+    # Whole runs with local extraction and batched tailoring, so LLM text handling does not dominate
+    stub = StubLLM.from_profile("instant")
+    BaseReActAgent.llm_factory = lambda model: stub
+    orchestrator = MainOrchestrator({"keyword_extraction": "local", "batch_tailoring": True,
+                                     "agents": missing_agents()})
+    print(f"\n{'size':<8}{'run peak KiB':>14}{'ms/run':>10}")
+    for size in args.sizes:
+        resume, job_description = make_resume(size, 0), make_job_description(size, 0)
+        # The ReAct agents log every step to stdout
+        with contextlib.redirect_stdout(io.StringIO()):
+            orchestrator.run(resume, job_description)
+            peak, micros = measure(orchestrator.run, 5, resume, job_description)
+        print(f"{size:<8}{peak:>14.1f}{micros / 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
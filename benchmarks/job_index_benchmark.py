@@ -0,0 +1,71 @@
+# benchmarks/job_index_benchmark.py
+#
+# Build, persistence and top-k query timings for JobIndex over a synthetic corpus. Run from the directory
+# containing the package:
+#     python -m <package>.benchmarks.job_index_benchmark --postings 100000
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from typing import List
+
+from .synthetic import SKILLS, make_job_description, make_resume
+from ..agents.job_index import JobIndex
+
+
+def synthetic_keywords(rng: random.Random, vocabulary: List[str], common: int, rare: int) -> List[str]:
+    # A few widely shared skills plus a long tail, roughly how real postings spread over the vocabulary
+    return rng.sample(SKILLS, common) + rng.sample(vocabulary, rare)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--postings", type=int, default=100_000)
+    parser.add_argument("--vocabulary", type=int, default=5_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    vocabulary = [f"skill {i}" for i in range(args.vocabulary)]
+    metadata = {"title": "Software Engineer", "company": "Acme Corp"}
+
+    index = JobIndex()
+    started = time.perf_counter()
+    index.add_many([metadata] * args.postings,
+                   keywords=[synthetic_keywords(rng, vocabulary, 8, 15) for _ in range(args.postings)])
+    print(f"build        {time.perf_counter() - started:8.2f} s   {args.postings} postings, {len(index.terms)} terms")
+
+    started = time.perf_counter()
+    for i in range(100):
+        index.add(metadata, job_id=f"incremental-{i}", keywords=synthetic_keywords(rng, vocabulary, 8, 15))
+    print(f"add          {(time.perf_counter() - started) * 10:8.3f} ms per posting")
+
+    with tempfile.TemporaryDirectory() as path:
+        started = time.perf_counter()
+        index.save(path)
+        print(f"save         {time.perf_counter() - started:8.2f} s")
+        started = time.perf_counter()
+        loaded = JobIndex.load(path)
+        print(f"load (mmap)  {(time.perf_counter() - started) * 1000:8.2f} ms")
+
+        queries = [synthetic_keywords(rng, vocabulary, 12, 20) for _ in range(args.queries)]
+        timings = []
+        for keywords in queries:
+            started = time.perf_counter()
+            loaded.query(None, top_k=args.top_k, keywords=keywords)
+            timings.append((time.perf_counter() - started) * 1000)
+        print(f"query        {statistics.median(timings):8.2f} ms p50, {max(timings):.2f} ms max (keywords given)")
+
+        # End to end from a Resume, including dictionary keyword extraction
+        loaded.add(make_job_description("medium", 0), job_id="real")
+        started = time.perf_counter()
+        matches = loaded.query(make_resume("medium", 0), top_k=args.top_k)
+        print(f"resume query {(time.perf_counter() - started) * 1000:8.2f} ms   best: {matches[0]['job_id']}")
+        del loaded
+
+
+if __name__ == "__main__":
+    main()
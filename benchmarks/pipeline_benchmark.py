@@ -0,0 +1,172 @@
+# benchmarks/pipeline_benchmark.py
+#
+# End-to-end throughput/latency of MainOrchestrator.run against a deterministic local LLM. Run from the
+# directory containing the package:
+#     python -m <package>.benchmarks.pipeline_benchmark --sizes small medium large --iterations 5
+# Pass --json to save results and --baseline to fail (exit 1) when a run regresses past --tolerance.
+
+import argparse
+import contextlib
+import io
+import importlib.util
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from .stub_llm import LATENCY_PROFILES, StubLLM
+from .synthetic import SIZES, make_job_description, make_resume
+from ..agents.base_react_agent import BaseReActAgent
+from ..orchestrator.main_orchestrator import AGENT_REGISTRY, MainOrchestrator
+
+
+class PassThroughAgent:
+    # Stands in for pipeline steps whose agent modules are not implemented yet, returning inputs unchanged
+    def get_industry_context(self, description: str, company: str) -> dict:
+        return {}
+
+    def analyze_context(self, cover_letter: str, portfolio: str) -> dict:
+        return {}
+
+    def balance_soft_skills(self, resume: dict) -> dict:
+        return resume
+
+    def check_format(self, resume: Any) -> Any:
+        return resume
+
+    def check_coherence(self, resume: Any) -> dict:
+        return {}
+
+    def estimate_ats_score(self, resume: Any, *args) -> float:
+        return 0.0
+
+    def check_readability(self, text: str) -> float:
+        return 0.0
+
+    def customize_resume(self, resume: Any, preferences: dict, company: str) -> Any:
+        return resume
+
+
+def missing_agents() -> Dict[str, PassThroughAgent]:
+    package = MainOrchestrator.__module__.rsplit(".", 1)[0]
+    stand_ins = {}
+    for name, (module_name, _, _) in AGENT_REGISTRY.items():
+        if importlib.util.find_spec(module_name, package=package) is None:
+            stand_ins[name] = PassThroughAgent()
+    return stand_ins
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def count_items(resume) -> int:
+    return 1 + len(resume.experiences) + len(resume.projects) + len(resume.skills)
+
+
+def run_size(size: str, iterations: int, stub: StubLLM, config: Dict[str, Any], track_memory: bool) -> Dict[str, Any]:
+    orchestrator = MainOrchestrator({**config, "agents": missing_agents()})
+    # Warm-up pays for lazy agent construction and imports so they do not skew the timed runs
+    orchestrator.run(make_resume(size, seed=-1), make_job_description(size, seed=-1))
+    stub.reset_stats()
+
+    if track_memory:
+        tracemalloc.start()
+    latencies, items = [], 0
+    started = time.perf_counter()
+    for iteration in range(iterations):
+        resume, job_description = make_resume(size, iteration), make_job_description(size, iteration)
+        items += count_items(resume)
+        run_started = time.perf_counter()
+        orchestrator.run(resume, job_description)
+        latencies.append(time.perf_counter() - run_started)
+    elapsed = time.perf_counter() - started
+    peak_memory = tracemalloc.get_traced_memory()[1] if track_memory else None
+    if track_memory:
+        tracemalloc.stop()
+
+    llm = stub.stats()
+    return {
+        "size": size,
+        "iterations": iterations,
+        "p50_latency": statistics.median(latencies),
+        "p95_latency": percentile(latencies, 0.95),
+        "items_per_second": items / elapsed,
+        "llm_calls_per_resume": llm["calls"] / iterations,
+        "prompt_tokens_per_resume": llm["prompt_tokens"] / iterations,
+        "completion_tokens_per_resume": llm["completion_tokens"] / iterations,
+        "peak_memory_mb": peak_memory / 2 ** 20 if peak_memory is not None else None,
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    # Lower is better for every compared metric except throughput
+    checks = {"p95_latency": 1, "llm_calls_per_resume": 1, "prompt_tokens_per_resume": 1, "items_per_second": -1}
+    previous = {entry["size"]: entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        reference = previous.get(entry["size"])
+        if reference is None:
+            continue
+        for metric, direction in checks.items():
+            before, after = reference.get(metric), entry.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before * direction
+            if change > tolerance:
+                regressions.append(f"{entry['size']}: {metric} {before:.4g} -> {after:.4g} ({change:+.0%})")
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", nargs="+", default=list(SIZES), choices=list(SIZES))
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--profile", default="fast", choices=list(LATENCY_PROFILES))
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--keyword-extraction", default="llm", choices=["llm", "local", "local_first"])
+    parser.add_argument("--structured-output", action="store_true", help="agents answer in validated JSON lines")
+    parser.add_argument("--batch-tailoring", action="store_true", help="tailor items in batched requests")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc, which slows the runs")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare against results previously written with --json")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    stub = StubLLM.from_profile(args.profile)
+    BaseReActAgent.llm_factory = lambda model: stub
+    config = {"max_concurrency": args.concurrency, "keyword_extraction": args.keyword_extraction,
+              "batch_tailoring": args.batch_tailoring, "structured_output": args.structured_output}
+
+    # The ReAct agents log every step to stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = [run_size(size, args.iterations, stub, config, not args.no_memory) for size in args.sizes]
+
+    header = f"{'size':<8}{'p50 s':>9}{'p95 s':>9}{'items/s':>10}{'calls':>8}{'prompt tok':>12}{'peak MB':>9}"
+    print(f"profile={args.profile} concurrency={args.concurrency} keyword_extraction={args.keyword_extraction} "
+          f"batch_tailoring={args.batch_tailoring} structured_output={args.structured_output}")
+    print(header)
+    for entry in results:
+        peak = f"{entry['peak_memory_mb']:.1f}" if entry["peak_memory_mb"] is not None else "-"
+        print(f"{entry['size']:<8}{entry['p50_latency']:>9.3f}{entry['p95_latency']:>9.3f}"
+              f"{entry['items_per_second']:>10.1f}{entry['llm_calls_per_resume']:>8.1f}"
+              f"{entry['prompt_tokens_per_resume']:>12.0f}{peak:>9}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+# benchmarks/startup_benchmark.py
+#
+# Measures where orchestrator cold-start time goes. Run from the directory containing the package:
+#     python -m <package>.benchmarks.startup_benchmark
+
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+PACKAGE = __package__.rsplit(".", 1)[0]
+PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MODULES = [
+    "orchestrator.main_orchestrator",
+    "agents.base_react_agent",
+    "agents.keyword_space",
+    "agents.keyword_similarity_ranking",
+    "agents.resume_keyword_extraction",
+    "agents.job_description_keyword_extraction",
+    "agents.constraint_enforcement",
+    "agents.resume_point_tailoring",
+]
+
+
+def measure_import(module: str) -> Tuple[float, List[Tuple[str, float]]]:
+    # A fresh interpreter per module, so nothing is already sitting in sys.modules
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {PACKAGE}.{module}"],
+        cwd=PACKAGE_PARENT, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+
+    # Attribute each module's own (self) time to its top-level package, e.g. llama_index or sklearn
+    by_package: Dict[str, float] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, _, name = line[len("import time:"):].split("|")
+        if not self_time.strip().isdigit():
+            continue
+        package = name.strip().split(".")[0]
+        by_package[package] = by_package.get(package, 0.0) + int(self_time) / 1e6
+    total = sum(by_package.values())
+    heaviest = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:5]
+    return total, heaviest
+
+
+def measure_orchestrator() -> List[Tuple[str, float]]:
+    sys.path.insert(0, PACKAGE_PARENT)
+    timings = []
+
+    start = time.perf_counter()
+    orchestrator_module = __import__(f"{PACKAGE}.orchestrator.main_orchestrator", fromlist=["MainOrchestrator"])
+    timings.append(("import orchestrator", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    orchestrator = orchestrator_module.MainOrchestrator({})
+    timings.append(("MainOrchestrator()", time.perf_counter() - start))
+
+    for name in orchestrator_module.AGENT_REGISTRY:
+        start = time.perf_counter()
+        try:
+            orchestrator.get_agent(name)
+            label = f"first access: {name}"
+        except ImportError:
+            label = f"first access: {name} (not implemented)"
+        timings.append((label, time.perf_counter() - start))
+    return timings
+
+
+def main():
+    print("Cold import time per module (fresh interpreter)")
+    for module in MODULES:
+        try:
+            total, heaviest = measure_import(module)
+        except RuntimeError as error:
+            print(f"  {module:<45} failed: {error}")
+            continue
+        print(f"  {module:<45} {total * 1000:8.1f} ms")
+        for name, seconds in heaviest:
+            print(f"      {name:<41} {seconds * 1000:8.1f} ms")
+
+    print()
+    print("Orchestrator startup (this process)")
+    for label, seconds in measure_orchestrator():
+        print(f"  {label:<60} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+# benchmarks/stub_llm.py
+
+import json
+import math
+import re
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+
+from llama_index.core.base.llms.types import ChatMessage, ChatResponse, CompletionResponse, LLMMetadata, MessageRole
+from llama_index.core.llms import CustomLLM
+from llama_index.core.llms.callbacks import llm_chat_callback, llm_completion_callback
+from pydantic import PrivateAttr
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    # Time to first token, then generation speed; jitter spreads each call by up to +/- that fraction
+    first_token_latency: float = 0.0
+    tokens_per_second: float = 0.0
+    jitter: float = 0.0
+
+
+LATENCY_PROFILES: Dict[str, LatencyProfile] = {
+    "instant": LatencyProfile(),
+    "fast": LatencyProfile(first_token_latency=0.02, tokens_per_second=2000.0, jitter=0.1),
+    "gpt-3.5-turbo": LatencyProfile(first_token_latency=0.35, tokens_per_second=90.0, jitter=0.25),
+    "gpt-4": LatencyProfile(first_token_latency=0.8, tokens_per_second=30.0, jitter=0.25),
+}
+
+_WORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z+#.\-]{3,}")
+_RANKED_KEYWORD_PATTERN = re.compile(r"'keyword': '([^']*)'")
+_STOPWORDS = frozenset("""
+    this that with from have will your their they them into about such more than also each other which
+    these those been being were when where while what analyze extract provide description resume
+    skills qualifications requirements experiences keywords keyword relevance score based importance
+    include comprehensive categorized type technical soft prominence list refine extracted
+""".split())
+
+
+def _stable_score(text: str, seed: int, low: int, high: int) -> int:
+    return low + zlib.crc32(f"{seed}:{text}".encode("utf-8")) % (high - low + 1)
+
+
+class StubLLM(CustomLLM):
+    """Deterministic offline stand-in for the OpenAI LLM, answering in the formats the agents parse."""
+
+    model_name: str = "stub-llm"
+    first_token_latency: float = 0.0
+    tokens_per_second: float = 0.0
+    jitter: float = 0.0
+    seed: int = 0
+    max_keywords: int = 12
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _calls: int = PrivateAttr(default=0)
+    _prompt_tokens: int = PrivateAttr(default=0)
+    _completion_tokens: int = PrivateAttr(default=0)
+
+    @classmethod
+    def from_profile(cls, profile: str = "fast", **kwargs) -> "StubLLM":
+        latency = LATENCY_PROFILES[profile]
+        return cls(first_token_latency=latency.first_token_latency, tokens_per_second=latency.tokens_per_second,
+                   jitter=latency.jitter, **kwargs)
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return LLMMetadata(model_name=self.model_name, is_chat_model=True)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"calls": self._calls, "prompt_tokens": self._prompt_tokens,
+                    "completion_tokens": self._completion_tokens}
+
+    def reset_stats(self):
+        with self._lock:
+            self._calls = self._prompt_tokens = self._completion_tokens = 0
+
+    def _respond(self, prompt: str, task: str) -> str:
+        response = self._answer(task)
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = max(1, len(response) // 4)
+        with self._lock:
+            self._calls += 1
+            self._prompt_tokens += prompt_tokens
+            self._completion_tokens += completion_tokens
+
+        delay = self.first_token_latency
+        if self.tokens_per_second:
+            delay += completion_tokens / self.tokens_per_second
+        if self.jitter:
+            # Derived from the prompt, so identical runs sleep identically
+            delay *= 1 + self.jitter * (_stable_score(prompt, self.seed, 0, 2000) / 1000 - 1)
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    def _answer(self, task: str) -> str:
+        if "Respond with one JSON object per line" in task:
+            return self._json_lines(task)
+        if "Response Schema:" in task and "Items:" in task:
+            return self._tailored_items(task.split("Items:", 1)[1])
+        if "Ambiguous Keywords:" in task or "Initial Ranking:" in task:
+            return self._ranking(_RANKED_KEYWORD_PATTERN.findall(task))
+        if "Analyze this job description" in task:
+            return self._categorized_keywords(task, ["Technical Skills", "Qualifications"], 1, 10)
+        if "Analyze this resume" in task or "Refine these extracted resume keywords" in task:
+            return self._categorized_keywords(task, ["Technical Skills", "Experience"], 40, 100)
+        return task.strip().splitlines()[0] if task.strip() else ""
+
+    def _keywords(self, text: str) -> List[str]:
+        keywords = []
+        for word in _WORD_PATTERN.findall(text):
+            word = word.lower().strip(".-")
+            if len(word) > 3 and word not in _STOPWORDS and word not in keywords:
+                keywords.append(word)
+        return keywords[:self.max_keywords]
+
+    def _categorized_keywords(self, task: str, categories: List[str], low: int, high: int) -> str:
+        keywords = self._keywords(task)
+        per_category = max(1, math.ceil(len(keywords) / len(categories)))
+        lines = []
+        for index, keyword in enumerate(keywords):
+            entry = f"{keyword} ({_stable_score(keyword, self.seed, low, high)})"
+            # The parsers expect "Category: first (n)" followed by bare "keyword (n)" lines
+            if index % per_category == 0:
+                entry = f"{categories[index // per_category]}: {entry}"
+            lines.append(entry)
+        return "\n".join(lines)
+
+    def _tailored_items(self, items: str) -> str:
+        # Echo each item back with its top suggested keyword appended to text items
+        tailored = []
+        for line in items.strip().splitlines():
+            entry = json.loads(line)
+            item = entry["item"]
+            if isinstance(item, str) and entry["keywords"]:
+                item = f"{item} ({entry['keywords'][0]['keyword']})"
+            tailored.append({"id": entry["id"], "tailored": item})
+        return json.dumps({"items": tailored})
+
+    def _json_lines(self, task: str) -> str:
+        if "Ambiguous Keywords:" in task or "Initial Ranking:" in task:
+            return "\n".join(json.dumps({"keyword": keyword,
+                                         "similarity": _stable_score(keyword, self.seed, 0, 100) / 100,
+                                         "explanation": "Deterministic stub refinement.",
+                                         "suggestions": [keyword]})
+                             for keyword in _RANKED_KEYWORD_PATTERN.findall(task))
+        categories = ["Technical Skills", "Qualifications"]
+        low, high = (1, 10) if "Analyze this job description" in task else (40, 100)
+        keywords = self._keywords(task.split("Respond with one JSON object per line", 1)[0])
+        return "\n".join(json.dumps({"category": categories[index % len(categories)], "keyword": keyword,
+                                     "score": _stable_score(keyword, self.seed, low, high)})
+                         for index, keyword in enumerate(keywords))
+
+    def _ranking(self, keywords: List[str]) -> str:
+        blocks = []
+        for keyword in keywords:
+            blocks.append("\n".join([
+                f"Keyword: {keyword}",
+                f"Similarity: {_stable_score(keyword, self.seed, 0, 100) / 100:.2f}",
+                "Explanation: Deterministic stub refinement.",
+                f"Suggestions: {keyword}",
+            ]))
+        return "\n".join(blocks)
+
+    @staticmethod
+    def _last_user_message(messages: Sequence[ChatMessage]) -> str:
+        for message in reversed(messages):
+            if message.role == MessageRole.USER:
+                return message.content or ""
+        return ""
+
+    @llm_chat_callback()
+    def chat(self, messages: Sequence[ChatMessage], **kwargs: Any) -> ChatResponse:
+        prompt = "\n".join(message.content or "" for message in messages)
+        text = self._respond(prompt, self._last_user_message(messages))
+        return ChatResponse(message=ChatMessage(role=MessageRole.ASSISTANT, content=text))
+
+    @llm_chat_callback()
+    def stream_chat(self, messages: Sequence[ChatMessage], **kwargs: Any):
+        response = self.chat(messages, **kwargs)
+
+        def gen():
+            # Arrives in small pieces, like a real token stream, so streaming parsers see partial lines
+            text = ""
+            for start in range(0, len(response.message.content), 16):
+                delta = response.message.content[start:start + 16]
+                text += delta
+                yield ChatResponse(message=ChatMessage(role=MessageRole.ASSISTANT, content=text), delta=delta)
+        return gen()
+
+    @llm_completion_callback()
+    def complete(self, prompt: str, formatted: bool = False, **kwargs: Any) -> CompletionResponse:
+        return CompletionResponse(text=self._respond(prompt, prompt))
+
+    @llm_completion_callback()
+    def stream_complete(self, prompt: str, formatted: bool = False, **kwargs: Any):
+        response = self.complete(prompt, formatted=formatted, **kwargs)
+
+        def gen():
+            yield CompletionResponse(text=response.text, delta=response.text)
+        return gen()
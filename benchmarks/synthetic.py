@@ -0,0 +1,70 @@
+# benchmarks/synthetic.py
+
+import random
+from typing import Dict
+
+from ..models.resume import Resume, Skill, Experience, Project, Education
+from ..models.job_description import JobDescription
+
+# Sizes are (experiences, bullets per experience, projects, skills, job requirements)
+SIZES: Dict[str, tuple] = {
+    "small": (2, 3, 1, 6, 6),
+    "medium": (4, 4, 3, 12, 10),
+    "large": (8, 6, 6, 24, 16),
+}
+
+SKILLS = [
+    "Python", "Go", "Java", "TypeScript", "React", "Node.js", "Django", "FastAPI", "PostgreSQL", "Redis",
+    "Kafka", "Spark", "AWS", "GCP", "Docker", "Kubernetes", "Terraform", "CI/CD", "GraphQL", "REST APIs",
+    "Machine Learning", "PyTorch", "scikit-learn", "Airflow", "Snowflake", "Microservices", "Linux", "Agile",
+]
+VERBS = ["Built", "Designed", "Led", "Migrated", "Optimized", "Automated", "Scaled", "Launched", "Refactored"]
+OBJECTS = ["data pipeline", "payments service", "search backend", "recommendation engine", "internal platform",
+           "deployment system", "analytics dashboard", "billing API", "feature store", "monitoring stack"]
+OUTCOMES = ["cutting latency by {n}%", "reducing cloud spend by {n}%", "serving {n}M requests per day",
+            "improving conversion by {n}%", "shrinking deploy time by {n}%", "supporting {n} internal teams"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises"]
+TITLES = ["Software Engineer", "Senior Software Engineer", "Backend Engineer", "Data Engineer", "Tech Lead"]
+
+
+def _bullet(rng: random.Random) -> str:
+    skills = rng.sample(SKILLS, 2)
+    outcome = rng.choice(OUTCOMES).format(n=rng.randint(5, 80))
+    return f"{rng.choice(VERBS)} a {rng.choice(OBJECTS)} with {skills[0]} and {skills[1]}, {outcome}"
+
+
+def make_resume(size: str = "medium", seed: int = 0) -> Resume:
+    rng = random.Random(f"resume:{size}:{seed}")
+    experiences, bullets, projects, skills, _ = SIZES[size]
+    return Resume(
+        name=f"Candidate {seed}",
+        email=f"candidate{seed}@example.com",
+        summary=(f"{rng.choice(TITLES)} with {rng.randint(2, 15)} years of experience in "
+                 f"{', '.join(rng.sample(SKILLS, 3))}. " + _bullet(rng) + "."),
+        skills=[Skill(name=name) for name in rng.sample(SKILLS, min(skills, len(SKILLS)))],
+        experiences=[
+            Experience(title=rng.choice(TITLES), company=rng.choice(COMPANIES), start_date=f"{2010 + i}-01",
+                       end_date=f"{2011 + i}-12", description=[_bullet(rng) for _ in range(bullets)])
+            for i in range(experiences)
+        ],
+        projects=[
+            Project(name=f"Project {i}", description=_bullet(rng), technologies=rng.sample(SKILLS, 3))
+            for i in range(projects)
+        ],
+        education=[Education(degree="B.Sc. Computer Science", institution="State University",
+                             graduation_date="2010")],
+    )
+
+
+def make_job_description(size: str = "medium", seed: int = 0) -> JobDescription:
+    rng = random.Random(f"job:{size}:{seed}")
+    requirements = SIZES[size][4]
+    skills = rng.sample(SKILLS, min(requirements, len(SKILLS)))
+    return JobDescription(
+        title=rng.choice(TITLES),
+        company=rng.choice(COMPANIES),
+        description=(f"We are looking for an engineer experienced in {', '.join(skills)} to own our "
+                     f"{rng.choice(OBJECTS)} and {rng.choice(OBJECTS)}."),
+        requirements=[f"Experience with {skill}" for skill in skills],
+        responsibilities=[f"{rng.choice(VERBS)} the {rng.choice(OBJECTS)}" for _ in range(requirements // 2)],
+    )
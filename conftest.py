@@ -0,0 +1,10 @@
+# conftest.py
+
+import sys
+from pathlib import Path
+
+# The modules import each other relatively, so the tests are imported as the tests subpackage of this directory,
+# from its parent, the same way the benchmarks are run (python -m <dir>.benchmarks...). With this directory itself
+# on sys.path (python -m pytest adds the working directory) pytest would import them as a top-level tests package.
+ROOT = Path(__file__).resolve().parent
+sys.path[:] = [str(ROOT.parent)] + [entry for entry in sys.path if Path(entry or ".").resolve() != ROOT]
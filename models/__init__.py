@@ -1,3 +1,4 @@
 from .resume import Resume, Skill, Experience, Project, Education
 from .job_description import JobDescription
-from .constraints import Constraints, SectionConstraint, ExperienceConstraint
\ No newline at end of file
+from .constraints import Constraints, SectionConstraint, ExperienceConstraint
+from .agent_outputs import KeywordRecord, RankingRecord
\ No newline at end of file
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import List, NamedTuple, Union
+
+class KeywordRecord(BaseModel):
+    category: str = Field(..., min_length=1)
+    keyword: str = Field(..., min_length=1)
+    score: int = Field(..., ge=0, le=100)
+
+class RankingRecord(BaseModel):
+    keyword: str = Field(..., min_length=1)
+    similarity: float = Field(..., ge=0, le=1)
+    explanation: str = ""
+    suggestions: List[str] = []
+
+class TailoredPoint(NamedTuple):
+    # tailored is False when no usable answer came back and value is the original point, which must not be
+    # remembered as that point's tailored form
+    value: Union[str, dict]
+    tailored: bool
@@ -0,0 +1,15 @@
+# orchestrator/events.py
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class PipelineEvent:
+    # One of: constraints, application_context, job_keywords, industry_context, item, sections,
+    # soft_skills, format, coherence, ats_score, readability, report (instrumented runs only), resume.
+    # Intermediate resume states (sections onwards) are plain field dicts; only "resume" carries a validated Resume
+    kind: str
+    data: Any
+    section: Optional[str] = None
+    index: Optional[int] = None
@@ -1,113 +1,522 @@
 # orchestrator/main_orchestrator.py
 
-from typing import Dict, Any
+import asyncio
+import contextvars
+import hashlib
+import importlib
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from functools import partial
+from typing import Dict, Any, AsyncIterator, Callable, Iterator, List, NamedTuple, Optional, Tuple
 from ..models.resume import Resume
 from ..models.job_description import JobDescription
 from ..models.constraints import Constraints
-from ..agents.constraint_inference import ConstraintInferenceAgent
-from ..agents.keyword_extraction import JobDescriptionKeywordExtractionAgent, ResumePointKeywordExtractionAgent
-from ..agents.keyword_similarity import KeywordSimilarityRankingAgent
-from ..agents.resume_point_tailoring import ResumePointTailoringAgent
-from ..agents.ats_score_estimation import ATSScoreEstimationAgent
-from ..agents.human_readability import HumanReadabilityAgent
-from ..agents.resume_coherence import ResumeCoherenceAgent
-from ..agents.industry_context import IndustryContextAgent
-from ..agents.format_compliance import FormatComplianceAgent
-from ..agents.soft_skills_balancing import SoftSkillsBalancingAgent
-from ..agents.customization import CustomizationAgent
-from ..agents.application_context import ApplicationContextAgent
+from .events import PipelineEvent
+from .section_view import SectionView, resume_text
+from ..agents.keyword_space import JobKeywordSpace, flatten_keywords
+from ..models.agent_outputs import TailoredPoint
+from ..utils.llm_cache import LLMResponseCache
+from ..utils.result_store import TailoredItemStore, item_fingerprint
+from ..utils.prompt_budget import PromptBudget, prose
+from ..utils.llm_pool import configure_client_pool, llm_priority
+from ..utils.instrumentation import RunReport, JsonLinesExporter, PrometheusTextExporter, activate, span
+
+# Agent attribute -> (module, class, config key holding constructor kwargs). Modules are imported and
+# agents built on first access, so starting an orchestrator does no LLM client or model setup.
+AGENT_REGISTRY = {
+    "constraint_inference_agent": ("..agents.constraint_enforcement", "ConstraintInferenceAgent", "constraints"),
+    "job_keyword_extraction_agent": ("..agents.job_description_keyword_extraction",
+                                     "JobDescriptionKeywordExtractionAgent", None),
+    "resume_keyword_extraction_agent": ("..agents.resume_keyword_extraction", "ResumeKeywordExtractionAgent", None),
+    "dictionary_keyword_extractor": ("..agents.dictionary_keyword_extraction", "DictionaryKeywordExtractor",
+                                     "keyword_dictionary"),
+    "keyword_similarity_agent": ("..agents.keyword_similarity_ranking", "KeywordSimilarityRankingAgent",
+                                 "keyword_ranking"),
+    "resume_point_tailoring_agent": ("..agents.resume_point_tailoring", "ResumePointTailoringAgent",
+                                     "point_tailoring"),
+    "ats_score_estimation_agent": ("..agents.ats_score_estimation", "ATSScoreEstimationAgent", "ats_scoring"),
+    "human_readability_agent": ("..agents.human_readability", "HumanReadabilityAgent", None),
+    "resume_coherence_agent": ("..agents.resume_coherence", "ResumeCoherenceAgent", None),
+    "industry_context_agent": ("..agents.industry_context", "IndustryContextAgent", None),
+    "format_compliance_agent": ("..agents.format_compliance", "FormatComplianceAgent", None),
+    "soft_skills_balancing_agent": ("..agents.soft_skills_balancing", "SoftSkillsBalancingAgent", None),
+    "customization_agent": ("..agents.customization", "CustomizationAgent", None),
+    "application_context_agent": ("..agents.application_context", "ApplicationContextAgent", None),
+}
+
+class BatchResult(NamedTuple):
+    resume_index: int
+    job_index: int
+    tailored_resume: Optional[Resume]
+    error: Optional[Exception] = None
+
+
+def _content_key(model) -> str:
+    return hashlib.sha256(model.model_dump_json().encode("utf-8")).hexdigest()
 
 
 class MainOrchestrator:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        # config["instrumentation"] may be True or a dict naming exporter outputs
+        instrumentation = config.get("instrumentation")
+        instrumentation = instrumentation if isinstance(instrumentation, dict) else {}
+        self.exporters = list(instrumentation.get("exporters", []))
+        if instrumentation.get("jsonl_path"):
+            self.exporters.append(JsonLinesExporter(instrumentation["jsonl_path"]))
+        if instrumentation.get("prometheus_path"):
+            self.exporters.append(PrometheusTextExporter(instrumentation["prometheus_path"]))
+        self.last_report: Optional[RunReport] = None
+        # Rate limits apply process-wide, so configuring them here affects every agent built afterwards
+        if config.get("llm_pool"):
+            configure_client_pool(**config["llm_pool"])
         self.initialize_agents()
 
     def initialize_agents(self):
-        self.constraint_inference_agent = ConstraintInferenceAgent()
-        self.job_keyword_extraction_agent = JobDescriptionKeywordExtractionAgent()
-        self.resume_keyword_extraction_agent = ResumePointKeywordExtractionAgent()
-        self.keyword_similarity_agent = KeywordSimilarityRankingAgent()
-        self.resume_point_tailoring_agent = ResumePointTailoringAgent()
-        self.ats_score_estimation_agent = ATSScoreEstimationAgent()
-        self.human_readability_agent = HumanReadabilityAgent()
-        self.resume_coherence_agent = ResumeCoherenceAgent()
-        self.industry_context_agent = IndustryContextAgent()
-        self.format_compliance_agent = FormatComplianceAgent()
-        self.soft_skills_balancing_agent = SoftSkillsBalancingAgent()
-        self.customization_agent = CustomizationAgent()
-        self.application_context_agent = ApplicationContextAgent()
-
-    def tailor_resume(self, resume: Resume, job_description: JobDescription) -> Resume:
-        # Step 1: Infer constraints
-        constraints = self.constraint_inference_agent.infer_constraints(resume.dict())
+        # Share one response cache across every ReAct agent when caching is configured
+        cache_config = self.config.get("llm_cache")
+        if cache_config is True:
+            cache_config = {}
+        self.response_cache = LLMResponseCache(**cache_config) if isinstance(cache_config, dict) else None
+        # Tailored items persisted by fingerprint, so re-running an edited resume only redoes changed items
+        # True or {} gives an in-memory store with default settings
+        store_config = self.config.get("result_store")
+        if store_config is True:
+            store_config = {}
+        self.result_store = TailoredItemStore(**store_config) if isinstance(store_config, dict) else None
+        # One prompt budget shared by every LLM agent so its stats cover the whole run; False sends prompts unpruned
+        budget_config = self.config.get("prompt_budget", {})
+        self.prompt_budget = PromptBudget(**budget_config) if budget_config is not False else None
+        self._agent_lock = threading.RLock()
+
+        for name in AGENT_REGISTRY:
+            self.__dict__.pop(name, None)
+        if self.config.get("eager_agents"):
+            for name in AGENT_REGISTRY:
+                self.get_agent(name)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when normal lookup fails, i.e. for agents that have not been built yet
+        if name in AGENT_REGISTRY:
+            return self.get_agent(name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
+    def get_agent(self, name: str) -> Any:
+        with self._agent_lock:
+            agent = self.__dict__.get(name)
+            if agent is None and name in self.config.get("agents", {}):
+                # Prebuilt instances in config["agents"] take the place of registry construction
+                agent = self.__dict__[name] = self.config["agents"][name]
+            if agent is None:
+                module_name, class_name, config_key = AGENT_REGISTRY[name]
+                agent_class = getattr(importlib.import_module(module_name, package=__package__), class_name)
+                agent = agent_class(**self.config.get(config_key, {})) if config_key else agent_class()
+                if hasattr(agent, "response_cache"):
+                    agent.response_cache = self.response_cache
+                if hasattr(agent, "structured_output"):
+                    agent.structured_output = self.config.get("structured_output", False)
+                if hasattr(agent, "prompt_budget"):
+                    agent.prompt_budget = self.prompt_budget
+                self.__dict__[name] = agent
+            return agent
+
+    def prepare_resume(self, resume: Resume, resume_fields: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        # Step 1: Infer constraints. A run that already dumped the resume passes its fields in; they are only read
+        with span("step.constraints"):
+            if resume_fields is None:
+                resume_fields = resume.model_dump()
+            constraints = self.constraint_inference_agent.infer_constraints(resume_fields)
+
+        # Step 4: Analyze application context
+        with span("step.application_context"):
+            application_context = self.application_context_agent.analyze_context("",
+                                                                                 "")  # Placeholder for cover letter and portfolio
+
+        return {"constraints": constraints, "application_context": application_context}
+
+    def prepare_job(self, job_description: JobDescription) -> Dict[str, Any]:
         # Step 2: Extract keywords from job description
-        job_keywords = self.job_keyword_extraction_agent.extract_keywords(job_description.description)
+        with span("step.job_keywords"):
+            job_keywords = self.job_keyword_extraction_agent.extract_keywords(job_description.description)
 
         # Step 3: Get industry context
-        industry_context = self.industry_context_agent.get_industry_context(job_description.description,
-                                                                            job_description.company)
+        with span("step.industry_context"):
+            industry_context = self.industry_context_agent.get_industry_context(job_description.description,
+                                                                                job_description.company)
 
-        # Step 4: Analyze application context
-        application_context = self.application_context_agent.analyze_context("",
-                                                                             "")  # Placeholder for cover letter and portfolio
+        # The job's TF-IDF space is fitted once here and shared by every item and resume tailored against it
+        keyword_space = JobKeywordSpace(flatten_keywords(job_keywords))
+
+        return {"job_keywords": job_keywords, "industry_context": industry_context, "keyword_space": keyword_space}
+
+    def tailor_resume(self, resume: Resume, job_description: JobDescription,
+                      resume_context: Optional[Dict[str, Any]] = None,
+                      job_context: Optional[Dict[str, Any]] = None) -> Resume:
+        for event in self.tailor_resume_stream(resume, job_description, resume_context, job_context):
+            if event.kind == "resume":
+                return event.data
+
+    def tailor_resume_stream(self, resume: Resume, job_description: JobDescription,
+                             resume_context: Optional[Dict[str, Any]] = None,
+                             job_context: Optional[Dict[str, Any]] = None) -> Iterator[PipelineEvent]:
+        report = None
+        if self.config.get("instrumentation"):
+            report = RunReport(resume=resume.name, job=job_description.title)
+
+        # The run gets its own context so spans stay consistent however the consumer drives the generator
+        # (other threads, asyncio.to_thread); every step is advanced inside it
+        context = contextvars.copy_context()
+        context.run(activate, report)
+        events = self._tailor_events(resume, job_description, resume_context, job_context)
+        try:
+            while True:
+                event = context.run(next, events, None)
+                if event is None:
+                    return
+                if event.kind == "resume" and report is not None:
+                    report.finish()
+                    for exporter in self.exporters:
+                        exporter.export(report)
+                    self.last_report = report
+                    yield PipelineEvent("report", report)
+                yield event
+        finally:
+            context.run(events.close)
+
+    def _tailor_events(self, resume: Resume, job_description: JobDescription,
+                       resume_context: Optional[Dict[str, Any]] = None,
+                       job_context: Optional[Dict[str, Any]] = None) -> Iterator[PipelineEvent]:
+        # Steps 1-4 only depend on one side of the pair, so batch runs pass them in precomputed. A single run dumps
+        # the resume once, for constraint inference and then as the fields the sections are tailored in
+        resume_fields = None
+        if resume_context is None:
+            resume_fields = resume.model_dump()
+            resume_context = self.prepare_resume(resume, resume_fields)
+        constraints = resume_context["constraints"]
+        application_context = resume_context["application_context"]
+        yield PipelineEvent("constraints", constraints)
+        yield PipelineEvent("application_context", application_context)
+
+        if job_context is None:
+            job_context = self.prepare_job(job_description)
+        job_keywords = job_context["job_keywords"]
+        industry_context = job_context["industry_context"]
+        keyword_space = job_context["keyword_space"]
+        yield PipelineEvent("job_keywords", job_keywords)
+        yield PipelineEvent("industry_context", industry_context)
 
         # Step 5: Tailor each section of the resume
-        tailored_resume = self.tailor_resume_sections(resume, job_keywords, constraints, industry_context,
-                                                      application_context)
+        with span("step.tailor_sections"):
+            for event in self.iter_tailored_sections(resume, job_keywords, constraints, industry_context,
+                                                     application_context, keyword_space, resume_fields):
+                yield event
+        # Plain resume fields from here on; they are validated into a Resume once, at the end
+        tailored_resume = event.data
 
         # Step 6: Balance soft skills
-        tailored_resume = self.soft_skills_balancing_agent.balance_soft_skills(tailored_resume.dict())
+        with span("step.soft_skills"):
+            tailored_resume = self.soft_skills_balancing_agent.balance_soft_skills(tailored_resume)
+        yield PipelineEvent("soft_skills", tailored_resume)
 
         # Step 7: Ensure format compliance
-        tailored_resume = self.format_compliance_agent.check_format(tailored_resume)
+        with span("step.format"):
+            tailored_resume = self.format_compliance_agent.check_format(tailored_resume)
+        yield PipelineEvent("format", tailored_resume)
 
         # Step 8: Check resume coherence
-        coherence_result = self.resume_coherence_agent.check_coherence(tailored_resume)
+        with span("step.coherence"):
+            coherence_result = self.resume_coherence_agent.check_coherence(tailored_resume)
+        yield PipelineEvent("coherence", coherence_result)
 
         # Step 9: Estimate ATS score
-        ats_score = self.ats_score_estimation_agent.estimate_ats_score(tailored_resume)
+        with span("step.ats_score"):
+            ats_score = self.ats_score_estimation_agent.estimate_ats_score(tailored_resume, job_keywords)
+        yield PipelineEvent("ats_score", ats_score)
 
         # Step 10: Check human readability
-        readability_score = self.human_readability_agent.check_readability(str(tailored_resume))
+        with span("step.readability"):
+            readability_score = self.human_readability_agent.check_readability(resume_text(tailored_resume))
+        yield PipelineEvent("readability", readability_score)
 
         # Step 11: Customize based on user preferences (placeholder)
-        tailored_resume = self.customization_agent.customize_resume(tailored_resume, {}, job_description.company)
+        with span("step.customization"):
+            tailored_resume = self.customization_agent.customize_resume(tailored_resume, {}, job_description.company)
 
-        return Resume(**tailored_resume)
+        yield PipelineEvent("resume", Resume.model_validate(tailored_resume))
+
+    async def tailor_resume_astream(self, resume: Resume, job_description: JobDescription,
+                                    resume_context: Optional[Dict[str, Any]] = None,
+                                    job_context: Optional[Dict[str, Any]] = None) -> AsyncIterator[PipelineEvent]:
+        stream = self.tailor_resume_stream(resume, job_description, resume_context, job_context)
+        step = None
+        try:
+            while True:
+                # Each step blocks on network I/O, so advance the generator off the event loop. The step is
+                # shielded: cancelling the consumer must not abandon a thread that is still inside the generator
+                step = asyncio.ensure_future(asyncio.to_thread(next, stream, None))
+                event = await asyncio.shield(step)
+                if event is None:
+                    return
+                yield event
+        finally:
+            if step is not None and not step.done():
+                # A generator cannot be closed while another thread is running it, so let the step finish first
+                await asyncio.wait({step})
+                step.exception()
+            # Closing the generator cancels any section items that have not started yet
+            await asyncio.to_thread(stream.close)
 
     def tailor_resume_sections(self, resume: Resume, job_keywords: list, constraints: Constraints,
-                               industry_context: dict, application_context: dict) -> Resume:
-        tailored_resume = resume.dict()
+                               industry_context: dict, application_context: dict,
+                               keyword_space: Optional[JobKeywordSpace] = None) -> Resume:
+        for event in self.iter_tailored_sections(resume, job_keywords, constraints, industry_context,
+                                                 application_context, keyword_space):
+            pass
+        return Resume.model_validate(event.data)
 
-        for section in ['summary', 'experiences', 'projects', 'skills']:
-            if isinstance(tailored_resume[section], list):
-                tailored_resume[section] = [
-                    self.tailor_section_item(item, job_keywords, constraints, industry_context, application_context) for
-                    item in tailored_resume[section]]
-            else:
-                tailored_resume[section] = self.tailor_section_item(tailored_resume[section], job_keywords, constraints,
-                                                                    industry_context, application_context)
+    def iter_tailored_sections(self, resume: Resume, job_keywords: list, constraints: Constraints,
+                               industry_context: dict, application_context: dict,
+                               keyword_space: Optional[JobKeywordSpace] = None,
+                               resume_fields: Optional[Dict[str, Any]] = None) -> Iterator[PipelineEvent]:
+        # The resume is dumped once into a mutable view (or resume_fields, a dump the caller hands over);
+        # tailored items are written into it in place and the final "sections" event carries its plain fields,
+        # which are validated once when the run returns
+        view = SectionView(resume_fields) if resume_fields is not None else SectionView.from_resume(resume)
+        if keyword_space is None:
+            keyword_space = JobKeywordSpace(flatten_keywords(job_keywords))
+        work_items = view.items
+        constraint_values = constraints.model_dump()
 
-        return Resume(**tailored_resume)
+        # Items whose fingerprint (content, job keyword set, constraints) was tailored before are reused as is
+        fingerprints = [None] * len(work_items)
+        reused = {}
+        if self.result_store is not None:
+            job_terms = flatten_keywords(job_keywords)
+            salt = self._fingerprint_salt()
+            for position, item in enumerate(work_items):
+                fingerprints[position] = item_fingerprint(item.section, item.json, job_terms, constraint_values,
+                                                          salt)
+                stored = self.result_store.get(fingerprints[position])
+                if stored is not None:
+                    reused[position] = stored
+        pending = [position for position in range(len(work_items)) if position not in reused]
 
-    def tailor_section_item(self, item: Any, job_keywords: list, constraints: Constraints, industry_context: dict,
-                            application_context: dict) -> Any:
-        if isinstance(item, dict):
-            item_keywords = self.resume_keyword_extraction_agent.extract_keywords(str(item))
-            keyword_mapping = self.keyword_similarity_agent.rank_keywords(item_keywords, job_keywords)
-            tailored_item = self.resume_point_tailoring_agent.tailor_point(str(item), keyword_mapping,
-                                                                           constraints.dict())
-            return tailored_item
-        elif isinstance(item, str):
-            item_keywords = self.resume_keyword_extraction_agent.extract_keywords(item)
-            keyword_mapping = self.keyword_similarity_agent.rank_keywords(item_keywords, job_keywords)
-            tailored_item = self.resume_point_tailoring_agent.tailor_point(item, keyword_mapping, constraints.dict())
-            return tailored_item
+        item_keywords = [None] * len(work_items)
+        initial_rankings = [None] * len(work_items)
+        if self.config.get("keyword_extraction") == "local" and pending:
+            # Local extraction costs well under a millisecond per item (about one for a whole large resume), so
+            # extract everything up front and score it in one TF-IDF pass
+            keywords = [self.extract_item_keywords(work_items[position].content) for position in pending]
+            for position, item_keyword_list, ranking in zip(pending, keywords, keyword_space.rank(keywords)):
+                item_keywords[position] = item_keyword_list
+                initial_rankings[position] = ranking
+        # Otherwise LLM extraction happens inside each item's own task so the first item is not held up by the rest
+
+        def tailor(position):
+            item = work_items[position]
+            with span("item", section=item.section, index=item.index):
+                return self.tailor_section_item(item.content, job_keywords, constraints, industry_context,
+                                                application_context, keyword_space=keyword_space,
+                                                item_keywords=item_keywords[position],
+                                                initial_ranking=initial_rankings[position], section=item.section,
+                                                constraint_values=constraint_values, item_text=item.text)
+
+        def rank(position):
+            item = work_items[position]
+            with span("item", section=item.section, index=item.index):
+                return self.rank_section_item(item.content, job_keywords, keyword_space=keyword_space,
+                                              item_keywords=item_keywords[position],
+                                              initial_ranking=initial_rankings[position], item_text=item.text)
+
+        def place(position, tailored_item, store=True):
+            # Items that fell back to their original content are shown but not stored, so a re-run tries again
+            item = work_items[position]
+            if store and fingerprints[position] is not None:
+                self.result_store.set(fingerprints[position], tailored_item)
+            view.place(item, tailored_item)
+            return PipelineEvent("item", tailored_item, item.section, item.index)
+
+        for position, tailored_item in reused.items():
+            yield place(position, tailored_item, store=False)
+
+        if self.config.get("batch_tailoring") and len(pending) > 1:
+            # Rank every item first, then tailor them in as few structured requests as the token ceiling allows
+            mappings = dict(self._fan_out([(position, partial(rank, position)) for position in pending]))
+            tailoring_agent = self.resume_point_tailoring_agent
+            points = [work_items[position].content for position in pending]
+            point_texts = [work_items[position].json for position in pending]
+            sections = [work_items[position].section for position in pending]
+            keyword_mappings = [mappings[position] for position in pending]
+            batches = tailoring_agent.plan_batches(points, keyword_mappings, constraint_values, sections, point_texts)
+
+            def tailor_batch(batch):
+                return tailoring_agent.tailor_batch([points[i] for i in batch], [keyword_mappings[i] for i in batch],
+                                                    constraint_values, [sections[i] for i in batch],
+                                                    [point_texts[i] for i in batch])
+
+            # Whole batches are emitted as they finish
+            for batch_number, results in self._fan_out([(number, partial(tailor_batch, batch))
+                                                        for number, batch in enumerate(batches)]):
+                for i, result in zip(batches[batch_number], results):
+                    position = pending[i]
+                    tailored_item = self.constraint_inference_agent.enforce(sections[i], result.value, constraints)
+                    yield place(position, tailored_item, store=result.tailored)
         else:
-            return item
+            # Items are emitted as they finish; place() still puts each one back in its original slot
+            for position, result in self._fan_out([(position, partial(tailor, position)) for position in pending]):
+                yield place(position, result.value, store=result.tailored)
+
+        yield PipelineEvent("sections", view.fields)
+
+    def _fingerprint_salt(self) -> str:
+        # Settings that change what an item is tailored into also have to change its fingerprint
+        ranking_config = sorted(self.config.get("keyword_ranking", {}).items())
+        return repr((self.config.get("keyword_extraction", "llm"), ranking_config))
+
+    def extract_item_keywords(self, item: Any, item_text: Optional[str] = None) -> List[str]:
+        if not isinstance(item, (dict, str)):
+            return []
+
+        # "local" uses only the skills dictionary; "local_first" falls back to the LLM when it finds nothing
+        mode = self.config.get("keyword_extraction", "llm")
+        if mode in ("local", "local_first"):
+            keywords = flatten_keywords(self.dictionary_keyword_extractor.extract_keywords(item))
+            if keywords or mode == "local":
+                return keywords
+
+        if item_text is None:
+            item_text = prose(item)
+        return flatten_keywords(self.resume_keyword_extraction_agent.extract_keywords(item_text))
+
+    def tailor_section_item(self, item: Any, job_keywords: list, constraints: Constraints, industry_context: dict,
+                            application_context: dict, keyword_space: Optional[JobKeywordSpace] = None,
+                            item_keywords: Optional[List[str]] = None,
+                            initial_ranking: Optional[List[Dict[str, Any]]] = None,
+                            section: Optional[str] = None, constraint_values: Optional[Dict[str, Any]] = None,
+                            item_text: Optional[str] = None) -> TailoredPoint:
+        if not isinstance(item, (dict, str)):
+            return TailoredPoint(item, True)
+
+        keyword_mapping = self.rank_section_item(item, job_keywords, keyword_space=keyword_space,
+                                                 item_keywords=item_keywords, initial_ranking=initial_ranking,
+                                                 item_text=item_text)
+        # Structured items go through as dicts so the tailored result can be validated back into the Resume
+        if constraint_values is None:
+            constraint_values = constraints.model_dump()
+        result = self.resume_point_tailoring_agent.tailor_point_result(item, keyword_mapping, constraint_values,
+                                                                       section)
+        return result._replace(value=self.constraint_inference_agent.enforce(section, result.value, constraints))
+
+    def rank_section_item(self, item: Any, job_keywords: list, keyword_space: Optional[JobKeywordSpace] = None,
+                          item_keywords: Optional[List[str]] = None,
+                          initial_ranking: Optional[List[Dict[str, Any]]] = None,
+                          item_text: Optional[str] = None) -> List[Dict[str, Any]]:
+        if item_keywords is None:
+            item_keywords = self.extract_item_keywords(item, item_text)
+        return self.keyword_similarity_agent.rank_keywords(item_keywords, job_keywords,
+                                                           keyword_space=keyword_space,
+                                                           initial_ranking=initial_ranking)
+
+    def _fan_out(self, tasks: List[Tuple[Any, Callable[[], Any]]]) -> Iterator[Tuple[Any, Any]]:
+        # Yields (key, result) pairs in completion order, running up to max_concurrency tasks at once
+        max_concurrency = self.config.get("max_concurrency", 1)
+        if max_concurrency <= 1 or len(tasks) <= 1:
+            for key, task in tasks:
+                yield key, task()
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(tasks)))
+        try:
+            # Each task runs in a copy of the caller's context so its spans nest under the current step
+            futures = {executor.submit(contextvars.copy_context().run, task): key for key, task in tasks}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # If the consumer stops early, drop queued tasks instead of waiting for them
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def run(self, resume: Resume, job_description: JobDescription) -> Resume:
         tailored_resume = self.tailor_resume(resume, job_description)
         return tailored_resume
+
+    def run_batch(self, resumes: List[Resume], job_descriptions: List[JobDescription],
+                  max_workers: Optional[int] = None) -> Iterator[BatchResult]:
+        max_workers = max_workers or self.config.get("batch_workers", 4)
+
+        # Identical resumes or postings share their preprocessing, however often they appear in the matrix
+        resume_keys = [_content_key(resume) for resume in resumes]
+        job_keys = [_content_key(job_description) for job_description in job_descriptions]
+        unique_resumes = {key: resume for key, resume in zip(resume_keys, resumes)}
+        unique_jobs = {key: job_description for key, job_description in zip(job_keys, job_descriptions)}
+
+        def as_batch(task, *args):
+            # Batch LLM requests queue behind interactive ones in the shared client pool
+            with llm_priority("batch"):
+                return task(*args)
+
+        # Pairs waiting on each preparation, so a finished one only looks at its own row or column
+        resume_pairs: Dict[str, List[Tuple[int, int]]] = {}
+        job_pairs: Dict[str, List[Tuple[int, int]]] = {}
+        for resume_index, resume_key in enumerate(resume_keys):
+            for job_index, job_key in enumerate(job_keys):
+                resume_pairs.setdefault(resume_key, []).append((resume_index, job_index))
+                job_pairs.setdefault(job_key, []).append((resume_index, job_index))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            resume_futures = {key: executor.submit(as_batch, self.prepare_resume, resume)
+                              for key, resume in unique_resumes.items()}
+            job_futures = {key: executor.submit(as_batch, self.prepare_job, job_description)
+                           for key, job_description in unique_jobs.items()}
+            preparations = {future: resume_pairs[key] for key, future in resume_futures.items()}
+            preparations.update({future: job_pairs[key] for key, future in job_futures.items()})
+            pair_futures = {}
+            started = set()
+            running = set(preparations)
+
+            # Each pair starts as soon as both of its preparations are done, and is streamed out as soon as it
+            # finishes rather than in matrix order
+            try:
+                while running:
+                    finished, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        if future in pair_futures:
+                            resume_index, job_index = pair_futures.pop(future)
+                            try:
+                                yield BatchResult(resume_index, job_index, future.result())
+                            except Exception as error:
+                                yield BatchResult(resume_index, job_index, None, error)
+                            continue
+
+                        for resume_index, job_index in preparations[future]:
+                            resume_future = resume_futures[resume_keys[resume_index]]
+                            job_future = job_futures[job_keys[job_index]]
+                            if (resume_index, job_index) in started or not resume_future.done() or \
+                                    not job_future.done():
+                                continue
+                            started.add((resume_index, job_index))
+                            # A failed preparation only fails the pairs that need it
+                            error = resume_future.exception() or job_future.exception()
+                            if error is not None:
+                                yield BatchResult(resume_index, job_index, None, error)
+                                continue
+                            pair = executor.submit(as_batch, self.tailor_resume, resumes[resume_index],
+                                                   job_descriptions[job_index], resume_future.result(),
+                                                   job_future.result())
+                            pair_futures[pair] = (resume_index, job_index)
+                            running.add(pair)
+            finally:
+                # A consumer that stops iterating early should not pay for the pairs it never reads
+                executor.shutdown(cancel_futures=True)
+
+    def score_resumes(self, resumes: List[Resume], job_keywords: list,
+                      processes: Optional[int] = None) -> List[Dict[str, float]]:
+        # ATS and readability gates for many candidate resumes against one job, vectorised and spread over
+        # worker processes; no LLM calls are made
+        processes = processes or self.config.get("scoring_processes")
+        fields = [resume.model_dump() for resume in resumes]
+        with span("step.batch_scoring"):
+            ats_scores = self.ats_score_estimation_agent.estimate_ats_scores_parallel(fields, job_keywords, processes)
+            readability_scores = self.human_readability_agent.check_readability_parallel(
+                [resume_text(resume) for resume in fields], processes)
+        return [{"ats_score": float(ats), "readability": float(readability)}
+                for ats, readability in zip(ats_scores, readability_scores)]
@@ -0,0 +1,76 @@
+# orchestrator/section_view.py
+
+import json
+from typing import Any, Dict, Iterator, List, Optional
+from ..models.resume import Resume
+from ..utils.prompt_budget import prose
+
+TAILORED_SECTIONS = ('summary', 'experiences', 'projects', 'skills')
+
+
+class SectionItem:
+    # One tailorable unit of a resume; its prompt serialisations are built at most once
+    __slots__ = ("section", "index", "content", "_text", "_json")
+
+    def __init__(self, section: str, index: Optional[int], content: Any):
+        self.section = section
+        self.index = index
+        self.content = content
+        self._text = None
+        self._json = None
+
+    @property
+    def text(self) -> str:
+        # The item's prose for free-text prompts; keys, brackets and quotes would only cost tokens
+        if self._text is None:
+            self._text = prose(self.content)
+        return self._text
+
+    @property
+    def json(self) -> str:
+        if self._json is None:
+            self._json = json.dumps(self.content, ensure_ascii=False)
+        return self._json
+
+
+class SectionView:
+    """Mutable working copy of a resume for the tailoring steps.
+
+    The resume is dumped to plain data once on the way in and validated back into a ``Resume`` once on the way
+    out; tailored items are written into place in between without re-validating or copying the rest.
+    """
+
+    __slots__ = ("fields", "items")
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+        self.items: List[SectionItem] = []
+        for section in TAILORED_SECTIONS:
+            if isinstance(fields[section], list):
+                self.items.extend(SectionItem(section, index, item) for index, item in enumerate(fields[section]))
+            else:
+                self.items.append(SectionItem(section, None, fields[section]))
+
+    @classmethod
+    def from_resume(cls, resume: Resume) -> "SectionView":
+        return cls(resume.model_dump())
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[SectionItem]:
+        return iter(self.items)
+
+    def place(self, item: SectionItem, content: Any):
+        if item.index is None:
+            self.fields[item.section] = content
+        else:
+            self.fields[item.section][item.index] = content
+
+    def to_resume(self) -> Resume:
+        return Resume.model_validate(self.fields)
+
+
+def resume_text(fields: Dict[str, Any]) -> str:
+    # The prose a reader sees, in one pass over the fields; keys, brackets and quotes stay out of it
+    return "\n".join(prose(fields.get(section)) for section in TAILORED_SECTIONS if fields.get(section))
@@ -0,0 +1,55 @@
+# tests/test_ats_score_estimation.py
+
+import numpy as np
+import pytest
+
+from ..agents.ats_score_estimation import ATSScoreEstimationAgent
+
+
+def coverage(text, keywords):
+    return float(ATSScoreEstimationAgent().score_components([{"summary": text}], keywords)["coverage"][0])
+
+
+def test_symbol_and_single_letter_skills_count_as_covered():
+    assert coverage("Expert in C++ and R and C#", ["C++", "R", "C#"]) == 1.0
+    assert coverage("Expert in C++", ["C++", "C"]) == 0.5
+
+
+def test_forms_must_appear_as_whole_phrases():
+    assert coverage("Built a machine. Always learning", ["machine learning"]) == 0.0
+    assert coverage("Applied machine learning to churn", ["machine learning"]) == 1.0
+
+
+def test_synonyms_cover_the_keyword():
+    assert coverage("Ran services on k8s", ["Kubernetes"]) == 1.0
+
+
+def test_coverage_is_weighted_by_importance():
+    keywords = {"Skills": [{"keyword": "Python", "importance": 9}, {"keyword": "Rust", "importance": 1}]}
+    assert coverage("Python developer", keywords) == pytest.approx(0.9)
+
+
+def test_scores_stay_in_range_and_rank_matching_resumes_higher():
+    agent = ATSScoreEstimationAgent()
+    keywords = ["Python", "SQL", "machine learning"]
+    matching = {"summary": "Python engineer applying machine learning with SQL", "skills": ["Python", "SQL"],
+                "experiences": [{"description": "Built machine learning pipelines in Python"}]}
+    unrelated = {"summary": "Pastry chef", "skills": ["Baking"]}
+    scores = agent.estimate_ats_scores([matching, unrelated], keywords)
+    assert np.all((scores >= 0) & (scores <= 100))
+    assert scores[0] > scores[1]
+    assert agent.estimate_ats_score(matching, keywords) == scores[0]
+
+
+def test_no_keywords_scores_sections_only():
+    components = ATSScoreEstimationAgent().score_components([{"summary": "Python"}], [])
+    assert components["coverage"][0] == components["similarity"][0] == components["density"][0] == 0.0
+    assert components["sections"][0] > 0
+
+
+def test_parallel_scores_match_serial():
+    agent = ATSScoreEstimationAgent()
+    resumes = [{"summary": f"Python and SQL, {i} years"} for i in range(10)]
+    serial = agent.estimate_ats_scores(resumes, ["Python", "SQL"])
+    assert np.array_equal(agent.estimate_ats_scores_parallel(resumes, ["Python", "SQL"], processes=2, chunk_size=4),
+                          serial)
@@ -0,0 +1,54 @@
+# tests/test_base_react_agent.py
+
+from types import SimpleNamespace
+
+import pytest
+
+from ..agents.job_description_keyword_extraction import JobDescriptionKeywordExtractionAgent
+from ..utils.llm_cache import LLMResponseCache, make_cache_key
+
+TASK = "Analyze this job description and extract the key skills, qualifications, and requirements: Python role"
+
+
+class ScriptedAgent(JobDescriptionKeywordExtractionAgent):
+    """Answers each chat with the next scripted response instead of calling an LLM."""
+
+    def __init__(self, *responses, response_cache=None):
+        super().__init__()
+        self.response_cache = response_cache
+        self.responses = list(responses)
+        self.calls = 0
+
+    def _chat(self, task):
+        self.calls += 1
+        return SimpleNamespace(response=self.responses.pop(0))
+
+
+def test_parsed_answers_are_cached():
+    cache = LLMResponseCache()
+    agent = ScriptedAgent("Technical Skills: Python (9)", response_cache=cache)
+    assert agent.extract_keywords("Python role") == {"Technical Skills": [{"keyword": "Python", "importance": 9}]}
+    assert agent.extract_keywords("Python role") == {"Technical Skills": [{"keyword": "Python", "importance": 9}]}
+    assert agent.calls == 1 and cache.stats()["hits"] == 1
+
+
+def test_unparsable_answers_are_not_cached():
+    cache = LLMResponseCache()
+    agent = ScriptedAgent("Technical Skills: Python, SQL", "Technical Skills: Python (9)\nSQL (7)",
+                          response_cache=cache)
+    with pytest.raises(ValueError):
+        agent.extract_keywords("Python role")
+    # The retry reaches the model instead of replaying the bad answer
+    assert agent.extract_keywords("Python role") == {"Technical Skills": [{"keyword": "Python", "importance": 9},
+                                                                          {"keyword": "SQL", "importance": 7}]}
+    assert agent.calls == 2
+
+
+def test_unparsable_cached_answers_are_dropped_and_asked_again():
+    cache = LLMResponseCache()
+    agent = ScriptedAgent("Technical Skills: Python (9)", response_cache=cache)
+    key = make_cache_key(agent.name, agent.model, agent.system_prompt, TASK)
+    cache.set(key, "Technical Skills: Python, SQL")
+    assert agent.extract_keywords("Python role") == {"Technical Skills": [{"keyword": "Python", "importance": 9}]}
+    assert agent.calls == 1
+    assert cache.get(key) == "Technical Skills: Python (9)"
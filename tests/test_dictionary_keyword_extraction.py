@@ -0,0 +1,95 @@
+# tests/test_dictionary_keyword_extraction.py
+
+import pytest
+
+from ..agents.dictionary_keyword_extraction import AhoCorasickAutomaton, DictionaryKeywordExtractor, tokenize
+
+
+def automaton(*phrases):
+    built = AhoCorasickAutomaton()
+    for phrase in phrases:
+        built.add(tokenize(phrase), phrase)
+    built.build()
+    return built
+
+
+def keywords(text, extractor=DictionaryKeywordExtractor()):
+    return {entry["keyword"] for group in extractor.extract_keywords(text).values() for entry in group}
+
+
+def test_tokenize_keeps_skill_punctuation():
+    assert tokenize("C++, C# and Node.js in CI/CD") == ["c++", "c#", "and", "node.js", "in", "ci/cd"]
+
+
+def test_find_all_reports_overlapping_matches():
+    matches = automaton("machine learning", "learning", "deep learning").find_all(tokenize("deep learning"))
+    assert sorted(matches) == [(0, 2, "deep learning"), (1, 2, "learning")]
+
+
+def test_find_all_follows_failure_links():
+    # "a b c" fails after "a b" and must still find "b c" starting inside it
+    matches = automaton("a b d", "b c").find_all(tokenize("a b c"))
+    assert matches == [(1, 3, "b c")]
+
+
+def test_find_longest_prefers_leftmost_longest():
+    matches = automaton("machine learning", "learning", "machine").find_longest(
+        tokenize("machine learning and learning"))
+    assert matches == [(0, 2, "machine learning"), (3, 4, "learning")]
+
+
+def test_rejected_match_does_not_hide_a_shorter_one():
+    built = automaton("machine learning", "learning")
+    matches = built.find_longest(tokenize("machine learning"), accept=lambda start, end, value: end - start == 1)
+    assert matches == [(1, 2, "learning")]
+
+
+def test_adding_after_build_rebuilds():
+    built = automaton("python")
+    built.add(tokenize("rust"), "rust")
+    assert built.find_all(tokenize("rust")) == [(0, 1, "rust")]
+
+
+def test_aliases_map_to_canonical_keywords():
+    assert keywords("Built services in golang and python3 with reactjs") == {"Go", "Python", "React"}
+
+
+def test_relevance_is_relative_to_the_most_frequent_term():
+    result = DictionaryKeywordExtractor().extract_keywords("Python, Python, Python and SQL")
+    languages = {entry["keyword"]: entry["relevance"] for entry in result["Programming Languages"]}
+    assert languages == {"Python": 100, "SQL": 33}
+
+
+def test_structured_input_is_searched_field_by_field():
+    assert keywords({"skills": ["Python"], "experiences": [{"description": "Tuned PostgreSQL"}]}) == \
+        {"Python", "PostgreSQL"}
+
+
+def test_ambiguous_terms_need_their_exact_spelling():
+    prose = ("Please go to the docs, take a rest, then spring into action on our R&D and go-to-market plan. "
+             "We raised a Series C round and keep containers LED lit.")
+    assert keywords(prose) == set()
+    assert keywords("Services in Go and C, analysis in R, REST APIs on Spring Boot and AWS Lambda") >= \
+        {"Go", "C", "R", "REST APIs", "Spring Boot", "Serverless"}
+
+
+def test_seasons_are_not_spring_boot():
+    assert keywords("Spring 2021 intern, then a spring release") == set()
+    assert keywords("Java services on Spring Boot") == {"Java", "Spring Boot"}
+
+
+@pytest.mark.parametrize("text", ["Go live in March", "Shipped it. Go to market next", "- Go build the thing",
+                                  "Done.\nGo live"])
+def test_go_opening_a_sentence_as_a_verb_is_not_the_language(text):
+    assert keywords(text) == set()
+
+
+@pytest.mark.parametrize("text", ["Go", "Go, Python and Rust", "Wrote services in Go daily", "Go. Python.",
+                                  {"skills": [{"name": "Go", "level": "expert"}]}])
+def test_go_as_a_skill_still_matches(text):
+    assert "Go" in keywords(text)
+
+
+def test_custom_dictionary_accepts_plain_lists():
+    extractor = DictionaryKeywordExtractor({"Tools": ["Terraform", "Ansible"]})
+    assert extractor.extract_keywords("Terraform modules") == {"Tools": [{"keyword": "Terraform", "relevance": 100}]}
@@ -0,0 +1,50 @@
+# tests/test_human_readability.py
+
+import numpy as np
+import pytest
+
+from ..agents.human_readability import HumanReadabilityAgent, text_statistics
+
+
+def syllables(text):
+    return int(text_statistics([text])["syllables"][0])
+
+
+@pytest.mark.parametrize("word", ["the", "he", "she", "we", "be", "code", "rhythm"])
+def test_short_words_keep_one_syllable(word):
+    assert syllables(word) == 1
+
+
+@pytest.mark.parametrize("word, count", [("manage", 2), ("scalable", 3), ("python", 2), ("engineer", 3)])
+def test_silent_e_is_dropped_except_in_le_endings(word, count):
+    assert syllables(word) == count
+
+
+def test_every_word_counts_at_least_one_syllable():
+    text = "The team shipped the code we wrote"
+    assert syllables(text) >= len(text.split())
+
+
+def test_line_breaks_end_sentences():
+    assert text_statistics(["Built APIs\nLed a team\nShipped features."])["sentences"][0] == 3
+
+
+def test_empty_text_scores_zero():
+    agent = HumanReadabilityAgent()
+    assert agent.check_readability("") == 0.0
+    assert agent.scores([""])["grade"][0] == 0.0
+
+
+def test_simpler_text_reads_easier():
+    agent = HumanReadabilityAgent()
+    simple = agent.check_readability("We built a tool. It was fast.")
+    dense = agent.check_readability("Architected comprehensive organisational infrastructure modernisation "
+                                    "initiatives leveraging heterogeneous distributed computational platforms.")
+    assert 0 <= dense < simple <= 100
+
+
+def test_parallel_scores_match_serial():
+    agent = HumanReadabilityAgent()
+    texts = [f"We shipped release {i}. It was stable." for i in range(20)]
+    assert np.array_equal(agent.check_readability_parallel(texts, processes=2, chunk_size=8),
+                          agent.check_readability_many(texts))
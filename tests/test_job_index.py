@@ -0,0 +1,114 @@
+# tests/test_job_index.py
+#
+# Run from the directory containing the package:
+#     python -m pytest <package>/tests
+
+import json
+
+import pytest
+
+from ..agents.job_index import JobIndex
+
+JOBS = {
+    "backend": ["Python", "Django", "PostgreSQL"],
+    "data": ["Python", "Spark", "SQL"],
+    "frontend": ["JavaScript", "React", "CSS"],
+}
+
+
+def build(compact_threshold=1024):
+    index = JobIndex(compact_threshold=compact_threshold)
+    for job_id, keywords in JOBS.items():
+        index.add({"title": job_id.title(), "company": "Acme"}, job_id=job_id, keywords=keywords)
+    return index
+
+
+def ranked(index, keywords):
+    return [match["job_id"] for match in index.query({}, keywords=keywords)]
+
+
+def test_query_ranks_by_shared_keywords():
+    index = build()
+    assert ranked(index, ["Python", "Django"]) == ["backend", "data"]
+    assert ranked(index, ["Rust"]) == []
+
+
+def test_synonyms_match_the_canonical_term():
+    index = JobIndex()
+    index.add({}, job_id="k8s", keywords=["Kubernetes"])
+    assert ranked(index, ["k8s"]) == ["k8s"]
+
+
+def test_pending_and_compacted_postings_score_the_same():
+    pending, compacted = build(), build()
+    compacted.compact()
+    for keywords in (["Python"], ["Python", "SQL"], ["React", "Django"]):
+        assert pending.query({}, keywords=keywords) == compacted.query({}, keywords=keywords)
+
+
+def test_remove_hides_posting_before_and_after_compaction():
+    index = build()
+    index.remove("backend")
+    assert "backend" not in index and len(index) == 2
+    assert ranked(index, ["Django"]) == []
+    index.compact()
+    assert index.job_ids == ["data", "frontend"]
+    assert ranked(index, ["Python"]) == ["data"]
+
+
+def test_re_adding_an_id_replaces_the_posting():
+    index = build()
+    index.add({}, job_id="backend", keywords=["Go"])
+    assert len(index) == 3
+    assert ranked(index, ["Django"]) == []
+    assert ranked(index, ["Go"]) == ["backend"]
+
+
+def test_compact_threshold_folds_pending_postings():
+    index = build(compact_threshold=2)
+    assert len(index._pending) == 1
+    assert ranked(index, ["Python"]) == ["backend", "data"]
+
+
+def test_generated_ids_are_not_reused_after_compaction():
+    index = JobIndex()
+    first = index.add({}, keywords=["Python"])
+    second = index.add({}, keywords=["SQL"])
+    index.remove(first)
+    index.compact()
+    third = index.add({}, keywords=["React"])
+    assert len({first, second, third}) == 3
+    assert second in index and third in index
+
+
+def test_generated_ids_skip_explicit_ones():
+    index = JobIndex()
+    index.add({}, job_id="0", keywords=["Python"])
+    assert index.add({}, keywords=["SQL"]) == "1"
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = build()
+    index.remove("frontend")
+    generated = index.add({"title": "Analyst"}, keywords=["SQL"])
+    index.save(str(tmp_path))
+
+    loaded = JobIndex.load(str(tmp_path))
+    assert loaded.job_ids == ["backend", "data", generated]
+    assert loaded.metadata[0] == {"title": "Backend", "company": "Acme"}
+    for keywords in (["Python"], ["SQL", "Spark"]):
+        assert loaded.query({}, keywords=keywords) == index.query({}, keywords=keywords)
+
+    # The id counter survives, and the loaded index keeps accepting postings
+    assert loaded.add({}, keywords=["Rust"]) not in index.job_ids
+    assert ranked(loaded, ["Rust"]) == [loaded.job_ids[-1]]
+
+
+def test_load_rejects_other_format_versions(tmp_path):
+    build().save(str(tmp_path))
+    meta_path = tmp_path / "index.json"
+    meta = json.loads(meta_path.read_text())
+    meta["version"] = -1
+    meta_path.write_text(json.dumps(meta))
+    with pytest.raises(ValueError):
+        JobIndex.load(str(tmp_path))
@@ -0,0 +1,116 @@
+# tests/test_llm_cache.py
+
+from ..utils import llm_cache
+from ..utils.llm_cache import LLMResponseCache, make_cache_key
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+def frozen_clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(llm_cache.time, "time", clock.time)
+    return clock
+
+
+def disk_rows(cache: LLMResponseCache) -> int:
+    return cache._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+def test_keys_depend_on_every_part():
+    key = make_cache_key("agent", "model", "system", "task")
+    assert key == make_cache_key("agent", "model", "system", "task")
+    assert len({key, make_cache_key("other", "model", "system", "task"),
+                make_cache_key("agent", "model", "system", "other task")}) == 3
+
+
+def test_memory_tier_is_lru():
+    cache = LLMResponseCache(max_memory_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1" and cache.get("c") == "3"
+    assert cache.stats() == {"hits": 3, "misses": 1, "memory_hits": 3, "disk_hits": 0, "memory_entries": 2}
+
+
+def test_disk_tier_survives_reopening(tmp_path):
+    path = str(tmp_path / "cache" / "responses.db")
+    cache = LLMResponseCache(path)
+    cache.set("a", "1")
+    cache.close()
+
+    reopened = LLMResponseCache(path)
+    assert reopened.get("a") == "1"
+    assert reopened.stats()["disk_hits"] == 1
+    # Promoted into memory on the first read
+    assert reopened.get("a") == "1"
+    assert reopened.stats()["memory_hits"] == 1
+
+
+def test_entries_expire_after_ttl(monkeypatch, tmp_path):
+    clock = frozen_clock(monkeypatch)
+    cache = LLMResponseCache(str(tmp_path / "responses.db"), ttl_seconds=60)
+    cache.set("a", "1")
+    clock.now += 30
+    assert cache.get("a") == "1"
+    clock.now += 31
+    assert cache.get("a") is None
+    # The expired row is dropped from disk as well, and the row count follows
+    assert disk_rows(cache) == 0 and cache._disk_entries == 0
+
+
+def test_expired_rows_are_swept_on_write(monkeypatch, tmp_path):
+    clock = frozen_clock(monkeypatch)
+    monkeypatch.setattr(LLMResponseCache, "EXPIRY_SWEEP_INTERVAL", 2)
+    cache = LLMResponseCache(str(tmp_path / "responses.db"), ttl_seconds=60)
+    cache.set("old", "1")
+    clock.now += 120
+    cache.set("new", "2")
+    assert disk_rows(cache) == cache._disk_entries == 1
+
+
+def test_disk_tier_evicts_least_recently_used(monkeypatch, tmp_path):
+    clock = frozen_clock(monkeypatch)
+    cache = LLMResponseCache(str(tmp_path / "responses.db"), max_memory_entries=0, max_disk_entries=2)
+    cache.set("a", "1")
+    clock.now += 1
+    cache.set("b", "2")
+    clock.now += 1
+    assert cache.get("a") == "1"
+    clock.now += 1
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1" and cache.get("c") == "3"
+    assert disk_rows(cache) == cache._disk_entries == 2
+
+
+def test_row_count_tracks_replacements_and_clear(tmp_path):
+    path = str(tmp_path / "responses.db")
+    cache = LLMResponseCache(path, max_disk_entries=3)
+    for key in "abcde":
+        cache.set(key, "1")
+    cache.set("e", "2")
+    assert disk_rows(cache) == cache._disk_entries == 3
+    cache.close()
+
+    reopened = LLMResponseCache(path, max_disk_entries=3)
+    assert reopened._disk_entries == 3
+    reopened.clear()
+    assert disk_rows(reopened) == reopened._disk_entries == 0
+    assert reopened.get("e") is None
+
+
+def test_delete_removes_both_tiers(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "responses.db"))
+    cache.set("a", "1")
+    cache.delete("a")
+    cache.delete("missing")
+    assert cache.get("a") is None
+    assert disk_rows(cache) == cache._disk_entries == 0
@@ -0,0 +1,179 @@
+# tests/test_llm_pool.py
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ..utils.instrumentation import RunReport, _current_report, activate
+from ..utils.llm_pool import LLMClientPool, RateLimiter, llm_priority, retry_after
+
+
+class Response:
+    def __init__(self, status_code: int, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class APIStatusError(Exception):
+    def __init__(self, status_code: int, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = Response(status_code, headers)
+
+
+class APIConnectionError(Exception):
+    pass
+
+
+class Flaky:
+    """Request that raises the given errors in turn, then succeeds."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def test_retry_after_reads_provider_headers():
+    assert retry_after(APIStatusError(429, {"retry-after-ms": "250"})) == (True, 0.25)
+    assert retry_after(APIStatusError(429, {"retry-after": "3"})) == (True, 3.0)
+    assert retry_after(APIStatusError(503)) == (True, None)
+    assert retry_after(APIConnectionError()) == (True, None)
+
+
+def test_retry_after_parses_http_dates():
+    retryable, wait = retry_after(APIStatusError(429, {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}))
+    assert retryable and wait == 0.0
+
+
+def test_client_errors_are_not_retried():
+    assert retry_after(APIStatusError(400)) == (False, None)
+    assert retry_after(ValueError("bad prompt")) == (False, None)
+
+
+def test_call_retries_rate_limits_and_pauses_the_limiter():
+    pool = LLMClientPool(max_retries=3)
+    request = Flaky(APIStatusError(429, {"retry-after-ms": "20"}), APIStatusError(500, {"retry-after": "0"}))
+    started = time.monotonic()
+    assert pool.call(request, prompt_tokens=10) == "ok"
+    assert request.calls == 3
+    assert time.monotonic() - started >= 0.02
+
+
+def test_call_raises_non_retryable_errors_at_once():
+    pool = LLMClientPool(max_retries=3)
+    request = Flaky(APIStatusError(401))
+    with pytest.raises(APIStatusError):
+        pool.call(request, prompt_tokens=10)
+    assert request.calls == 1
+
+
+def test_call_gives_up_after_max_retries():
+    pool = LLMClientPool(max_retries=2, initial_backoff=0.001)
+    request = Flaky(*[APIConnectionError() for _ in range(5)])
+    with pytest.raises(APIConnectionError):
+        pool.call(request, prompt_tokens=10)
+    assert request.calls == 3
+
+
+def test_limiter_waits_for_the_request_bucket():
+    limiter = RateLimiter(requests_per_minute=600)
+    limiter._requests = 0
+    started = time.monotonic()
+    limiter.acquire()
+    # One request refills every 0.1 s at 600 requests/min
+    assert time.monotonic() - started >= 0.09
+
+
+def test_settle_charges_actual_usage():
+    limiter = RateLimiter(tokens_per_minute=1000)
+    limiter.acquire(tokens=100)
+    limiter.settle(estimated_tokens=100, actual_tokens=300)
+    assert limiter._tokens == pytest.approx(700, abs=5)
+
+
+def test_interactive_requests_overtake_batch_requests():
+    limiter = RateLimiter(requests_per_minute=60_000)
+    limiter._requests = 0
+    served = []
+
+    def request(priority):
+        limiter.acquire(priority=priority)
+        served.append(priority)
+
+    # Both wait behind the empty bucket; the batch request queued first is still served second
+    limiter.pause(0.05)
+    batch = threading.Thread(target=request, args=("batch",))
+    batch.start()
+    time.sleep(0.01)
+    interactive = threading.Thread(target=request, args=("interactive",))
+    interactive.start()
+    batch.join()
+    interactive.join()
+    assert served == ["interactive", "batch"]
+
+
+def test_unknown_priority_is_rejected():
+    with pytest.raises(ValueError):
+        with llm_priority("urgent"):
+            pass
+
+
+class Message:
+    def __init__(self, content):
+        self.content = content
+
+
+class ChatResult:
+    def __init__(self, content, raw=None, delta=None):
+        self.message = Message(content)
+        self.raw = raw
+        self.delta = delta
+
+
+def metered(request, prompt_tokens=10, stream=False):
+    report = RunReport()
+    token = activate(report)
+    try:
+        response = LLMClientPool().call(request, prompt_tokens, stream=stream)
+        if stream:
+            response = list(response)
+    finally:
+        _current_report.reset(token)
+    return response, report.totals
+
+
+def test_calls_record_the_usage_the_provider_reports():
+    raw = {"usage": {"prompt_tokens": 1234, "completion_tokens": 56, "total_tokens": 1290}}
+    _, totals = metered(lambda: ChatResult("answer", raw=raw))
+    assert (totals["llm_calls"], totals["prompt_tokens"], totals["completion_tokens"]) == (1, 1234, 56)
+
+
+def test_usage_objects_are_read_like_dicts():
+    raw = SimpleNamespace(usage=SimpleNamespace(prompt_tokens=7, completion_tokens=3))
+    _, totals = metered(lambda: ChatResult("answer", raw=raw))
+    assert (totals["prompt_tokens"], totals["completion_tokens"]) == (7, 3)
+
+
+def test_calls_without_usage_fall_back_to_estimates():
+    _, totals = metered(lambda: ChatResult("one two three"), prompt_tokens=42)
+    assert totals["llm_calls"] == 1 and totals["prompt_tokens"] == 42 and totals["completion_tokens"] > 0
+
+
+def test_streams_are_recorded_once_read():
+    chunks = [ChatResult("Hel", delta="Hel"),
+              ChatResult("Hello", delta="lo", raw={"usage": {"prompt_tokens": 20, "completion_tokens": 2}})]
+    response, totals = metered(lambda: iter(chunks), stream=True)
+    assert [chunk.delta for chunk in response] == ["Hel", "lo"]
+    assert (totals["llm_calls"], totals["prompt_tokens"], totals["completion_tokens"]) == (1, 20, 2)
+
+
+def test_retried_requests_count_once():
+    _, totals = metered(Flaky(APIStatusError(429, {"retry-after": "0"})))
+    assert totals["llm_calls"] == 1 and totals["retries"] == 1
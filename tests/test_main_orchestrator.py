@@ -0,0 +1,131 @@
+# tests/test_main_orchestrator.py
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ..agents.resume_point_tailoring import ResumePointTailoringAgent
+from ..models.constraints import Constraints
+from ..models.job_description import JobDescription
+from ..models.resume import Resume
+from ..orchestrator.events import PipelineEvent
+from ..orchestrator.main_orchestrator import MainOrchestrator
+
+
+def test_cancelling_mid_step_waits_for_the_step_and_closes_the_stream():
+    orchestrator = MainOrchestrator({})
+    step_started, release, closed = threading.Event(), threading.Event(), threading.Event()
+
+    def stream(*args):
+        try:
+            yield PipelineEvent("job_keywords", {})
+            step_started.set()
+            release.wait(5)
+            yield PipelineEvent("industry_context", {})
+        finally:
+            closed.set()
+
+    orchestrator.tailor_resume_stream = stream
+
+    async def consume(events):
+        async for event in orchestrator.tailor_resume_astream(None, None):
+            events.append(event.kind)
+
+    async def run():
+        events = []
+        task = asyncio.create_task(consume(events))
+        await asyncio.to_thread(step_started.wait, 5)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        # Still waiting for the running step rather than closing the generator under it
+        assert not task.done() and not closed.is_set()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return events
+
+    assert asyncio.run(run()) == ["job_keywords"]
+    assert closed.is_set()
+
+
+def test_items_that_fell_back_are_not_stored():
+    class ScriptedTailoring(ResumePointTailoringAgent):
+        def __init__(self, *responses):
+            super().__init__()
+            self.responses = list(responses)
+
+        def _chat(self, task):
+            return SimpleNamespace(response=self.responses.pop(0))
+
+    tailoring = ScriptedTailoring("not json", '{"items": [{"id": 0, "tailored": "Python engineer"}]}')
+    orchestrator = MainOrchestrator({"result_store": True, "keyword_extraction": "local", "agents": {
+        "resume_point_tailoring_agent": tailoring,
+        "keyword_similarity_agent": SimpleNamespace(rank_keywords=lambda *args, **kwargs: []),
+        "constraint_inference_agent": SimpleNamespace(enforce=lambda section, item, constraints: item),
+    }})
+    resume = Resume(name="A", email="a@example.com", summary="Engineer", skills=[], experiences=[], projects=[],
+                    education=[])
+    limit = {"max_tokens": 100}
+    constraints = Constraints(about_me=limit, skills=limit, experiences={"single_line": limit, "double_line": limit},
+                              projects={"single_line": limit, "double_line": limit})
+
+    def summaries():
+        events = orchestrator.iter_tailored_sections(resume, ["Python"], constraints, {}, {})
+        return [event.data for event in events if event.kind == "item"]
+
+    # The unusable answer leaves the summary as it was and is not remembered, so the next run asks again
+    assert summaries() == ["Engineer"]
+    assert summaries() == ["Python engineer"]
+    assert summaries() == ["Python engineer"]
+    assert tailoring.responses == []
+
+
+def batch_orchestrator(prepare_job):
+    orchestrator = MainOrchestrator({})
+    orchestrator.prepare_resume = lambda resume: {"resume": resume.name}
+    orchestrator.prepare_job = prepare_job
+    orchestrator.tailor_resume = lambda resume, job, resume_context, job_context: (resume.name, job.title)
+    return orchestrator
+
+
+def resume(name):
+    return Resume(name=name, email="a@example.com", summary="Engineer", skills=[], experiences=[], projects=[],
+                  education=[])
+
+
+def job(title):
+    return JobDescription(title=title, company="Acme", description="", requirements=[], responsibilities=[])
+
+
+def test_a_failed_preparation_only_fails_its_pairs():
+    def prepare_job(job_description):
+        if job_description.title == "Broken":
+            raise RuntimeError("lookup failed")
+        return {"job": job_description.title}
+
+    orchestrator = batch_orchestrator(prepare_job)
+    results = {(result.resume_index, result.job_index): result
+               for result in orchestrator.run_batch([resume("A"), resume("B")], [job("Good"), job("Broken")])}
+    assert len(results) == 4
+    assert results[0, 0].tailored_resume == ("A", "Good") and results[1, 0].tailored_resume == ("B", "Good")
+    for pair in ((0, 1), (1, 1)):
+        assert results[pair].tailored_resume is None and isinstance(results[pair].error, RuntimeError)
+
+
+def test_pairs_start_without_waiting_for_unrelated_preparations():
+    release, slow_prepared = threading.Event(), threading.Event()
+
+    def prepare_job(job_description):
+        if job_description.title == "Slow":
+            release.wait(2)
+            slow_prepared.set()
+        return {"job": job_description.title}
+
+    results = batch_orchestrator(prepare_job).run_batch([resume("A")], [job("Fast"), job("Slow")])
+    # The fast job's pair comes out while the slow job is still being prepared
+    first = next(results)
+    assert first.tailored_resume == ("A", "Fast") and not slow_prepared.is_set()
+    release.set()
+    assert [result.tailored_resume for result in results] == [("A", "Slow")]
@@ -0,0 +1,121 @@
+# tests/test_resume_point_tailoring.py
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from ..agents.resume_point_tailoring import ResumePointTailoringAgent, extract_json
+from ..models.agent_outputs import TailoredPoint
+from ..utils.prompt_budget import logger as prompt_logger
+
+POINTS = ["Built APIs", {"title": "Engineer", "bullets": ["Shipped features"], "years": 2}, "Led a team"]
+MAPPINGS = [[{"keyword": "Python", "similarity": 0.9}], [], []]
+
+
+class ScriptedAgent(ResumePointTailoringAgent):
+    """Answers each request with the next scripted response instead of calling an LLM."""
+
+    def __init__(self, *responses, **kwargs):
+        super().__init__(**kwargs)
+        self.responses = list(responses)
+        self.tasks = []
+
+    def _chat(self, task):
+        self.tasks.append(task)
+        response = self.responses.pop(0)
+        if callable(response):
+            response = response(task)
+        return SimpleNamespace(response=response)
+
+
+def batch_answer(*items):
+    return json.dumps({"items": [{"id": item_id, "tailored": tailored} for item_id, tailored in items]})
+
+
+def item_ids(task):
+    return [int(found) for found in re.findall(r'^\s*\{"id": (\d+)', task, re.MULTILINE)]
+
+
+def test_extract_json_ignores_surrounding_prose():
+    assert extract_json('Sure:\n```json\n{"items": []}\n```') == {"items": []}
+    with pytest.raises(ValueError):
+        extract_json("no json here")
+
+
+def test_answers_map_back_by_id_in_any_order():
+    agent = ScriptedAgent()
+    answer = batch_answer((2, "Led a Python team"), (0, "Built Python APIs"))
+    assert agent.parse_result(answer, POINTS) == {0: "Built Python APIs", 2: "Led a Python team"}
+
+
+def test_unknown_ids_and_mismatched_types_are_dropped():
+    agent = ScriptedAgent()
+    answer = batch_answer((7, "out of range"), (-1, "negative"), ("0", "string id"), (0, {"not": "text"}),
+                          (2, "   "))
+    assert agent.parse_result(answer, POINTS) == {}
+
+
+def test_objects_keep_their_fields_and_types():
+    agent = ScriptedAgent()
+    answer = batch_answer((1, {"title": "Python Engineer", "bullets": ["Shipped Python features", 3],
+                               "years": "two", "extra": "dropped"}))
+    assert agent.parse_result(answer, POINTS) == {
+        1: {"title": "Python Engineer", "bullets": ["Shipped features"], "years": 2}}
+
+
+def test_schema_mismatch_raises():
+    agent = ScriptedAgent()
+    with pytest.raises(ValueError):
+        agent.parse_result('{"results": []}', POINTS)
+
+
+def test_items_missing_from_a_batch_are_retried_alone():
+    agent = ScriptedAgent(batch_answer((0, "Built Python APIs")),
+                          batch_answer((0, {"title": "Python Engineer"})),
+                          "not json")
+    tailored = agent.tailor_batch(POINTS, MAPPINGS, {})
+    assert tailored == [TailoredPoint("Built Python APIs", True),
+                        TailoredPoint({"title": "Python Engineer", "bullets": ["Shipped features"], "years": 2}, True),
+                        TailoredPoint("Led a team", False)]
+    assert [item_ids(task) for task in agent.tasks] == [[0, 1, 2], [0], [0]]
+
+
+def test_tailor_points_reassembles_batches_in_order():
+    # Each request answers every item it was sent, tagged with its position in that request
+    agent = ScriptedAgent(*[lambda task: batch_answer(*((i, f"item {i}") for i in item_ids(task)))] * 2,
+                          max_batch_items=2)
+    points = ["a", "b", "c"]
+    assert agent.plan_batches(points, [[]] * 3, {}) == [[0, 1], [2]]
+    assert agent.tailor_points(points, [[]] * 3, {}) == ["item 0", "item 1", "item 0"]
+
+
+def test_unusable_answers_are_reported_as_not_tailored():
+    agent = ScriptedAgent("not json", batch_answer((0, "Built Python APIs")))
+    assert agent.tailor_point_result("Built APIs", MAPPINGS[0], {}) == TailoredPoint("Built APIs", False)
+    assert agent.tailor_point_result("Built APIs", MAPPINGS[0], {}) == TailoredPoint("Built Python APIs", True)
+
+
+def test_item_lines_drop_zero_and_low_similarity_keywords():
+    agent = ScriptedAgent()
+    mapping = [{"keyword": "Python", "similarity": 0.9}, {"keyword": "Cobol", "similarity": 0.0},
+               {"keyword": "Fortran", "similarity": 0.01}, {"keyword": "python", "similarity": 0.5}]
+    line = json.loads(agent._item_line(0, "Built APIs", mapping, "summary"))
+    assert [entry["keyword"] for entry in line["keywords"]] == ["Python"]
+
+    agent.prompt_budget = None
+    line = json.loads(agent._item_line(0, "Built APIs", mapping, "summary"))
+    assert len(line["keywords"]) == 4
+
+
+def test_tailoring_requests_record_and_log_their_savings(caplog):
+    agent = ScriptedAgent(batch_answer((0, "Built Python APIs"), (1, "Led a Python team")))
+    mapping = [{"keyword": "Python", "similarity": 0.9}] + [{"keyword": f"noise {i}", "similarity": 0.0}
+                                                            for i in range(10)]
+    with caplog.at_level("DEBUG", logger=prompt_logger.name):
+        agent.tailor_batch(["Built APIs", "Led a team"], [mapping, mapping], {})
+    assert "noise" not in agent.tasks[0]
+    stats = agent.prompt_budget.stats()
+    assert stats["calls"] == 2 and stats["tokens_saved"] > 0
+    assert sum("prompt budget" in record.getMessage() for record in caplog.records) == 2
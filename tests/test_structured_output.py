@@ -0,0 +1,95 @@
+# tests/test_structured_output.py
+
+from ..agents.base_react_agent import BaseReActAgent
+from ..models.agent_outputs import KeywordRecord, RankingRecord
+from ..utils.llm_cache import LLMResponseCache
+from ..utils.structured_output import JsonLinesParser, correction_task
+
+GOOD = '{"category": "Languages", "keyword": "Python", "score": 90}'
+BAD = '{"category": "Languages", "keyword": "SQL", "score": 150}'
+
+
+class StreamingAgent(BaseReActAgent):
+    """Streams scripted answers in small chunks instead of calling an LLM."""
+
+    def __init__(self, *answers, chunk_size: int = 7, response_cache=None):
+        super().__init__("Streaming", "test", "system", response_cache)
+        self.answers = list(answers)
+        self.tasks = []
+        self.chunk_size = chunk_size
+
+    def _stream_chat(self, task):
+        self.tasks.append(task)
+        answer = self.answers.pop(0)
+        for start in range(0, len(answer), self.chunk_size):
+            yield answer[start:start + self.chunk_size]
+
+
+def test_records_are_parsed_as_lines_complete():
+    parser = JsonLinesParser(KeywordRecord)
+    assert list(parser.feed(GOOD[:20])) == []
+    records = list(parser.feed(GOOD[20:] + "\n" + BAD[:5]))
+    assert [record.keyword for record in records] == ["Python"]
+    assert list(parser.feed(BAD[5:])) == []
+    assert list(parser.close()) == []
+    assert [record.keyword for record in parser.records] == ["Python"]
+
+
+def test_invalid_lines_are_kept_with_their_errors():
+    parser = JsonLinesParser(KeywordRecord)
+    list(parser.feed(f"{BAD}\n{GOOD}\n"))
+    assert len(parser.records) == 1
+    [(line, error)] = parser.take_errors()
+    assert line == BAD and error.startswith("score:")
+    assert parser.errors == []
+
+
+def test_fences_prose_and_blank_lines_are_skipped():
+    parser = JsonLinesParser(KeywordRecord)
+    list(parser.feed(f"Here you go:\n```json\n\n{GOOD}\n```"))
+    list(parser.close())
+    assert len(parser.records) == 1 and parser.errors == []
+
+
+def test_last_line_without_newline_is_parsed_on_close():
+    parser = JsonLinesParser(RankingRecord)
+    list(parser.feed('{"keyword": "Python", "similarity": 0.5}'))
+    assert [record.similarity for record in parser.close()] == [0.5]
+
+
+def test_correction_task_sends_only_rejected_lines():
+    task = correction_task(KeywordRecord, [(BAD, "score: too large")])
+    assert BAD in task and GOOD not in task and "score: too large" in task
+
+
+def test_execute_structured_corrects_only_invalid_lines():
+    agent = StreamingAgent(f"{GOOD}\n{BAD}\n", '{"category": "Languages", "keyword": "SQL", "score": 100}')
+    streamed = []
+    records = agent.execute_structured("extract keywords", KeywordRecord, on_record=streamed.append)
+    assert [(record.keyword, record.score) for record in records] == [("Python", 90), ("SQL", 100)]
+    assert streamed == records
+    assert BAD in agent.tasks[1] and GOOD not in agent.tasks[1]
+
+
+def test_corrections_stop_after_max_corrections():
+    agent = StreamingAgent(BAD, BAD)
+    assert agent.execute_structured("extract keywords", KeywordRecord) == []
+    assert len(agent.tasks) == 2
+
+
+def test_cached_answers_are_replayed_without_streaming():
+    cache = LLMResponseCache()
+    StreamingAgent(GOOD, response_cache=cache).execute_structured("extract keywords", KeywordRecord)
+    replay = StreamingAgent(response_cache=cache)
+    assert [record.keyword for record in replay.execute_structured("extract keywords", KeywordRecord)] == ["Python"]
+    assert replay.tasks == []
+
+
+def test_answers_with_invalid_lines_are_not_cached():
+    cache = LLMResponseCache()
+    corrected = '{"category": "Languages", "keyword": "SQL", "score": 100}'
+    StreamingAgent(f"{GOOD}\n{BAD}", corrected, response_cache=cache).execute_structured("extract", KeywordRecord)
+    # The answer that needed correcting was not cached, so the same task reaches the model again
+    replay = StreamingAgent(f"{GOOD}\n{corrected}", response_cache=cache)
+    assert len(replay.execute_structured("extract", KeywordRecord)) == 2
+    assert len(replay.tasks) == 1
@@ -0,0 +1,15 @@
+# tests/test_token_counter.py
+
+from ..utils.token_counter import iter_pieces
+
+
+def test_pieces_rebuild_the_text():
+    text = "Led the team.\n- Built APIs,\n\n  shipped v2.\r\nDone  "
+    assert "".join(iter_pieces(text)) == text
+
+
+def test_punctuation_keeps_the_line_breaks_after_it():
+    # cl100k reads ".\n" and ",\n\n" as single pre-tokens, so they must not be split across pieces
+    assert list(iter_pieces("Led the team.\n- Built APIs,\n\nDone")) == \
+        ["Led", " the", " team.\n", "-", " Built", " APIs,\n\n", "Done"]
+    assert list(iter_pieces("word\nnext")) == ["word", "\nnext"]
@@ -0,0 +1,200 @@
+# utils/instrumentation.py
+
+import contextvars
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_current_report: contextvars.ContextVar = contextvars.ContextVar("tailor_current_report", default=None)
+_current_span: contextvars.ContextVar = contextvars.ContextVar("tailor_current_span", default=None)
+
+COUNTERS = ("llm_calls", "prompt_tokens", "completion_tokens", "cache_hits", "retries", "prompt_tokens_saved")
+
+
+@dataclass
+class SpanRecord:
+    name: str
+    labels: Dict[str, Any] = field(default_factory=dict)
+    started_at: float = 0.0
+    wall_time: float = 0.0
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    prompt_tokens_saved: int = 0
+    error: Optional[str] = None
+    parent: Optional["SpanRecord"] = field(default=None, repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        record = {item.name: getattr(self, item.name) for item in fields(self) if item.name != "parent"}
+        record["parent"] = self.parent.name if self.parent else None
+        return record
+
+
+class RunReport:
+    def __init__(self, run_id: Optional[str] = None, **labels):
+        self.run_id = run_id or uuid.uuid4().hex
+        self.labels = labels
+        self.started_at = time.time()
+        self.wall_time = 0.0
+        self.spans: List[SpanRecord] = []
+        self.totals = {counter: 0 for counter in COUNTERS}
+        self._lock = threading.Lock()
+
+    def open_span(self, name: str, **labels) -> Tuple[SpanRecord, contextvars.Token]:
+        span = SpanRecord(name=name, labels=labels, started_at=time.perf_counter(), parent=_current_span.get())
+        return span, _current_span.set(span)
+
+    def close_span(self, span: SpanRecord, token: contextvars.Token, error: Optional[BaseException] = None):
+        span.wall_time = time.perf_counter() - span.started_at
+        if error is not None:
+            span.error = repr(error)
+        _current_span.reset(token)
+        with self._lock:
+            self.spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, **labels) -> Iterator[SpanRecord]:
+        span, token = self.open_span(name, **labels)
+        try:
+            yield span
+        except BaseException as error:
+            self.close_span(span, token, error)
+            raise
+        self.close_span(span, token)
+
+    def add(self, **counts):
+        # Counts roll up through every open ancestor span, so a step's span includes its items' LLM calls
+        with self._lock:
+            for counter, value in counts.items():
+                self.totals[counter] += value
+            span = _current_span.get()
+            while span is not None:
+                for counter, value in counts.items():
+                    setattr(span, counter, getattr(span, counter) + value)
+                span = span.parent
+
+    def finish(self):
+        self.wall_time = time.time() - self.started_at
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        summary: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            entry = summary.setdefault(span.name, {"count": 0, "wall_time": 0.0, "max_wall_time": 0.0,
+                                                   **{counter: 0 for counter in COUNTERS}})
+            entry["count"] += 1
+            entry["wall_time"] += span.wall_time
+            entry["max_wall_time"] = max(entry["max_wall_time"], span.wall_time)
+            for counter in COUNTERS:
+                entry[counter] += getattr(span, counter)
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "labels": self.labels,
+            "started_at": self.started_at,
+            "wall_time": self.wall_time,
+            "totals": dict(self.totals),
+            "steps": self.summary(),
+        }
+
+
+def current_report() -> Optional[RunReport]:
+    return _current_report.get()
+
+
+def activate(report: Optional[RunReport]) -> contextvars.Token:
+    return _current_report.set(report)
+
+
+@contextmanager
+def span(name: str, **labels) -> Iterator[Optional[SpanRecord]]:
+    # A no-op outside an instrumented run, so agents can be used on their own without a report
+    report = _current_report.get()
+    if report is None:
+        yield None
+        return
+    with report.span(name, **labels) as record:
+        yield record
+
+
+def record_llm_call(prompt_tokens: int = 0, completion_tokens: int = 0, cache_hit: bool = False):
+    report = _current_report.get()
+    if report is not None:
+        report.add(llm_calls=0 if cache_hit else 1, prompt_tokens=prompt_tokens,
+                   completion_tokens=completion_tokens, cache_hits=1 if cache_hit else 0)
+
+
+def record_retry():
+    report = _current_report.get()
+    if report is not None:
+        report.add(retries=1)
+
+
+def record_prompt_savings(tokens: int):
+    report = _current_report.get()
+    if report is not None:
+        report.add(prompt_tokens_saved=tokens)
+
+
+class JsonLinesExporter:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, report: RunReport):
+        lines = [json.dumps({"type": "span", "run_id": report.run_id, **span.to_dict()}, default=str)
+                 for span in report.spans]
+        lines.append(json.dumps({"type": "run", **report.to_dict()}, default=str))
+        with self._lock, open(self.path, "a", encoding="utf-8") as output:
+            output.write("\n".join(lines) + "\n")
+
+
+class PrometheusTextExporter:
+    # Keeps cumulative per-span counters across runs and renders them in the Prometheus text format
+    def __init__(self, path: Optional[str] = None, prefix: str = "resume_tailor"):
+        self.path = path
+        self.prefix = prefix
+        self.runs = 0
+        self.spans: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def export(self, report: RunReport):
+        with self._lock:
+            self.runs += 1
+            for name, entry in report.summary().items():
+                totals = self.spans.setdefault(name, {key: 0 for key in entry if key != "max_wall_time"})
+                for key in totals:
+                    totals[key] += entry[key]
+            text = self.render()
+        if self.path:
+            with open(self.path, "w", encoding="utf-8") as output:
+                output.write(text)
+
+    def render(self) -> str:
+        metrics = [
+            ("span_count", "count", "counter", "Number of completed spans"),
+            ("span_seconds", "wall_time", "counter", "Total wall time spent in spans"),
+            ("llm_calls", "llm_calls", "counter", "LLM requests made (cache hits excluded)"),
+            ("prompt_tokens", "prompt_tokens", "counter", "Prompt tokens sent to the LLM"),
+            ("completion_tokens", "completion_tokens", "counter", "Completion tokens received from the LLM"),
+            ("cache_hits", "cache_hits", "counter", "LLM responses served from the cache"),
+            ("retries", "retries", "counter", "Retried LLM requests"),
+            ("prompt_tokens_saved", "prompt_tokens_saved", "counter", "Prompt tokens removed by prompt budgets"),
+        ]
+        lines = [f"# TYPE {self.prefix}_runs_total counter", f"{self.prefix}_runs_total {self.runs}"]
+        for metric, key, metric_type, description in metrics:
+            name = f"{self.prefix}_{metric}_total"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for span_name, totals in sorted(self.spans.items()):
+                lines.append(f'{name}{{span="{span_name}"}} {totals[key]}')
+        return "\n".join(lines) + "\n"
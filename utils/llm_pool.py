@@ -0,0 +1,263 @@
+# utils/llm_pool.py
+
+import contextvars
+import heapq
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from .instrumentation import record_llm_call, record_retry
+from .token_counter import default_token_counter
+
+# Lower values are served first; interactive requests overtake queued batch work
+PRIORITIES = {"interactive": 0, "batch": 1}
+
+_current_priority: contextvars.ContextVar = contextvars.ContextVar("tailor_llm_priority", default="interactive")
+
+
+@contextmanager
+def llm_priority(priority: str) -> Iterator[None]:
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority {priority!r}; expected one of {sorted(PRIORITIES)}")
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class RateLimiter:
+    """Token buckets for requests/min and tokens/min shared by every caller, served in priority order.
+
+    Each bucket holds up to one minute of its limit and refills continuously. A limit of ``None`` is
+    unlimited.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = requests_per_minute or 0.0
+        self._tokens = tokens_per_minute or 0.0
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._updated = now
+        if self.requests_per_minute:
+            self._requests = min(self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60)
+        if self.tokens_per_minute:
+            self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60)
+
+    def _wait_time(self, tokens: float, now: float) -> float:
+        wait = max(0.0, self._paused_until - now)
+        if self.requests_per_minute and self._requests < 1:
+            wait = max(wait, (1 - self._requests) * 60 / self.requests_per_minute)
+        if self.tokens_per_minute and self._tokens < tokens:
+            wait = max(wait, (tokens - self._tokens) * 60 / self.tokens_per_minute)
+        return wait
+
+    def acquire(self, tokens: int = 0, priority: str = "interactive") -> float:
+        # Blocks until this request is first in line and both buckets can cover it; returns the time waited
+        if self.tokens_per_minute:
+            # A request larger than the whole bucket would otherwise never be admitted
+            tokens = min(tokens, self.tokens_per_minute)
+        started = time.monotonic()
+        with self._condition:
+            ticket = (PRIORITIES[priority], next(self._sequence))
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    wait = self._wait_time(tokens, now) if self._waiting[0] == ticket else None
+                    if wait == 0:
+                        heapq.heappop(self._waiting)
+                        self._requests -= 1 if self.requests_per_minute else 0
+                        self._tokens -= tokens if self.tokens_per_minute else 0
+                        # Let the next in line re-check the buckets
+                        self._condition.notify_all()
+                        return now - started
+                    self._condition.wait(timeout=wait)
+            except BaseException:
+                if ticket in self._waiting:
+                    self._waiting.remove(ticket)
+                    heapq.heapify(self._waiting)
+                    self._condition.notify_all()
+                raise
+
+    def settle(self, estimated_tokens: int, actual_tokens: int):
+        # Charge (or refund) the difference once the provider reports real usage; the bucket may go into debt
+        if self.tokens_per_minute:
+            with self._condition:
+                self._tokens -= actual_tokens - estimated_tokens
+                self._condition.notify_all()
+
+    def pause(self, seconds: float):
+        # A 429 means the provider's own window is exhausted, so hold back every caller, not only the retrying one
+        with self._condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._condition.notify_all()
+
+
+def retry_after(error: BaseException) -> Tuple[bool, Optional[float]]:
+    # Returns (retryable, seconds the provider asked us to wait, if it said)
+    if type(error).__name__ in ("APIConnectionError", "APITimeoutError"):
+        return True, None
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    if status != 429 and not (isinstance(status, int) and status >= 500):
+        return False, None
+
+    headers = getattr(response, "headers", None) or {}
+    if headers.get("retry-after-ms"):
+        try:
+            return True, float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if value:
+        try:
+            return True, float(value)
+        except ValueError:
+            try:
+                return True, max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return True, None
+
+
+class LLMClientPool:
+    """One LLM client per model for the whole process, with every request going through a shared RateLimiter.
+
+    Clients share a keep-alive HTTP connection pool and have the SDK's own retries disabled: retries happen
+    here, honouring retry-after and pausing the limiter for everyone.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                 max_retries: int = 5, initial_backoff: float = 1.0, max_backoff: float = 60.0,
+                 expected_completion_tokens: int = 256, max_connections: int = 32, timeout: float = 60.0):
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.expected_completion_tokens = expected_completion_tokens
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._clients: Dict[Tuple[str, Any], "ScheduledLLM"] = {}
+        self._http_client = None
+        self._lock = threading.Lock()
+
+    def get_llm(self, model: str, factory: Optional[Callable[[str], Any]] = None) -> "ScheduledLLM":
+        # llama_index is only loaded once an agent actually needs a client, like the rest of agent setup
+        from .scheduled_llm import ScheduledLLM
+
+        key = (model, factory)
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = ScheduledLLM(factory(model) if factory else self._openai(model), self)
+            return self._clients[key]
+
+    def _openai(self, model: str):
+        from llama_index.llms.openai import OpenAI
+
+        if self._http_client is None:
+            import httpx
+            self._http_client = httpx.Client(
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections),
+                timeout=self.timeout)
+        return OpenAI(model=model, max_retries=0, timeout=self.timeout, http_client=self._http_client)
+
+    def call(self, request: Callable[[], Any], prompt_tokens: int, stream: bool = False) -> Any:
+        # Every request that reaches the provider is metered here, ReAct scaffolding included: from the usage
+        # the provider reports, or from local estimates when it reports none
+        estimated = prompt_tokens + self.expected_completion_tokens
+        priority = _current_priority.get()
+        for attempt in itertools.count():
+            self.limiter.acquire(estimated, priority)
+            try:
+                response = request()
+            except Exception as error:
+                retryable, wait = retry_after(error)
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                if wait is None:
+                    # Full jitter keeps callers that failed together from retrying together
+                    wait = random.uniform(0, min(self.max_backoff, self.initial_backoff * 2 ** attempt))
+                self.limiter.pause(wait)
+                record_retry()
+                continue
+            if stream:
+                # Usage arrives with the last chunk, so a stream is metered once it has been read
+                return self._metered(response, prompt_tokens, estimated)
+            self._record(response, prompt_tokens, estimated, _response_text(response))
+            return response
+
+    def _metered(self, stream: Iterator[Any], prompt_tokens: int, estimated: int) -> Iterator[Any]:
+        last, deltas = None, []
+        try:
+            for chunk in stream:
+                last = chunk
+                deltas.append(getattr(chunk, "delta", None) or "")
+                yield chunk
+        finally:
+            self._record(last, prompt_tokens, estimated, "".join(deltas))
+
+    def _record(self, response: Any, prompt_tokens: int, estimated: int, text: str):
+        usage = self._usage(response) or (prompt_tokens, default_token_counter().count(text))
+        self.limiter.settle(estimated, sum(usage))
+        record_llm_call(prompt_tokens=usage[0], completion_tokens=usage[1])
+
+    @staticmethod
+    def _usage(response: Any) -> Optional[Tuple[int, int]]:
+        # (prompt tokens, completion tokens) as the provider reported them, if it did
+        raw = getattr(response, "raw", None)
+        usage = raw.get("usage") if isinstance(raw, dict) else getattr(raw, "usage", None)
+        if isinstance(usage, dict):
+            prompt, completion = usage.get("prompt_tokens"), usage.get("completion_tokens")
+        else:
+            prompt, completion = getattr(usage, "prompt_tokens", None), getattr(usage, "completion_tokens", None)
+        if prompt is None and completion is None:
+            return None
+        return prompt or 0, completion or 0
+
+    def close(self):
+        with self._lock:
+            self._clients.clear()
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+
+
+def _response_text(response: Any) -> str:
+    # ChatResponse carries a message, CompletionResponse text
+    message = getattr(response, "message", None)
+    return (getattr(message, "content", None) if message is not None else getattr(response, "text", None)) or ""
+
+
+_default_pool: Optional[LLMClientPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> LLMClientPool:
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = LLMClientPool()
+        return _default_pool
+
+
+def configure_client_pool(**settings) -> LLMClientPool:
+    # Replaces the process-wide pool; agents built afterwards pick up the new limits
+    global _default_pool
+    with _default_pool_lock:
+        _default_pool = LLMClientPool(**settings)
+        return _default_pool
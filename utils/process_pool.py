@@ -0,0 +1,19 @@
+# utils/process_pool.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional
+import numpy as np
+
+
+def map_chunks(function: Callable[[List[Any]], np.ndarray], items: List[Any], processes: Optional[int] = None,
+               chunk_size: int = 256) -> np.ndarray:
+    # Scores chunks of items in worker processes and concatenates the results in order. function must pickle
+    # (a module-level function, or a bound method or partial of a picklable object). A single process or an
+    # input of one chunk runs inline, since starting workers would cost more than the work
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(items) <= chunk_size:
+        return function(items)
+    chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+    with ProcessPoolExecutor(max_workers=min(processes, len(chunks))) as executor:
+        return np.concatenate(list(executor.map(function, chunks)))
@@ -0,0 +1,172 @@
+# utils/prompt_budget.py
+
+import logging
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .instrumentation import record_prompt_savings
+from .token_counter import TokenCounter, default_token_counter
+
+# Scores agents attach to keywords, on their own scales: similarity 0-1, relevance 0-100, importance 1-10
+SCORE_KEYS = ("similarity", "relevance", "importance")
+DEFAULT_MIN_SCORES = {"similarity": 0.05, "relevance": 10, "importance": 0}
+
+logger = logging.getLogger(__name__)
+
+_SPAN_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def prose(value: Any) -> str:
+    # One line per field; keys, brackets, quotes and URLs stay out of it
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return "\n".join(prose(part) for key, part in value.items() if key != "url" and part)
+    if isinstance(value, Iterable):
+        return "\n".join(prose(part) for part in value if part)
+    return str(value)
+
+
+def _term(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+class PromptBudget:
+    """Token budget for the variable parts of one agent prompt (keyword lists, resume and job text).
+
+    Each agent call opens a ``PromptCall`` against it; ``stats`` totals what the calls would have sent and what
+    they sent after pruning.
+    """
+
+    def __init__(self, max_tokens: int = 1500, min_scores: Optional[Dict[str, float]] = None,
+                 counter: Optional[TokenCounter] = None):
+        self.max_tokens = max_tokens
+        self.min_scores = {**DEFAULT_MIN_SCORES, **(min_scores or {})}
+        self.counter = counter or default_token_counter()
+        self.totals = {"calls": 0, "tokens_before": 0, "tokens_after": 0}
+        self._lock = threading.Lock()
+
+    def record(self, tokens_before: int, tokens_after: int):
+        with self._lock:
+            self.totals["calls"] += 1
+            self.totals["tokens_before"] += tokens_before
+            self.totals["tokens_after"] += tokens_after
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.totals, "tokens_saved": self.totals["tokens_before"] - self.totals["tokens_after"]}
+
+
+class PromptCall:
+    """Prunes the parts of one prompt against a shared ``PromptBudget``; used as a context manager, it records
+    the tokens saved when the prompt is done. Without a budget every part passes through unchanged."""
+
+    def __init__(self, budget: Optional[PromptBudget]):
+        self.budget = budget
+        self.remaining = budget.max_tokens if budget is not None else 0
+        self.tokens_before = 0
+        self.tokens_after = 0
+
+    def __enter__(self) -> "PromptCall":
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.budget is not None and exc_info[0] is None:
+            self.budget.record(self.tokens_before, self.tokens_after)
+            record_prompt_savings(self.tokens_before - self.tokens_after)
+            logger.debug("prompt budget: %d -> %d tokens (%d saved)", self.tokens_before, self.tokens_after,
+                         self.tokens_before - self.tokens_after)
+
+    def keywords(self, keywords: Union[List[Any], Dict[str, List[Dict[str, Any]]]],
+                 max_tokens: Optional[int] = None,
+                 scores: Optional[List[float]] = None) -> Union[List[Any], Dict[str, List[Dict[str, Any]]]]:
+        # Accepts plain keyword lists, scored entries or {category: [entries]}, and returns the same shape:
+        # duplicates and zero or low scores dropped, then the highest scores kept up to the budget. Explicit
+        # scores (one per entry of a list) replace the entries' own and only drop zeros.
+        if self.budget is None:
+            return keywords
+        if isinstance(keywords, dict):
+            entries = [(category, entry) for category, group in keywords.items() for entry in group]
+        else:
+            entries = [(None, entry) for entry in keywords]
+
+        best: Dict[str, tuple] = {}
+        for position, (category, entry) in enumerate(entries):
+            keyword, score, score_key = self._score(entry)
+            if scores is not None:
+                score, score_key = float(scores[position]), None
+                if score <= 0:
+                    continue
+            if score_key is not None and (score <= 0 or score < self.budget.min_scores.get(score_key, 0)):
+                continue
+            term = _term(keyword)
+            if term not in best or score > best[term][0]:
+                best[term] = (score, position, category, entry)
+
+        budget = self.budget.counter.budget(min(max_tokens or self.remaining, self.remaining))
+        kept = [candidate for candidate in sorted(best.values(), key=lambda candidate: (-candidate[0], candidate[1]))
+                if budget.try_add(f"{candidate[3]!r}, ")]
+        kept.sort(key=lambda candidate: candidate[1])
+
+        if isinstance(keywords, dict):
+            pruned: Dict[str, List[Dict[str, Any]]] = {}
+            for _, _, category, entry in kept:
+                pruned.setdefault(category, []).append(entry)
+        else:
+            pruned = [entry for _, _, _, entry in kept]
+        self._account(keywords, pruned)
+        return pruned
+
+    def text(self, text: Any, relevant_terms: Iterable[str] = (), max_tokens: Optional[int] = None) -> Any:
+        # Structured values are sent as their prose. Repeated spans are dropped; with relevant terms only spans
+        # mentioning one are kept, most matches first
+        if self.budget is None:
+            return text
+        spans, seen = [], set()
+        for span in _SPAN_BOUNDARY.split(prose(text)):
+            key = _term(span)
+            if key and key not in seen:
+                seen.add(key)
+                spans.append(span.strip())
+
+        terms = sorted({_term(term) for term in relevant_terms if _term(term)}, key=len, reverse=True)
+        if terms:
+            pattern = re.compile(r"(?<!\w)(?:" + "|".join(re.escape(term) for term in terms) + r")(?!\w)",
+                                 re.IGNORECASE)
+            hits = [len({_term(match) for match in pattern.findall(span)}) for span in spans]
+            # Nothing matching means the terms say nothing about this text, so fall back to all of it
+            if any(hits):
+                spans = [(span, count) for span, count in zip(spans, hits) if count]
+            else:
+                spans = [(span, 0) for span in spans]
+        else:
+            spans = [(span, 0) for span in spans]
+
+        limit = min(max_tokens or self.remaining, self.remaining)
+        budget = self.budget.counter.budget(limit)
+        order = sorted(range(len(spans)), key=lambda index: -spans[index][1])
+        chosen = sorted(index for index in order if budget.try_add(spans[index][0] + "\n"))
+        compressed = "\n".join(spans[index][0] for index in chosen)
+        if not compressed and spans:
+            # A single span longer than the whole budget is cut rather than dropped
+            compressed = self.budget.counter.truncate(spans[order[0]][0], limit)
+        self._account(text, compressed)
+        return compressed
+
+    @staticmethod
+    def _score(entry: Any) -> tuple:
+        if not isinstance(entry, dict):
+            return str(entry), 0.0, None
+        for score_key in SCORE_KEYS:
+            if entry.get(score_key) is not None:
+                return str(entry.get("keyword", "")), float(entry[score_key]), score_key
+        return str(entry.get("keyword", "")), 0.0, None
+
+    def _account(self, original: Any, pruned: Any):
+        # Counted as the f-string prompts render them
+        counter = self.budget.counter
+        after = counter.count(str(pruned))
+        self.tokens_before += counter.count(str(original))
+        self.tokens_after += after
+        self.remaining = max(0, self.remaining - after)
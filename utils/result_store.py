@@ -0,0 +1,55 @@
+# utils/result_store.py
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Optional
+
+from .llm_cache import LLMResponseCache
+
+# Bump when tailoring output changes shape so stale stored items are not reused
+FINGERPRINT_VERSION = 3
+
+# The constraint each section's items are tailored to. Budgets are measured over the whole resume, so hashing
+# all of them would let a summary edit invalidate every stored bullet
+SECTION_CONSTRAINTS = {"summary": "about_me", "skills": "skills", "experiences": "experiences",
+                       "projects": "projects"}
+
+
+def item_fingerprint(section: str, item: Any, job_keywords: Iterable[str], constraints: Dict[str, Any],
+                     salt: str = "") -> str:
+    # Job keywords are a set: extraction order and relevance scores vary between runs without changing the
+    # terms an item is ranked against
+    payload = json.dumps([FINGERPRINT_VERSION, salt, section, item,
+                          sorted({" ".join(keyword.lower().split()) for keyword in job_keywords}),
+                          constraints.get(SECTION_CONSTRAINTS.get(section, section))],
+                         sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TailoredItemStore:
+    """Tailored resume items keyed by ``item_fingerprint``, kept in memory and optionally in SQLite.
+
+    Storage, eviction and expiry are those of ``LLMResponseCache``; items are stored as JSON.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[float] = None,
+                 max_memory_entries: int = 4096, max_disk_entries: int = 100_000):
+        self._cache = LLMResponseCache(path=path, ttl_seconds=ttl_seconds, max_memory_entries=max_memory_entries,
+                                       max_disk_entries=max_disk_entries)
+
+    def get(self, fingerprint: str) -> Optional[Any]:
+        stored = self._cache.get(fingerprint)
+        return json.loads(stored) if stored is not None else None
+
+    def set(self, fingerprint: str, tailored_item: Any):
+        self._cache.set(fingerprint, json.dumps(tailored_item, ensure_ascii=False))
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        stats = self._cache.stats()
+        return {"reused": stats["hits"], "recomputed": stats["misses"], "memory_entries": stats["memory_entries"]}
+
+    def close(self):
+        self._cache.close()
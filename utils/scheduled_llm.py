@@ -0,0 +1,54 @@
+# utils/scheduled_llm.py
+
+import itertools
+from typing import Any, Iterator, Sequence
+
+from llama_index.core.base.llms.types import ChatMessage, LLMMetadata
+from llama_index.core.llms import CustomLLM
+from pydantic import PrivateAttr
+
+from .llm_pool import LLMClientPool
+from .token_counter import default_token_counter
+
+
+class ScheduledLLM(CustomLLM):
+    """Wraps an LLM so every request is admitted by its pool's limiter and retried by the pool."""
+
+    _llm: Any = PrivateAttr()
+    _pool: LLMClientPool = PrivateAttr()
+
+    def __init__(self, llm: Any, pool: LLMClientPool, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._llm = llm
+        self._pool = pool
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return self._llm.metadata
+
+    @staticmethod
+    def _prompt_tokens(messages: Sequence[ChatMessage]) -> int:
+        counter = default_token_counter()
+        return sum(counter.count(message.content or "") for message in messages)
+
+    def chat(self, messages: Sequence[ChatMessage], **kwargs: Any):
+        return self._pool.call(lambda: self._llm.chat(messages, **kwargs), self._prompt_tokens(messages))
+
+    def stream_chat(self, messages: Sequence[ChatMessage], **kwargs: Any):
+        return self._pool.call(lambda: _opened(self._llm.stream_chat(messages, **kwargs)),
+                               self._prompt_tokens(messages), stream=True)
+
+    def complete(self, prompt: str, formatted: bool = False, **kwargs: Any):
+        return self._pool.call(lambda: self._llm.complete(prompt, formatted=formatted, **kwargs),
+                               default_token_counter().count(prompt))
+
+    def stream_complete(self, prompt: str, formatted: bool = False, **kwargs: Any):
+        return self._pool.call(lambda: _opened(self._llm.stream_complete(prompt, formatted=formatted, **kwargs)),
+                               default_token_counter().count(prompt), stream=True)
+
+
+def _opened(stream: Iterator[Any]) -> Iterator[Any]:
+    # Streams are lazy; pull the first chunk inside the pool call so a refused request is retried there.
+    # A failure after that surfaces to the caller.
+    first = next(stream, None)
+    return stream if first is None else itertools.chain([first], stream)
@@ -0,0 +1,69 @@
+# utils/structured_output.py
+
+import json
+from typing import Generic, Iterable, Iterator, List, Tuple, Type, TypeVar
+from pydantic import BaseModel, ValidationError
+
+Record = TypeVar("Record", bound=BaseModel)
+
+
+def structured_instructions(record_model: Type[BaseModel]) -> str:
+    return (
+        "Respond with one JSON object per line and nothing else, no prose or code fences. "
+        "Ignore any other output format described above. Each line must match this JSON schema:\n"
+        f"{json.dumps(record_model.model_json_schema())}"
+    )
+
+
+def correction_task(record_model: Type[BaseModel], invalid: Iterable[Tuple[str, str]]) -> str:
+    # Only the rejected lines are sent back, not the original task
+    fragments = "\n".join(f"Line: {line}\nError: {error}" for line, error in invalid)
+    return (
+        "These lines of a previous answer do not match the required JSON schema:\n\n"
+        f"{fragments}\n\n"
+        "Return a corrected version of each line, in the same order. Drop a line only if it cannot be fixed.\n"
+        f"{structured_instructions(record_model)}"
+    )
+
+
+class JsonLinesParser(Generic[Record]):
+    """Validates a JSON-lines answer chunk by chunk: each line is checked against the record model as soon as
+    its newline arrives, so nothing is re-scanned and one bad line does not spoil the rest."""
+
+    def __init__(self, record_model: Type[Record]):
+        self.record_model = record_model
+        self.records: List[Record] = []
+        self.errors: List[Tuple[str, str]] = []
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> Iterator[Record]:
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            record = self._parse_line(line)
+            if record is not None:
+                yield record
+
+    def close(self) -> Iterator[Record]:
+        line, self._buffer = self._buffer, ""
+        record = self._parse_line(line)
+        if record is not None:
+            yield record
+
+    def take_errors(self) -> List[Tuple[str, str]]:
+        errors, self.errors = self.errors, []
+        return errors
+
+    def _parse_line(self, line: str):
+        line = line.strip()
+        # Blank lines, code fences and stray prose around the records are not part of the answer
+        if not line.startswith("{"):
+            return None
+        try:
+            record = self.record_model.model_validate_json(line)
+        except ValidationError as error:
+            self.errors.append((line, "; ".join(f"{'.'.join(map(str, detail['loc'])) or 'line'}: {detail['msg']}"
+                                                for detail in error.errors())))
+            return None
+        self.records.append(record)
+        return record
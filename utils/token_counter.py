@@ -0,0 +1,99 @@
+# utils/token_counter.py
+
+import math
+import re
+from functools import lru_cache
+from typing import Iterator, Optional
+
+# Whitespace-led chunks ("   word,"). cl100k pre-tokenizes punctuation together with the line breaks after it
+# (".\n"), so a chunk ending in punctuation keeps them; no other pre-token spans the boundary in front of a chunk,
+# so per-chunk counts add up to the count of the whole text.
+_PIECE_PATTERN = re.compile(r"\s*\S+(?:(?<=[\W_])[\r\n]+)?|\s+$")
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str):
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # The BPE ranks are fetched on first use; offline hosts fall back to the length estimate
+        return None
+
+
+def iter_pieces(text: str) -> Iterator[str]:
+    return (match.group(0) for match in _PIECE_PATTERN.finditer(text))
+
+
+class TokenCounter:
+    def __init__(self, model: str = "gpt-3.5-turbo", cache_size: int = 1 << 16):
+        self.model = model
+        self.encoding = get_encoding(model)
+        # Resumes repeat the same words constantly, so memoised chunk counts make most lookups a dict hit
+        self._piece_tokens = lru_cache(maxsize=cache_size)(self._encode_piece)
+
+    def _encode_piece(self, piece: str) -> int:
+        if self.encoding is None:
+            # Without tiktoken fall back to the usual ~4 characters per token estimate
+            return max(1, math.ceil(len(piece.strip()) / 4)) if piece.strip() else 0
+        return len(self.encoding.encode(piece, disallowed_special=()))
+
+    def count(self, text: str) -> int:
+        return sum(self._piece_tokens(piece) for piece in iter_pieces(text))
+
+    def fits(self, text: str, max_tokens: int) -> bool:
+        used = 0
+        for piece in iter_pieces(text):
+            used += self._piece_tokens(piece)
+            if used > max_tokens:
+                return False
+        return True
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        used = 0
+        end = 0
+        for match in _PIECE_PATTERN.finditer(text):
+            used += self._piece_tokens(match.group(0))
+            if used > max_tokens:
+                # Cut on a word boundary and drop dangling separators
+                return text[:end].rstrip(" ,;:-")
+            end = match.end()
+        return text
+
+    def budget(self, max_tokens: int) -> "TokenBudget":
+        return TokenBudget(self, max_tokens)
+
+
+class TokenBudget:
+    def __init__(self, counter: TokenCounter, max_tokens: int):
+        self.counter = counter
+        self.max_tokens = max_tokens
+        self.used = 0
+
+    @property
+    def remaining(self) -> int:
+        return self.max_tokens - self.used
+
+    def try_add(self, text: str) -> bool:
+        # Incremental: only the new text is counted, against the running total
+        tokens = self.counter.count(text)
+        if self.used + tokens > self.max_tokens:
+            return False
+        self.used += tokens
+        return True
+
+
+_default_counter: Optional[TokenCounter] = None
+
+
+def default_token_counter() -> TokenCounter:
+    global _default_counter
+    if _default_counter is None:
+        _default_counter = TokenCounter()
+    return _default_counter